@@ -3,11 +3,17 @@
 from pathlib import Path
 from typing import Any
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import declare_catalog, get_catalog
 
 ABILITIES_FILE = Path("database/core/abilities.yaml")
 SKILLS_FILE = Path("database/core/skills.yaml")
 
+# Черты компилируются с фильтром по id характеристик
+declare_catalog(
+    "abilities", ABILITIES_FILE, "abilities", dependents=("feats",)
+)
+declare_catalog("skills", SKILLS_FILE, "skills")
+
 _FALLBACK_ABILITY_IDS: tuple[str, ...] = (
     "strength",
     "dexterity",
@@ -41,12 +47,12 @@ _FALLBACK_SKILL_IDS: tuple[str, ...] = (
 
 def _load_abilities_yaml() -> dict[str, Any]:
     """Загрузить abilities из YAML."""
-    return load_catalog(ABILITIES_FILE, "abilities")
+    return get_catalog("abilities")
 
 
 def _load_skills_yaml() -> dict[str, Any]:
     """Загрузить skills из YAML."""
-    return load_catalog(SKILLS_FILE, "skills")
+    return get_catalog("skills")
 
 
 def ability_ids() -> tuple[str, ...]:
@@ -1,5 +1,8 @@
 """Увеличение характеристик (ASI) при повышении уровня."""
 
+from functools import partial
+
+from core.catalog_loader import catalog_projection
 from core.classes import get_class_dict, iter_class_grants
 from core.dice import ability_modifier
 from core.models import Character
@@ -19,17 +22,28 @@ def feat_id_from_asi_choice(asi_value: str) -> str | None:
     return feat_id
 
 
-def class_grants_asi_at_level(class_id: str, level: int) -> bool:
-    """Есть ли у класса умение ASI на указанном уровне."""
+def _asi_levels(class_id: str) -> frozenset[int]:
+    """Уровни умения ASI из progression класса."""
     class_info = get_class_dict(class_id)
     if not class_info:
-        return False
-    for feat in iter_class_grants(class_info):
-        if feat.get("id") != ASI_FEATURE_ID:
-            continue
-        if feat.get("level") == level:
-            return True
-    return False
+        return frozenset()
+    return frozenset(
+        feat["level"]
+        for feat in iter_class_grants(class_info)
+        if feat.get("id") == ASI_FEATURE_ID
+    )
+
+
+def class_asi_levels(class_id: str) -> frozenset[int]:
+    """Уровни ASI класса (кэш до сброса каталога ``classes``)."""
+    return catalog_projection(
+        ("classes",), ("asi_levels", class_id), partial(_asi_levels, class_id)
+    )
+
+
+def class_grants_asi_at_level(class_id: str, level: int) -> bool:
+    """Есть ли у класса умение ASI на указанном уровне."""
+    return level in class_asi_levels(class_id)
 
 
 def pending_asi_at_level(character: Character, new_level: int) -> bool:
@@ -1,18 +1,27 @@
 """Загрузка предысторий из YAML."""
 
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import (
+    catalog_projection,
+    declare_catalog,
+    get_catalog,
+)
 from core.grants import grants_from_entity, grants_of_type
 from core.localization import resolve_localized_text
 
 BACKGROUNDS_FILE = Path("database/backgrounds/backgrounds.yaml")
 
+declare_catalog("backgrounds", BACKGROUNDS_FILE, "backgrounds")
+
 
 def _load_backgrounds_yaml() -> dict[str, Any]:
     """Загрузить данные предысторий."""
-    return load_catalog(BACKGROUNDS_FILE, "backgrounds")
+    return get_catalog("backgrounds")
 
 
 def _background_info(background_id: str) -> dict[str, Any]:
@@ -49,13 +58,24 @@ def _normalize_background(
     return result
 
 
-def load_backgrounds(language: str = "ru") -> list[dict[str, Any]]:
-    """Список предысторий для UI."""
-    result: list[dict[str, Any]] = []
-    for bg_id, info in _load_backgrounds_yaml().items():
-        if isinstance(info, dict):
-            result.append(_normalize_background(bg_id, info, language))
-    return result
+def _background_rows(language: str) -> tuple[Mapping[str, Any], ...]:
+    """Локализованные предыстории (read-only)."""
+    return tuple(
+        MappingProxyType(_normalize_background(bg_id, info, language))
+        for bg_id, info in _load_backgrounds_yaml().items()
+        if isinstance(info, dict)
+    )
+
+
+def load_backgrounds(language: str = "ru") -> list[Mapping[str, Any]]:
+    """Список предысторий для UI (кэш по языку)."""
+    return list(
+        catalog_projection(
+            ("backgrounds",),
+            ("rows", language),
+            partial(_background_rows, language),
+        )
+    )
 
 
 def load_background_full(
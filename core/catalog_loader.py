@@ -1,19 +1,113 @@
 """Единая загрузка YAML-каталогов с mod overlay."""
 
+from collections.abc import Callable, Hashable, Iterable, Mapping
 from pathlib import Path
 from typing import Any
 
-from core.localization import clear_strings_cache
-from core.mod_loader import clear_mod_loader_cache, load_merged_catalog
+from core.catalog_registry import (
+    CATALOGS,
+    CatalogCompiler,
+    CatalogSpec,
+    CatalogStats,
+)
+from core.catalog_snapshot import clear_snapshots
+from core.localization import STRINGS_DIR, clear_strings_cache
+from core.mod_loader import (
+    clear_mod_loader_cache,
+    load_merged_yaml,
+    normalize_catalog_path,
+)
+
+DATABASE_DIR = Path("database")
+
+
+def declare_catalog(
+    name: str,
+    path: Path,
+    root_key: str,
+    *,
+    dependents: tuple[str, ...] = (),
+    compiler: CatalogCompiler | None = None,
+) -> CatalogSpec:
+    """Объявить каталог в реестре (один раз, в модуле-владельце).
+
+    Args:
+        name: Имя каталога (races, classes, …)
+        path: YAML-файл в database/
+        root_key: Корневой ключ словаря каталога
+        dependents: Каталоги, сбрасываемые вместе с этим
+        compiler: Сборка типизированных моделей (``core.catalog_models``)
+    """
+    return CATALOGS.declare(
+        name, path, root_key, dependents=dependents, compiler=compiler
+    )
 
 
 def load_catalog(path: Path | str, root_key: str) -> dict[str, Any]:
     """Загрузить словарь каталога из YAML (с deep-merge модов)."""
-    return load_merged_catalog(str(path), root_key)
+    return CATALOGS.get(CATALOGS.name_for(path, root_key))
+
+
+def get_catalog(name: str) -> dict[str, Any]:
+    """Словарь объявленного каталога по имени."""
+    return CATALOGS.get(name)
+
+
+def compiled_catalog(name: str) -> Mapping[str, Any]:
+    """Скомпилированные модели каталога (id → *Def)."""
+    return CATALOGS.compiled(name)
+
+
+def catalog_entry_views(
+    name: str, *, id_key: str | None = None
+) -> Mapping[str, Mapping[str, Any]]:
+    """Read-only виды записей каталога: чтение без копирования."""
+    return CATALOGS.views(name, id_key=id_key)
+
+
+def catalog_projection[T](
+    names: tuple[str, ...], key: Hashable, build: Callable[[], T]
+) -> T:
+    """Кэш производного представления каталогов (строки меню по языку).
+
+    Ключ — версии каталогов ``names`` и ``key``; сброс любого из
+    каталогов сбрасывает представление.
+    """
+    return CATALOGS.projection(names, key, build)
+
+
+def copy_catalog_entry(name: str, entry_id: str) -> dict[str, Any]:
+    """Изменяемая копия записи каталога (единственный путь к мутации)."""
+    return CATALOGS.copy_entry(name, entry_id)
+
+
+def catalog_stats() -> dict[str, CatalogStats]:
+    """Счётчики реестра: загрузки, попадания, время, размер."""
+    return CATALOGS.stats()
+
+
+def invalidate_catalog(name: str) -> frozenset[str]:
+    """Сбросить каталог по имени вместе с зависимыми.
+
+    Returns:
+        Имена сброшенных каталогов
+    """
+    return CATALOGS.invalidate(name)
+
+
+def invalidate_catalog_files(paths: Iterable[Path | str]) -> frozenset[str]:
+    """Сбросить только каталоги из указанных файлов (с проекциями).
+
+    Returns:
+        Имена сброшенных каталогов
+    """
+    targets = {normalize_catalog_path(path) for path in paths}
+    return CATALOGS.invalidate_paths(targets)
 
 
 def clear_catalog_cache() -> None:
     """Сбросить кэш каталогов (для тестов)."""
+    CATALOGS.clear()
     clear_mod_loader_cache()
 
 
@@ -21,3 +115,26 @@ def clear_all_catalog_caches() -> None:
     """Сбросить все кэши загрузчиков каталогов и строк (для тестов)."""
     clear_catalog_cache()
     clear_strings_cache()
+
+
+def catalog_source_files() -> list[Path]:
+    """YAML-каталоги в database/ (без строк локализации)."""
+    return sorted(
+        path
+        for path in DATABASE_DIR.rglob("*.yaml")
+        if STRINGS_DIR not in path.parents
+    )
+
+
+def rebuild_catalog_snapshots() -> int:
+    """Удалить снапшоты и пересобрать их для всех каталогов.
+
+    Returns:
+        Число пересобранных каталогов
+    """
+    clear_snapshots()
+    clear_catalog_cache()
+    sources = catalog_source_files()
+    for path in sources:
+        load_merged_yaml(path)
+    return len(sources)
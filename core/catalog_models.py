@@ -0,0 +1,428 @@
+"""Скомпилированные модели каталогов: frozen slotted dataclasses.
+
+Компиляция выполняется один раз при загрузке каталога (реестр
+``core.catalog_registry``): типы приведены, наследование подрас и
+гранты нормализованы, бонусы HP посчитаны. Горячие функции ядра читают
+атрибуты вместо ``isinstance`` / ``.get()`` по сырому YAML.
+"""
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from core.abilities import ability_ids
+from core.grant_mechanics import normalize_armor_token
+from core.grants import (
+    grants_from_entity,
+    inherit_flags,
+    merge_entity_grants,
+)
+from core.hp_bonuses import (
+    HpBonusSource,
+    hit_point_bonus_amount,
+    hit_point_bonus_sources_from_grants,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HIT_DICE = 8
+DEFAULT_SUBCLASS_CHOICE_LEVEL = 3
+
+type Grants = tuple[Mapping[str, Any], ...]
+
+_NO_BONUSES: Mapping[str, int] = MappingProxyType({})
+
+
+def _frozen_grants(grants: list[dict[str, Any]]) -> Grants:
+    """Гранты как кортеж read-only словарей."""
+    return tuple(MappingProxyType(grant) for grant in grants)
+
+
+def _int_or(value: Any, default: int) -> int:
+    """int из YAML или default (bool не считается числом)."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return default
+
+
+def _str_tuple(raw: Any) -> tuple[str, ...]:
+    """Список строк из YAML как кортеж."""
+    return tuple(str(item) for item in raw) if isinstance(raw, list) else ()
+
+
+def _stat_bonuses(raw: Any) -> dict[str, int]:
+    """Словарь бонусов к характеристикам из YAML."""
+    return dict(raw) if isinstance(raw, dict) else {}
+
+
+@dataclass(frozen=True, slots=True)
+class SubraceDef:
+    """Подраса с уже применённым наследованием от расы."""
+
+    id: str
+    race_id: str
+    name: Any
+    ability_bonuses: Mapping[str, int]
+    grants: Grants
+    hp_bonus_sources: tuple[HpBonusSource, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class RaceDef:
+    """Раса: собственные бонусы, гранты и подрасы."""
+
+    id: str
+    name: Any
+    ability_bonuses: Mapping[str, int]
+    grants: Grants
+    hp_bonus_sources: tuple[HpBonusSource, ...]
+    subraces: Mapping[str, SubraceDef]
+
+    def resolve_subrace_id(self, subrace_id: str | None) -> str | None:
+        """Нормализовать id подрасы (fallback human → standard)."""
+        if not self.subraces:
+            return subrace_id
+        if subrace_id and subrace_id in self.subraces:
+            return subrace_id
+        if subrace_id is None:
+            if self.id == "human" and "standard" in self.subraces:
+                return "standard"
+            if len(self.subraces) == 1:
+                return next(iter(self.subraces))
+        return subrace_id
+
+    def variant(self, subrace_id: str | None) -> "RaceDef | SubraceDef":
+        """Подраса (с наследованием) или сама раса, если подрасы нет."""
+        resolved = self.resolve_subrace_id(subrace_id)
+        if resolved:
+            subrace = self.subraces.get(resolved)
+            if subrace is not None:
+                return subrace
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class SubclassDef:
+    """Подкласс: доступ к заклинаниям с уровня (None — без магии)."""
+
+    id: str
+    class_id: str
+    name: Any
+    spellcasting_level: int | None
+    grants: Grants
+
+
+@dataclass(frozen=True, slots=True)
+class ClassDef:
+    """Класс: кость хитов, уровень выбора подкласса, заклинания."""
+
+    id: str
+    name: Any
+    hit_dice: int
+    subclass_choice_level: int
+    spellcasting_level: int | None
+    weapon_proficiencies: tuple[str, ...]
+    armor_proficiencies: tuple[str, ...]
+    tool_proficiencies: tuple[str, ...]
+    grants: Grants
+    subclasses: Mapping[str, SubclassDef]
+
+
+@dataclass(frozen=True, slots=True)
+class FeatDef:
+    """Черта: бонусы характеристик, гранты, бонусы HP."""
+
+    id: str
+    name: str
+    ability_bonuses: Mapping[str, int]
+    ability_bonuses_choice: tuple[str, ...]
+    ability_bonuses_amount: int
+    grants: Grants
+    hp_bonus_sources: tuple[HpBonusSource, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponDef:
+    """Оружие: категория и урон."""
+
+    id: str
+    name: Any
+    category: str
+    damage_dice: str
+    damage_type: str
+
+
+@dataclass(frozen=True, slots=True)
+class ArmorDef:
+    """Доспех или щит."""
+
+    id: str
+    name: Any
+    category: str
+    armor_class: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class ToolDef:
+    """Инструмент, набор или музыкальный инструмент."""
+
+    id: str
+    name: Any
+    category: str
+
+
+def _compile_subrace(
+    race_id: str, race: dict[str, Any], subrace_id: str, sub: dict[str, Any]
+) -> SubraceDef:
+    """Подраса: бонусы и гранты с учётом inherit."""
+    inherit_bonuses, _ = inherit_flags(sub)
+    bonuses = (
+        _stat_bonuses(race.get("ability_bonuses")) if inherit_bonuses else {}
+    )
+    for stat, value in _stat_bonuses(sub.get("ability_bonuses")).items():
+        bonuses[stat] = bonuses.get(stat, 0) + value
+    grants = merge_entity_grants(race, sub, use_parent=True)
+    return SubraceDef(
+        id=subrace_id,
+        race_id=race_id,
+        name=sub.get("name", subrace_id),
+        ability_bonuses=MappingProxyType(bonuses),
+        grants=_frozen_grants(grants),
+        hp_bonus_sources=tuple(hit_point_bonus_sources_from_grants(grants)),
+    )
+
+
+def compile_races(catalog: dict[str, Any]) -> dict[str, RaceDef]:
+    """Скомпилировать каталог рас."""
+    result: dict[str, RaceDef] = {}
+    for race_id, race in catalog.items():
+        if not isinstance(race, dict):
+            continue
+        grants = grants_from_entity(race)
+        raw_subraces = race.get("subraces")
+        subraces = {
+            str(subrace_id): _compile_subrace(race_id, race, subrace_id, sub)
+            for subrace_id, sub in (
+                raw_subraces.items() if isinstance(raw_subraces, dict) else ()
+            )
+            if isinstance(sub, dict)
+        }
+        result[race_id] = RaceDef(
+            id=race_id,
+            name=race.get("name", race_id),
+            ability_bonuses=MappingProxyType(
+                _stat_bonuses(race.get("ability_bonuses"))
+            ),
+            grants=_frozen_grants(grants),
+            hp_bonus_sources=tuple(
+                hit_point_bonus_sources_from_grants(grants)
+            ),
+            subraces=MappingProxyType(subraces),
+        )
+    return result
+
+
+def progression_grants(
+    entity: dict[str, Any],
+    *,
+    max_level: int | None = None,
+) -> list[dict[str, Any]]:
+    """Grants из progression.<level>.grants с полем level."""
+    progression = entity.get("progression", {})
+    if not isinstance(progression, dict):
+        return []
+    result: list[dict[str, Any]] = []
+    for level_key, level_data in progression.items():
+        try:
+            level = int(level_key)
+        except (TypeError, ValueError):
+            continue
+        if max_level is not None and level > max_level:
+            continue
+        if not isinstance(level_data, dict):
+            continue
+        raw_grants = level_data.get("grants", [])
+        if not isinstance(raw_grants, list):
+            continue
+        for grant in raw_grants:
+            if not isinstance(grant, dict):
+                continue
+            entry = dict(grant)
+            entry["level"] = level
+            result.append(entry)
+    return result
+
+
+def _spellcasting_level(entry: dict[str, Any], default: int) -> int | None:
+    """Уровень начала заклинаний или None, если их нет."""
+    if not entry.get("spellcasting"):
+        return None
+    return _int_or(entry.get("spellcasting_level", default), default)
+
+
+def compile_classes(catalog: dict[str, Any]) -> dict[str, ClassDef]:
+    """Скомпилировать каталог классов (подклассы — по id, первый)."""
+    result: dict[str, ClassDef] = {}
+    for class_id, info in catalog.items():
+        if not isinstance(info, dict):
+            continue
+        choice_level = _int_or(
+            info.get("subclass_choice_level", DEFAULT_SUBCLASS_CHOICE_LEVEL),
+            DEFAULT_SUBCLASS_CHOICE_LEVEL,
+        )
+        proficiencies = info.get("proficiencies")
+        if not isinstance(proficiencies, dict):
+            proficiencies = {}
+        subclasses: dict[str, SubclassDef] = {}
+        raw_subclasses = info.get("subclasses")
+        for entry in (
+            raw_subclasses if isinstance(raw_subclasses, list) else []
+        ):
+            if not isinstance(entry, dict):
+                continue
+            sub_id = str(entry.get("id", ""))
+            subclasses.setdefault(
+                sub_id,
+                SubclassDef(
+                    id=sub_id,
+                    class_id=class_id,
+                    name=entry.get("name", sub_id),
+                    spellcasting_level=_spellcasting_level(
+                        entry, choice_level
+                    ),
+                    grants=_frozen_grants(progression_grants(entry)),
+                ),
+            )
+        result[class_id] = ClassDef(
+            id=class_id,
+            name=info.get("name", class_id),
+            hit_dice=_int_or(info.get("hit_dice"), DEFAULT_HIT_DICE),
+            subclass_choice_level=choice_level,
+            spellcasting_level=_spellcasting_level(info, 1),
+            weapon_proficiencies=_str_tuple(proficiencies.get("weapons")),
+            armor_proficiencies=tuple(
+                normalize_armor_token(token)
+                for token in _str_tuple(proficiencies.get("armor"))
+            ),
+            tool_proficiencies=_str_tuple(proficiencies.get("tools")),
+            grants=_frozen_grants(progression_grants(info)),
+            subclasses=MappingProxyType(subclasses),
+        )
+    return result
+
+
+def _feat_hp_bonus_sources(
+    feat_name: str, grants: list[dict[str, Any]]
+) -> tuple[HpBonusSource, ...]:
+    """Бонусы HP черты; безымянный грант подписывается именем черты."""
+    sources: list[HpBonusSource] = []
+    for grant in grants:
+        amount = hit_point_bonus_amount(grant)
+        if amount > 0:
+            name = str(grant.get("name", "")).strip() or feat_name
+            sources.append(HpBonusSource(name=name, amount=amount))
+    return tuple(sources)
+
+
+def _feat_ability_bonuses(
+    feat_id: str, raw: Any, stat_ids: frozenset[str]
+) -> dict[str, int]:
+    """Фиксированные бонусы черты; нечисловой бонус пропускается."""
+    if not isinstance(raw, dict):
+        return {}
+    bonuses: dict[str, int] = {}
+    for key, value in raw.items():
+        if key not in stat_ids:
+            continue
+        try:
+            bonuses[key] = int(value)
+        except (TypeError, ValueError):
+            logger.warning(
+                "Черта %s: бонус %s не число (%r), пропущен",
+                feat_id,
+                key,
+                value,
+            )
+    return bonuses
+
+
+def compile_feats(catalog: dict[str, Any]) -> dict[str, FeatDef]:
+    """Скомпилировать каталог черт."""
+    stat_ids = frozenset(ability_ids())
+    result: dict[str, FeatDef] = {}
+    for feat_id, info in catalog.items():
+        if not isinstance(info, dict):
+            continue
+        bonuses = _feat_ability_bonuses(
+            feat_id, info.get("ability_bonuses"), stat_ids
+        )
+        choice = info.get("ability_bonuses_choice")
+        feat_name = str(info.get("name", feat_id)).strip() or feat_id
+        grants = grants_from_entity(info)
+        result[feat_id] = FeatDef(
+            id=feat_id,
+            name=feat_name,
+            ability_bonuses=(
+                MappingProxyType(bonuses) if bonuses else _NO_BONUSES
+            ),
+            ability_bonuses_choice=(
+                tuple(str(stat) for stat in choice)
+                if isinstance(choice, list)
+                else ()
+            ),
+            ability_bonuses_amount=_int_or(
+                info.get("ability_bonuses_amount", 1), 1
+            ),
+            grants=_frozen_grants(grants),
+            hp_bonus_sources=_feat_hp_bonus_sources(feat_name, grants),
+        )
+    return result
+
+
+def compile_weapons(catalog: dict[str, Any]) -> dict[str, WeaponDef]:
+    """Скомпилировать каталог оружия."""
+    result: dict[str, WeaponDef] = {}
+    for weapon_id, info in catalog.items():
+        if not isinstance(info, dict):
+            continue
+        damage = info.get("damage")
+        damage = damage if isinstance(damage, dict) else {}
+        result[weapon_id] = WeaponDef(
+            id=weapon_id,
+            name=info.get("name", weapon_id),
+            category=str(info.get("category", "")),
+            damage_dice=str(damage.get("dice", "")),
+            damage_type=str(damage.get("type", "")),
+        )
+    return result
+
+
+def compile_armor(catalog: dict[str, Any]) -> dict[str, ArmorDef]:
+    """Скомпилировать каталог доспехов."""
+    result: dict[str, ArmorDef] = {}
+    for armor_id, info in catalog.items():
+        if not isinstance(info, dict):
+            continue
+        armor_class = info.get("armor_class")
+        result[armor_id] = ArmorDef(
+            id=armor_id,
+            name=info.get("name", armor_id),
+            category=str(info.get("category", "")),
+            armor_class=armor_class if isinstance(armor_class, int) else None,
+        )
+    return result
+
+
+def compile_tools(catalog: dict[str, Any]) -> dict[str, ToolDef]:
+    """Скомпилировать каталог инструментов."""
+    return {
+        tool_id: ToolDef(
+            id=tool_id,
+            name=info.get("name", tool_id),
+            category=str(info.get("category", "")),
+        )
+        for tool_id, info in catalog.items()
+        if isinstance(info, dict)
+    }
@@ -0,0 +1,352 @@
+"""Реестр YAML-каталогов: объявление, резидентный кэш, статистика.
+
+Каждый каталог объявляется один раз (имя, файл, корневой ключ,
+зависимые каталоги) в модуле-владельце. Загруженные данные не
+вытесняются: сброс — только явный, по имени или по файлу.
+
+Записи каталога отдаются read-only видами (``MappingProxyType``),
+общими для всех вызовов; изменяемая копия — только ``copy_entry``.
+Каталог с ``compiler`` компилируется в типизированные модели один раз
+за загрузку (``compiled``). Производные представления (списки для
+меню по языку и т.п.) — ``projection``: ключ включает версии исходных
+каталогов, сброс каталога сбрасывает и их.
+
+Загрузка и компиляция однократны и потокобезопасны: параллельный
+вызов (например, фоновый прогрев) ждёт future уже идущей загрузки,
+а не разбирает YAML второй раз.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+from core.mod_loader import (
+    get_mod_index,
+    load_merged_catalog,
+    normalize_catalog_path,
+)
+
+logger = logging.getLogger(__name__)
+
+type CatalogCompiler = Callable[[dict[str, Any]], Mapping[str, object]]
+
+
+@dataclass(frozen=True)
+class CatalogSpec:
+    """Объявление каталога."""
+
+    name: str
+    path: Path
+    root_key: str
+    dependents: tuple[str, ...] = ()
+    compiler: CatalogCompiler | None = None
+
+
+@dataclass
+class CatalogStats:
+    """Счётчики каталога: загрузки, попадания, ожидания, время, размер."""
+
+    loads: int = 0
+    hits: int = 0
+    waits: int = 0
+    load_seconds: float = 0.0
+    entries: int = 0
+    source_bytes: int = 0
+
+
+def _source_bytes(path: Path) -> int:
+    """Размер базового YAML и overlay модов в байтах."""
+    total = 0
+    for source in (path, *get_mod_index().overlays_for(path)):
+        try:
+            total += source.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+type EntryViews = Mapping[str, Mapping[str, Any]]
+
+# Ключ проекции: (каталоги, ключ потребителя)
+type _ProjectionKey = tuple[tuple[str, ...], Hashable]
+
+# Ключ однократной сборки: ("data" | "compiled", имя каталога)
+type _BuildKey = tuple[str, str]
+
+
+class CatalogRegistry:
+    """Объявленные каталоги и их резидентные данные."""
+
+    def __init__(self) -> None:
+        self._specs: dict[str, CatalogSpec] = {}
+        self._by_source: dict[tuple[str, str], str] = {}
+        self._data: dict[str, dict[str, Any]] = {}
+        self._stats: dict[str, CatalogStats] = {}
+        self._views: dict[tuple[str, str | None], EntryViews] = {}
+        self._compiled: dict[str, Mapping[str, Any]] = {}
+        self._versions: dict[str, int] = {}
+        self._projections: dict[_ProjectionKey, Any] = {}
+        self._lock = threading.Lock()
+        self._inflight: dict[_BuildKey, Future[Any]] = {}
+
+    def declare(
+        self,
+        name: str,
+        path: Path,
+        root_key: str,
+        *,
+        dependents: tuple[str, ...] = (),
+        compiler: CatalogCompiler | None = None,
+    ) -> CatalogSpec:
+        """Объявить каталог; повторное объявление должно совпадать."""
+        spec = CatalogSpec(
+            name, Path(path), root_key, tuple(dependents), compiler
+        )
+        existing = self._specs.get(name)
+        if existing is not None:
+            if existing != spec:
+                raise ValueError(f"Каталог {name!r} уже объявлен иначе")
+            return existing
+        source = (normalize_catalog_path(path), root_key)
+        if source in self._by_source:
+            raise ValueError(
+                f"Файл {path} ({root_key}) уже объявлен как "
+                f"{self._by_source[source]!r}"
+            )
+        self._specs[name] = spec
+        self._by_source[source] = name
+        self._stats[name] = CatalogStats()
+        self._versions[name] = 0
+        return spec
+
+    def spec(self, name: str) -> CatalogSpec:
+        """Объявление каталога по имени (KeyError, если нет)."""
+        return self._specs[name]
+
+    def names(self) -> tuple[str, ...]:
+        """Имена объявленных каталогов в порядке объявления."""
+        return tuple(self._specs)
+
+    def name_for(self, path: Path | str, root_key: str) -> str:
+        """Имя каталога по файлу; необъявленный файл объявляется по пути.
+
+        Автообъявление пишется в лог: у такого каталога нет владельца,
+        компилятора и зависимых.
+        """
+        source = (normalize_catalog_path(path), root_key)
+        name = self._by_source.get(source)
+        if name is None:
+            name = f"{source[0]}:{root_key}"
+            logger.warning(
+                "Каталог %s (%s) не объявлен, объявлен автоматически: %r",
+                path,
+                root_key,
+                name,
+            )
+            self.declare(name, Path(path), root_key)
+        return name
+
+    def _build_once[T](
+        self,
+        cache: dict[str, T],
+        key: _BuildKey,
+        build: Callable[[], T],
+    ) -> T:
+        """Собрать значение один раз; параллельные вызовы ждут future."""
+        name = key[1]
+        with self._lock:
+            value = cache.get(name)
+            if value is not None:
+                self._stats[name].hits += 1
+                return value
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+        if not owner:
+            self._stats[name].waits += 1
+            result: T = future.result()
+            return result
+        try:
+            value = build()
+        except BaseException as exc:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_exception(exc)
+            raise
+        with self._lock:
+            # Сброс во время сборки: результат отдаём, но не кэшируем
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+                cache[name] = value
+        future.set_result(value)
+        return value
+
+    def _load(self, name: str) -> dict[str, Any]:
+        """Прочитать каталог с модами и снапшотом, обновить счётчики."""
+        spec = self._specs[name]
+        stats = self._stats[name]
+        start = time.perf_counter()
+        data = load_merged_catalog(str(spec.path), spec.root_key)
+        stats.load_seconds = time.perf_counter() - start
+        stats.loads += 1
+        stats.entries = len(data)
+        stats.source_bytes = _source_bytes(spec.path)
+        return data
+
+    def get(self, name: str) -> dict[str, Any]:
+        """Данные каталога; первая загрузка — с модами и снапшотом."""
+        data = self._data.get(name)
+        if data is not None:
+            self._stats[name].hits += 1
+            return data
+        return self._build_once(
+            self._data, ("data", name), lambda: self._load(name)
+        )
+
+    def views(self, name: str, *, id_key: str | None = None) -> EntryViews:
+        """Read-only виды записей-словарей каталога (строятся один раз).
+
+        Args:
+            name: Имя каталога
+            id_key: Если задан — в каждый вид добавляется ключ с id записи
+        """
+        key = (name, id_key)
+        views = self._views.get(key)
+        if views is not None:
+            self._stats[name].hits += 1
+            return views
+        built: dict[str, Mapping[str, Any]] = {}
+        for entry_id, info in self.get(name).items():
+            if not isinstance(info, dict):
+                continue
+            if id_key is not None:
+                info = {**info, id_key: entry_id}
+            built[entry_id] = MappingProxyType(info)
+        views = MappingProxyType(built)
+        self._views[key] = views
+        return views
+
+    def compiled(self, name: str) -> Mapping[str, Any]:
+        """Модели каталога от ``compiler`` (компиляция — раз за загрузку)."""
+        models = self._compiled.get(name)
+        if models is not None:
+            self._stats[name].hits += 1
+            return models
+        compiler = self._specs[name].compiler
+        if compiler is None:
+            raise ValueError(f"Каталог {name!r} объявлен без compiler")
+
+        def build() -> Mapping[str, Any]:
+            return MappingProxyType(dict(compiler(self.get(name))))
+
+        return self._build_once(self._compiled, ("compiled", name), build)
+
+    def version(self, name: str) -> int:
+        """Версия каталога: растёт при каждом сбросе."""
+        return self._versions[name]
+
+    def projection[T](
+        self,
+        names: tuple[str, ...],
+        key: Hashable,
+        build: Callable[[], T],
+    ) -> T:
+        """Производное представление каталогов, одно на их версии.
+
+        Хранится, пока не сброшен ни один из ``names``; построенное
+        во время сброса отдаётся, но не кэшируется.
+
+        Args:
+            names: Каталоги, из которых строится представление
+            key: Ключ потребителя (например, ("rows", language))
+            build: Построение; вызывается после сброса каталогов
+        """
+        full_key = (names, key)
+        cached: T | None = self._projections.get(full_key)
+        if cached is not None:
+            return cached
+        versions = [self._versions[name] for name in names]
+        value = build()
+        with self._lock:
+            if versions == [self._versions[name] for name in names]:
+                self._projections[full_key] = value
+        return value
+
+    def copy_entry(self, name: str, entry_id: str) -> dict[str, Any]:
+        """Изменяемая глубокая копия записи каталога ({} если нет)."""
+        info = self.get(name).get(entry_id)
+        return copy.deepcopy(info) if isinstance(info, dict) else {}
+
+    def _drop(self, name: str) -> None:
+        """Выгрузить данные и виды каталога."""
+        with self._lock:
+            self._data.pop(name, None)
+            self._compiled.pop(name, None)
+            self._inflight.pop(("data", name), None)
+            self._inflight.pop(("compiled", name), None)
+            self._versions[name] += 1
+            for key in [key for key in self._views if key[0] == name]:
+                del self._views[key]
+            for stale in [k for k in self._projections if name in k[0]]:
+                del self._projections[stale]
+
+    def invalidate(self, name: str) -> frozenset[str]:
+        """Сбросить каталог и (рекурсивно) его зависимые."""
+        dropped: set[str] = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if current in dropped or current not in self._specs:
+                continue
+            dropped.add(current)
+            self._drop(current)
+            pending.extend(self._specs[current].dependents)
+        return frozenset(dropped)
+
+    def invalidate_paths(self, paths: set[str]) -> frozenset[str]:
+        """Сбросить каталоги, объявленные на указанные файлы."""
+        dropped: set[str] = set()
+        for (source, _root_key), name in self._by_source.items():
+            if source in paths:
+                dropped |= self.invalidate(name)
+        return frozenset(dropped)
+
+    def clear(self) -> None:
+        """Сбросить данные всех каталогов (объявления остаются)."""
+        with self._lock:
+            self._data.clear()
+            self._views.clear()
+            self._compiled.clear()
+            self._inflight.clear()
+            self._projections.clear()
+            for name in self._versions:
+                self._versions[name] += 1
+
+    def is_loaded(self, name: str) -> bool:
+        """Загружен ли каталог в память."""
+        return name in self._data
+
+    def warm(self, name: str) -> None:
+        """Загрузить каталог и, если есть compiler, скомпилировать."""
+        self.get(name)
+        if self._specs[name].compiler is not None:
+            self.compiled(name)
+
+    def stats(self) -> dict[str, CatalogStats]:
+        """Копия счётчиков по каждому каталогу."""
+        return {
+            name: CatalogStats(**vars(stats))
+            for name, stats in self._stats.items()
+        }
+
+
+CATALOGS = CatalogRegistry()
@@ -0,0 +1,92 @@
+"""Скомпилированные снапшоты YAML-каталогов (marshal) в .cache/.
+
+Снапшот хранит результат ``load_merged_yaml`` вместе с отпечатком
+исходников: базовый YAML, overlay включённых модов и mods_state.json.
+Любое изменение содержимого меняет отпечаток — снапшот пересобирается.
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import threading
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(".cache/catalogs")
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_SUFFIX = ".marshal"
+
+
+def snapshot_fingerprint(sources: list[Path]) -> str:
+    """SHA-256 по путям и содержимому исходников (+ версия формата)."""
+    digest = hashlib.sha256()
+    digest.update(f"format:{SNAPSHOT_FORMAT}".encode())
+    digest.update(MAGIC_NUMBER)
+    for source in sources:
+        digest.update(source.as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        try:
+            digest.update(source.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _snapshot_path(path: Path) -> Path:
+    """Файл снапшота для исходного YAML."""
+    key = hashlib.sha1(
+        path.as_posix().encode("utf-8"), usedforsecurity=False
+    ).hexdigest()[:16]
+    return SNAPSHOT_DIR / f"{path.stem}-{key}{SNAPSHOT_SUFFIX}"
+
+
+def load_snapshot(path: Path, fingerprint: str) -> dict[str, Any] | None:
+    """Данные из снапшота или None (нет файла, устарел, битый)."""
+    snapshot = _snapshot_path(path)
+    try:
+        with open(snapshot, "rb") as f:
+            payload = marshal.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError):
+        logger.warning("Битый снапшот каталога: %s", snapshot)
+        return None
+    if not isinstance(payload, tuple) or len(payload) != 2:
+        return None
+    stored_fingerprint, data = payload
+    if stored_fingerprint != fingerprint or not isinstance(data, dict):
+        return None
+    return data
+
+
+def save_snapshot(path: Path, fingerprint: str, data: dict[str, Any]) -> None:
+    """Атомарно записать снапшот; ошибки записи не мешают загрузке."""
+    snapshot = _snapshot_path(path)
+    # pid + поток: один YAML могут читать параллельно (прогрев каталогов)
+    tmp = snapshot.with_name(
+        f"{snapshot.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        payload = marshal.dumps((fingerprint, data))
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(payload)
+        os.replace(tmp, snapshot)
+    except (OSError, ValueError) as exc:
+        logger.warning("Снапшот каталога не записан: %s (%s)", path, exc)
+        tmp.unlink(missing_ok=True)
+
+
+def clear_snapshots() -> int:
+    """Удалить все снапшоты. Возвращает число удалённых файлов."""
+    if not SNAPSHOT_DIR.exists():
+        return 0
+    deleted = 0
+    for snapshot in SNAPSHOT_DIR.glob(f"*{SNAPSHOT_SUFFIX}"):
+        snapshot.unlink(missing_ok=True)
+        deleted += 1
+    return deleted
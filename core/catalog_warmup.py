@@ -0,0 +1,66 @@
+"""Фоновый прогрев каталогов, пока игрок смотрит приветствие и меню.
+
+Пул потоков загружает и компилирует все объявленные каталоги. Реестр
+однократен: если экран обратился к каталогу раньше, чем прогрев его
+закончил, вызов ждёт уже идущую загрузку, а не разбирает YAML заново.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+
+from core.catalog_registry import CATALOGS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_WORKERS = 4
+
+
+def _log_failure(name: str, future: Future[None]) -> None:
+    """Ошибка прогрева не роняет игру: экран повторит загрузку сам."""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Прогрев каталога %s не удался: %s", name, exc)
+
+
+@dataclass(frozen=True)
+class CatalogWarmup:
+    """Запущенный прогрев: future по имени каталога."""
+
+    futures: dict[str, Future[None]]
+
+    def done(self) -> bool:
+        """Все каталоги прогреты (или упали)."""
+        return all(future.done() for future in self.futures.values())
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Дождаться прогрева; False — не уложились в timeout."""
+        _done, pending = wait(self.futures.values(), timeout=timeout)
+        return not pending
+
+
+def start_catalog_warmup(
+    names: tuple[str, ...] | None = None,
+    max_workers: int = DEFAULT_WARMUP_WORKERS,
+) -> CatalogWarmup:
+    """Запустить фоновую загрузку и компиляцию каталогов.
+
+    Args:
+        names: Каталоги для прогрева (None — все объявленные)
+        max_workers: Размер пула потоков
+
+    Returns:
+        Handle прогрева (ждать не обязательно)
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="catalog-warmup"
+    )
+    futures: dict[str, Future[None]] = {}
+    for name in CATALOGS.names() if names is None else names:
+        future = executor.submit(CATALOGS.warm, name)
+        future.add_done_callback(partial(_log_failure, name))
+        futures[name] = future
+    # Задачи доработают; пул закроется после последней
+    executor.shutdown(wait=False)
+    return CatalogWarmup(futures)
@@ -0,0 +1,128 @@
+"""Горячая перезагрузка каталогов: stat-опрос database/ и mods/.
+
+Без inotify: ``poll()`` сравнивает (mtime, size) YAML-файлов и
+``mods_state.json`` с прошлым опросом и сбрасывает только затронутые
+каталоги. Следующий экран читает уже новые данные.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.catalog_loader import DATABASE_DIR, invalidate_catalog_files
+from core.localization import STRINGS_DIR, clear_strings_cache
+from core.mod_loader import (
+    MODS_DIR,
+    MODS_STATE_FILE,
+    FileStamp,
+    ModIndex,
+    file_stamp,
+    get_mod_index,
+)
+
+WATCH_DIRS: tuple[Path, ...] = (DATABASE_DIR, MODS_DIR)
+
+
+def _scan_stamps() -> dict[str, FileStamp]:
+    """Stat-отпечатки наблюдаемых YAML и mods_state.json."""
+    stamps: dict[str, FileStamp] = {}
+    for root in WATCH_DIRS:
+        for path in root.rglob("*.yaml"):
+            stamps[path.as_posix()] = file_stamp(path)
+    stamps[MODS_STATE_FILE.as_posix()] = file_stamp(MODS_STATE_FILE)
+    return stamps
+
+
+def _is_catalog_file(path: str) -> bool:
+    """Базовый каталог (не строки, не файлы модов)."""
+    parents = Path(path).parents
+    return (
+        path.endswith(".yaml")
+        and DATABASE_DIR in parents
+        and STRINGS_DIR not in parents
+    )
+
+
+def _overlay_changed_targets(
+    old: ModIndex, new: ModIndex, changed: set[str]
+) -> set[str]:
+    """Target, у которых поменялся набор overlay или их содержимое."""
+    targets: set[str] = set()
+    for target in old.overlays.keys() | new.overlays.keys():
+        old_paths = old.overlays.get(target, ())
+        new_paths = new.overlays.get(target, ())
+        if old_paths != new_paths or any(
+            path.as_posix() in changed for path in new_paths
+        ):
+            targets.add(target)
+    return targets
+
+
+@dataclass(frozen=True)
+class CatalogChanges:
+    """Результат опроса: изменённые файлы и сброшенные каталоги."""
+
+    changed_files: tuple[str, ...] = ()
+    invalidated: frozenset[str] = frozenset()
+    strings_changed: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.changed_files)
+
+
+class CatalogWatcher:
+    """Опрос mtime/size каталогов с точечным сбросом кэшей."""
+
+    def __init__(self) -> None:
+        self._stamps = _scan_stamps()
+        self._mod_index = get_mod_index()
+
+    def poll(self) -> CatalogChanges:
+        """Найти изменения с прошлого опроса и сбросить затронутое."""
+        stamps = _scan_stamps()
+        changed = {
+            path
+            for path in stamps.keys() | self._stamps.keys()
+            if stamps.get(path) != self._stamps.get(path)
+        }
+        self._stamps = stamps
+        if not changed:
+            return CatalogChanges()
+
+        new_index = get_mod_index()
+        targets = _overlay_changed_targets(self._mod_index, new_index, changed)
+        self._mod_index = new_index
+        targets.update(path for path in changed if _is_catalog_file(path))
+
+        strings_changed = any(
+            Path(path).parent == STRINGS_DIR for path in changed
+        )
+        if strings_changed:
+            clear_strings_cache()
+        return CatalogChanges(
+            changed_files=tuple(sorted(changed)),
+            invalidated=invalidate_catalog_files(targets),
+            strings_changed=strings_changed,
+        )
+
+
+_active_watcher: CatalogWatcher | None = None
+
+
+def start_catalog_watcher() -> CatalogWatcher:
+    """Включить горячую перезагрузку для процесса (долгоживущий сервер)."""
+    global _active_watcher
+    _active_watcher = CatalogWatcher()
+    return _active_watcher
+
+
+def stop_catalog_watcher() -> None:
+    """Выключить горячую перезагрузку."""
+    global _active_watcher
+    _active_watcher = None
+
+
+def poll_catalog_changes() -> CatalogChanges:
+    """Опросить активный watcher; без watcher — пустой результат."""
+    if _active_watcher is None:
+        return CatalogChanges()
+    return _active_watcher.poll()
@@ -7,13 +7,24 @@
 from core.adventure import load_adventures
 from core.backgrounds import load_background_full, load_backgrounds
 from core.character_storage import (
-    LoadCharactersResult,
+    archive_cold_characters,
+    close_character_storage,
     delete_all_characters,
     delete_character,
+    iter_characters,
+    list_character_page,
+    list_character_summaries,
+    load_character,
     load_characters,
+    migrate_save_layout,
     save_character,
+    set_durability_mode,
+    set_load_workers,
+    set_storage_backend,
+    transfer_characters,
     update_character,
 )
+from core.character_store import LoadCharactersResult
 from core.classes import load_class_full, load_classes, load_subclasses
 from core.dice import roll_ability_score
 from core.languages import get_language_name, load_languages
@@ -75,7 +86,14 @@ __all__ = [
     "load_adventures",
     "load_background_full",
     "load_backgrounds",
+    "list_character_summaries",
+    "iter_characters",
+    "list_character_page",
+    "load_character",
     "load_characters",
+    "migrate_save_layout",
+    "archive_cold_characters",
+    "close_character_storage",
     "LoadCharactersResult",
     "load_class_full",
     "load_classes",
@@ -89,6 +107,10 @@ __all__ = [
     "remaining_standard_array_pool",
     "roll_ability_score",
     "save_character",
+    "set_durability_mode",
+    "set_load_workers",
+    "set_storage_backend",
+    "transfer_characters",
     "update_character",
     "validate_final_stats",
     "validate_point_buy_finish",
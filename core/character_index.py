@@ -0,0 +1,205 @@
+"""Индекс сохранений персонажей: ``saves/characters/.index.json``.
+
+Сводка по каждому файлу сохранения (slug, имя, класс, уровень, дата
+создания) вместе с его stat-отпечатком (mtime_ns, размер) и отпечатком
+журнала: запись журнала меняет персонажа, не трогая базу. Индекс —
+кэш: битый или устаревший файл индекса пересобирается по сейвам, а
+запись с несовпавшим отпечатком перечитывается из JSON персонажа.
+"""
+
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from core.io import load_json, save_json
+from core.models import Character
+
+logger = logging.getLogger(__name__)
+
+# С точкой: не пересекается ни с одним save_slug (make_save_slug)
+INDEX_FILE_NAME = ".index.json"
+INDEX_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CharacterSummary:
+    """Строка индекса: сводка сохранения без разбора JSON персонажа."""
+
+    save_slug: str
+    name: str
+    class_id: str
+    level: int
+    created_at: str
+    mtime_ns: int
+    size: int
+    corrupt: bool = False
+    # Отпечаток журнала (0, 0 — журнала нет)
+    journal_mtime_ns: int = 0
+    journal_size: int = 0
+
+    @property
+    def created_timestamp(self) -> float:
+        """Метка создания: created_at или mtime для старых сохранений."""
+        if self.created_at:
+            try:
+                return datetime.fromisoformat(self.created_at).timestamp()
+            except ValueError:
+                pass
+        return self.mtime_ns / 1_000_000_000
+
+    def matches(
+        self, stat: os.stat_result, journal: os.stat_result | None = None
+    ) -> bool:
+        """База и журнал не менялись с момента индексации."""
+        return (
+            self.mtime_ns,
+            self.size,
+            self.journal_mtime_ns,
+            self.journal_size,
+        ) == (stat.st_mtime_ns, stat.st_size, *_journal_fields(journal))
+
+
+def _journal_fields(journal: os.stat_result | None) -> tuple[int, int]:
+    """(mtime_ns, размер) журнала; нет журнала — (0, 0)."""
+    if journal is None:
+        return 0, 0
+    return journal.st_mtime_ns, journal.st_size
+
+
+def summary_from_character(
+    character: Character,
+    stat: os.stat_result,
+    journal: os.stat_result | None = None,
+) -> CharacterSummary:
+    """Сводка загруженного персонажа (база + журнал)."""
+    journal_mtime_ns, journal_size = _journal_fields(journal)
+    return CharacterSummary(
+        save_slug=character.save_slug or "",
+        name=character.name,
+        class_id=character.class_id,
+        level=character.level,
+        created_at=character.created_at or "",
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        journal_mtime_ns=journal_mtime_ns,
+        journal_size=journal_size,
+    )
+
+
+def corrupt_summary(
+    label: str,
+    stat: os.stat_result,
+    journal: os.stat_result | None = None,
+) -> CharacterSummary:
+    """Сводка битого сейва: name — подпись для предупреждения."""
+    journal_mtime_ns, journal_size = _journal_fields(journal)
+    return CharacterSummary(
+        save_slug="",
+        name=label,
+        class_id="",
+        level=0,
+        created_at="",
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        corrupt=True,
+        journal_mtime_ns=journal_mtime_ns,
+        journal_size=journal_size,
+    )
+
+
+type IndexStamp = tuple[str, int, int]
+
+# Разобранный индекс процесса: (путь, mtime_ns, размер) → записи
+_cached_index: tuple[IndexStamp, dict[str, CharacterSummary]] | None = None
+
+
+def index_path(directory: Path) -> Path:
+    """Путь к файлу индекса в папке сохранений."""
+    return directory / INDEX_FILE_NAME
+
+
+def summary_from_record(data: Any) -> CharacterSummary | None:
+    """Запись индекса из JSON; чужой формат — None."""
+    if not isinstance(data, dict):
+        return None
+    try:
+        return CharacterSummary(
+            save_slug=str(data["save_slug"]),
+            name=str(data["name"]),
+            class_id=str(data["class_id"]),
+            level=int(data["level"]),
+            created_at=str(data["created_at"]),
+            mtime_ns=int(data["mtime_ns"]),
+            size=int(data["size"]),
+            corrupt=bool(data.get("corrupt", False)),
+            journal_mtime_ns=int(data.get("journal_mtime_ns", 0)),
+            journal_size=int(data.get("journal_size", 0)),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _index_stamp(path: Path) -> IndexStamp | None:
+    """Stat-отпечаток файла индекса; None — файла нет."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return path.as_posix(), stat.st_mtime_ns, stat.st_size
+
+
+def read_index(directory: Path) -> dict[str, CharacterSummary]:
+    """Записи индекса по имени файла (без .json); битый индекс — пусто.
+
+    Неизменившийся файл индекса повторно не разбирается.
+    """
+    global _cached_index
+    path = index_path(directory)
+    stamp = _index_stamp(path)
+    if stamp is None:
+        return {}
+    if _cached_index is not None and _cached_index[0] == stamp:
+        return dict(_cached_index[1])
+    entries = _parse_index(load_json(path))
+    _cached_index = (stamp, entries)
+    return dict(entries)
+
+
+def _parse_index(data: dict[str, Any]) -> dict[str, CharacterSummary]:
+    """Записи из JSON индекса; чужая версия схемы — пусто."""
+    raw = data.get("characters")
+    if data.get("schema_version") != INDEX_SCHEMA_VERSION or not isinstance(
+        raw, dict
+    ):
+        return {}
+    entries: dict[str, CharacterSummary] = {}
+    for stem, item in raw.items():
+        summary = summary_from_record(item)
+        if summary is not None:
+            entries[str(stem)] = summary
+    return entries
+
+
+def write_index(directory: Path, entries: dict[str, CharacterSummary]) -> None:
+    """Записать индекс; ошибка записи не мешает сохранению персонажа."""
+    global _cached_index
+    path = index_path(directory)
+    try:
+        save_json(
+            path,
+            {
+                "schema_version": INDEX_SCHEMA_VERSION,
+                "characters": {
+                    stem: asdict(summary)
+                    for stem, summary in sorted(entries.items())
+                },
+            },
+        )
+    except OSError as exc:
+        logger.warning("Индекс сохранений не записан: %s", exc)
+        return
+    stamp = _index_stamp(path)
+    _cached_index = None if stamp is None else (stamp, dict(entries))
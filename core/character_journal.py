@@ -0,0 +1,128 @@
+"""Журнал изменений персонажа: ``saves/characters/{slug}.journal``.
+
+Шаги сценария (опыт, уровень, подкласс) меняют пару полей, поэтому
+``update_character`` дописывает в журнал строку JSON с новыми
+значениями изменённых полей, а не переписывает весь сейв. При загрузке
+журнал накладывается на базовый JSON; после ``JOURNAL_COMPACT_AFTER``
+записей и при выходе из игры журнал сворачивается в базовый файл.
+
+Запись хранит значения, а не приращения: повторное наложение после
+сбоя даёт тот же результат. ``Character.to_dict`` не пишет пустые
+необязательные поля, поэтому очищенное поле попадает в запись списком
+``unset`` — иначе наложение на базу вернуло бы старое значение.
+Оборванная последняя строка (сбой посреди записи) отбрасывается вместе
+со всем, что после неё.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_COMPACT_AFTER = 50
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """Запись журнала: новые значения и удалённые поля."""
+
+    values: dict[str, Any]
+    removed: tuple[str, ...] = ()
+
+
+def journal_path(save_path: Path) -> Path:
+    """Журнал рядом с JSON-файлом персонажа."""
+    return save_path.with_suffix(JOURNAL_SUFFIX)
+
+
+def field_delta(
+    before: dict[str, Any], after: dict[str, Any]
+) -> dict[str, Any]:
+    """Поля after, значения которых отличаются от before."""
+    return {
+        key: value
+        for key, value in after.items()
+        if before.get(key, _MISSING) != value
+    }
+
+
+def removed_fields(
+    before: dict[str, Any], after: dict[str, Any]
+) -> tuple[str, ...]:
+    """Поля before, которых нет в after (очищены)."""
+    return tuple(sorted(before.keys() - after.keys()))
+
+
+def append_entry(
+    path: Path, entry: JournalEntry, *, durable: bool = False
+) -> None:
+    """Дописать строку журнала.
+
+    Args:
+        path: Файл журнала
+        entry: Новые значения изменённых полей и очищенные поля
+        durable: fsync до возврата (режим сохранения ``safe``)
+    """
+    record: dict[str, Any] = {
+        "ts": datetime.now(UTC).isoformat(),
+        "set": entry.values,
+    }
+    if entry.removed:
+        record["unset"] = list(entry.removed)
+    line = json.dumps(record, ensure_ascii=False)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def read_journal(path: Path) -> tuple[list[JournalEntry], bool]:
+    """Записи журнала по порядку и флаг оборванного хвоста.
+
+    Returns:
+        (записи ``set`` / ``unset``, True — хвост отброшен)
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return [], False
+    entries: list[JournalEntry] = []
+    for line in text.split("\n"):
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return entries, True
+        if not isinstance(record, dict):
+            return entries, True
+        delta = record.get("set")
+        removed = record.get("unset", [])
+        if not isinstance(delta, dict) or not isinstance(removed, list):
+            return entries, True
+        entries.append(JournalEntry(delta, tuple(map(str, removed))))
+    # Запись без перевода строки — запись, прерванная сбоем
+    return entries, bool(text) and not text.endswith("\n")
+
+
+def apply_entry(data: dict[str, Any], entry: JournalEntry) -> None:
+    """Наложить одну запись журнала на словарь сейва (на месте)."""
+    for key in entry.removed:
+        data.pop(key, None)
+    data.update(entry.values)
+
+
+def replay(
+    base: dict[str, Any], entries: list[JournalEntry]
+) -> dict[str, Any]:
+    """Базовый сейв с наложенными записями журнала (новый словарь)."""
+    data = dict(base)
+    for entry in entries:
+        apply_entry(data, entry)
+    return data
@@ -0,0 +1,267 @@
+"""SQLite-бэкенд сохранений персонажей (stdlib ``sqlite3``, WAL).
+
+Одна таблица: индексируемые колонки для списка и поиска (имя, класс,
+уровень, дата создания) и payload — ``Character.to_dict()`` в JSON.
+WAL позволяет читать список, пока другой процесс пишет персонажа.
+
+Вычисляемая колонка ``intact`` (payload — JSON-объект с непустым
+``name``) пересчитывается SQLite при любой записи строки, в том числе
+чужой: список и страница пропускают битые строки и сообщают их slug,
+как JSON-хранилище, не разбирая payload. Payload, который проходит эту
+проверку, но не собирается в ``Character``, виден как битый только при
+загрузке.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from core.character_index import CharacterSummary
+from core.character_store import (
+    CharacterPage,
+    LoadCharactersResult,
+    LoadedCharacter,
+    character_from_payload,
+    map_saves,
+)
+from core.models import Character
+
+SQLITE_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    save_slug TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    class_id TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_ns INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS characters_name ON characters (name);
+CREATE INDEX IF NOT EXISTS characters_class ON characters (class_id);
+CREATE INDEX IF NOT EXISTS characters_level ON characters (level);
+CREATE INDEX IF NOT EXISTS characters_created ON characters (created_at);
+"""
+
+# Добавляется и в старые базы: ALTER TABLE допускает только VIRTUAL
+_INTACT_COLUMN = """
+ALTER TABLE characters ADD COLUMN intact INTEGER GENERATED ALWAYS AS (
+    CASE WHEN json_valid(payload) AND json_type(payload) = 'object'
+    THEN coalesce(json_extract(payload, '$.name'), '') <> ''
+    ELSE 0 END
+) VIRTUAL
+"""
+_INTACT_INDEX = (
+    "CREATE INDEX IF NOT EXISTS characters_intact_created"
+    " ON characters (intact, created_at)"
+)
+
+_UPSERT = """
+INSERT INTO characters
+    (save_slug, name, class_id, level, created_at, updated_ns, payload)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (save_slug) DO UPDATE SET
+    name = excluded.name,
+    class_id = excluded.class_id,
+    level = excluded.level,
+    created_at = excluded.created_at,
+    updated_ns = excluded.updated_ns,
+    payload = excluded.payload
+"""
+
+_SUMMARY_SELECT = (
+    "SELECT save_slug, name, class_id, level, created_at,"
+    " updated_ns, length(payload) FROM characters WHERE intact = 1"
+    " ORDER BY created_at, rowid"
+)
+_CORRUPT_SELECT = (
+    "SELECT save_slug FROM characters WHERE intact = 0"
+    " ORDER BY created_at, rowid"
+)
+
+type _Row = tuple[str, str, str, int, str, int, str]
+
+
+def _row(character: Character) -> _Row:
+    """Строка таблицы для персонажа."""
+    if not character.save_slug:
+        raise ValueError("У персонажа должен быть save_slug")
+    return (
+        character.save_slug,
+        character.name,
+        character.class_id,
+        character.level,
+        character.created_at or "",
+        time.time_ns(),
+        json.dumps(character.to_dict(), ensure_ascii=False),
+    )
+
+
+def _parse_payload(payload: str, save_slug: str) -> LoadedCharacter:
+    """Персонаж из payload; битый JSON — (None, save_slug)."""
+    try:
+        data: Any = json.loads(payload)
+    except ValueError:
+        return None, save_slug
+    if not isinstance(data, dict):
+        return None, save_slug
+    return character_from_payload(data, save_slug)
+
+
+def _parse_row(row: tuple[str, str]) -> LoadedCharacter:
+    """Разбор строки (save_slug, payload)."""
+    save_slug, payload = row
+    return _parse_payload(payload, save_slug)
+
+
+class SqliteCharacterStore:
+    """Персонажи в одной базе SQLite (WAL)."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._durable = False
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+            columns = {
+                row[1]
+                for row in self._conn.execute("PRAGMA table_xinfo(characters)")
+            }
+            if "intact" not in columns:
+                self._conn.execute(_INTACT_COLUMN)
+            self._conn.execute(_INTACT_INDEX)
+            self._conn.execute(f"PRAGMA user_version={SQLITE_SCHEMA_VERSION}")
+
+    def set_durable(self, durable: bool) -> None:
+        """synchronous=FULL (режим ``safe``) или NORMAL (``fast``)."""
+        if durable == self._durable:
+            return
+        with self._lock:
+            level = "FULL" if durable else "NORMAL"
+            self._conn.execute(f"PRAGMA synchronous={level}")
+            self._durable = durable
+
+    def close(self) -> None:
+        """Закрыть соединение."""
+        with self._lock:
+            self._conn.close()
+
+    def save(self, character: Character) -> None:
+        """Записать персонажа (upsert по save_slug)."""
+        row = _row(character)
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT, row)
+
+    def save_many(self, characters: Iterable[Character]) -> int:
+        """Записать пачку персонажей одной транзакцией."""
+        rows = [_row(character) for character in characters]
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def load(self, save_slug: str) -> Character | None:
+        """Один персонаж по save_slug."""
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT payload FROM characters WHERE save_slug = ?",
+                (save_slug,),
+            ).fetchone()
+        if found is None:
+            return None
+        character, _label = _parse_payload(found[0], save_slug)
+        return character
+
+    def iter_characters(self, workers: int = 1) -> Iterator[LoadedCharacter]:
+        """Персонажи по created_at; payload разбирается пулом потоков."""
+        with self._lock:
+            rows: list[tuple[str, str]] = self._conn.execute(
+                "SELECT save_slug, payload FROM characters"
+                " ORDER BY created_at, rowid"
+            ).fetchall()
+        return map_saves(_parse_row, rows, workers)
+
+    def load_all(self, workers: int = 1) -> LoadCharactersResult:
+        """Все персонажи по created_at и подписи битых payload."""
+        characters: list[Character] = []
+        corrupt: list[str] = []
+        for character, label in self.iter_characters(workers):
+            if character is not None:
+                characters.append(character)
+            elif label is not None:
+                corrupt.append(label)
+        return LoadCharactersResult(
+            characters=tuple(characters), corrupt_save_warnings=tuple(corrupt)
+        )
+
+    def summaries(self) -> tuple[CharacterSummary, ...]:
+        """Сводки целых строк из колонок (payload не разбирается)."""
+        with self._lock:
+            rows = self._conn.execute(_SUMMARY_SELECT).fetchall()
+        return tuple(CharacterSummary(*row) for row in rows)
+
+    def page(self, offset: int, limit: int) -> CharacterPage:
+        """Страница целых сводок (LIMIT/OFFSET по индексу) и битые slug."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"{_SUMMARY_SELECT} LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+            (total,) = self._conn.execute(
+                "SELECT count(*) FROM characters WHERE intact = 1"
+            ).fetchone()
+            corrupt = self._conn.execute(_CORRUPT_SELECT).fetchall()
+        return CharacterPage(
+            summaries=tuple(CharacterSummary(*row) for row in rows),
+            total=total,
+            offset=offset,
+            corrupt_save_warnings=tuple(row[0] for row in corrupt),
+        )
+
+    def slugs(self) -> set[str]:
+        """Все save_slug в базе."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT save_slug FROM characters"
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def delete(self, save_slug: str) -> bool:
+        """Удалить персонажа по save_slug."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM characters WHERE save_slug = ?", (save_slug,)
+            )
+        return cursor.rowcount > 0
+
+    def delete_all(self) -> int:
+        """Удалить всех персонажей."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM characters")
+        return cursor.rowcount
+
+
+_OPEN_STORES: dict[Path, SqliteCharacterStore] = {}
+
+
+def open_sqlite_store(path: Path) -> SqliteCharacterStore:
+    """Хранилище SQLite по пути (одно соединение на файл в процессе)."""
+    key = path.resolve()
+    store = _OPEN_STORES.get(key)
+    if store is None:
+        store = _OPEN_STORES[key] = SqliteCharacterStore(path)
+    return store
+
+
+def close_sqlite_stores() -> None:
+    """Закрыть все открытые базы (тесты, выход)."""
+    for store in _OPEN_STORES.values():
+        store.close()
+    _OPEN_STORES.clear()
@@ -1,63 +1,129 @@
-"""Сохранение и загрузка персонажей в JSON."""
+"""Сохранение и загрузка персонажей: JSON-бэкенд и выбор хранилища.
+
+Публичные функции (``save_character``, ``load_characters``, …) работают
+с активным хранилищем (``set_storage_backend``): JSON-файлы в
+``saves/characters/`` или SQLite ``saves/characters.sqlite3``.
+
+Режим сохранения (``set_durability_mode``): ``safe`` — каждая запись
+атомарна и доведена до диска (fsync); ``fast`` — ``update_character``
+сливает повторные записи одного персонажа в одну (``WriteCoalescer``).
+
+JSON-бэкенд пишет обновления существующего персонажа в журнал полей
+(``core.character_journal``) и сворачивает его в базовый файл.
+
+Несколько процессов игры на одной папке ``saves/`` согласуются через
+``core.save_locks``: бронь save_slug, блокировка записи персонажа и
+блокировка папки для правки индекса.
+
+Файлы персонажей лежат плоско или по шардам (``core.save_layout``);
+``migrate_save_layout`` переносит папку между раскладками на ходу.
+
+Давно не менявшихся персонажей ``archive_cold_characters`` упаковывает
+в сжатые бандлы (``core.save_archive``). Список и загрузка видят их как
+обычных; загрузка одного персонажа возвращает его в файл, а файл
+важнее архивной записи.
+"""
 
 import logging
-from dataclasses import dataclass
+import os
+import shutil
+import time
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from core.character_index import (
+    INDEX_FILE_NAME,
+    CharacterSummary,
+    corrupt_summary,
+    index_path,
+    read_index,
+    summary_from_character,
+    write_index,
+)
+from core.character_journal import (
+    JOURNAL_COMPACT_AFTER,
+    JOURNAL_SUFFIX,
+    JournalEntry,
+    append_entry,
+    apply_entry,
+    field_delta,
+    journal_path,
+    read_journal,
+    removed_fields,
+    replay,
+)
+from core.character_sqlite import open_sqlite_store
+from core.character_store import (
+    CharacterPage,
+    CharacterStore,
+    LoadCharactersResult,
+    LoadedCharacter,
+    character_from_payload,
+    copy_characters,
+    map_saves,
+)
+from core.classes import get_class_hit_dice
 from core.io import load_json, save_json
 from core.levels import clamp_level
-from core.models import Character
-from core.progression import max_hp_for_level
+from core.models import Character, CompactCharacter, SharedIds
+from core.progression import max_hp_for_level, roll_hp_history
+from core.save_archive import (
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    archive_dir,
+    iter_payloads,
+    read_archive,
+    read_payload,
+    write_archive,
+    write_bundle,
+)
+from core.save_layout import (
+    character_path,
+    iter_save_files,
+    layout_path,
+    move_save,
+    remove_empty_shards,
+    write_layout,
+)
+from core.save_locks import (
+    character_lock,
+    directory_lock,
+    release_save_slug,
+    remove_character_lock,
+    reserve_save_slug,
+    reserved_save_slugs,
+)
 from core.slug import make_save_slug
 from core.stats import STANDARD_ARRAY, generate_stats_standard_array
 from core.subclasses import start_level_for_difficulty
-from core.types import GameDifficulty, StatMap
+from core.types import (
+    DurabilityMode,
+    GameDifficulty,
+    SaveLayout,
+    StatMap,
+    StorageBackend,
+)
+from core.write_coalescer import WriteCoalescer, WriteStats
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
-class LoadCharactersResult:
-    """Результат загрузки персонажей и предупреждений о битых сейвах."""
-
-    characters: tuple[Character, ...]
-    corrupt_save_warnings: tuple[str, ...] = ()
-
-    @classmethod
-    def empty(cls) -> "LoadCharactersResult":
-        """Пустой результат без персонажей и предупреждений."""
-        return cls(characters=())
-
-
-def _corrupt_label_from_data(data: dict[str, Any], path: Path) -> str:
-    """Имя персонажа из JSON или save_slug, если имя недоступно."""
-    name = data.get("name")
-    if isinstance(name, str) and name.strip():
-        return name.strip()
-    return path.stem
-
-
 def _try_load_character_file(
     path: Path,
 ) -> tuple[Character | None, str | None]:
-    """Загрузить персонажа; при битом сейве — (None, подпись)."""
+    """Загрузить персонажа (база + журнал); битый сейв — (None, подпись)."""
     if not path.exists():
         return None, None
     try:
         if path.stat().st_size == 0:
             return None, path.stem
         data = load_json(path)
-        if not data.get("name"):
-            return None, path.stem
-        try:
-            character = Character.from_dict(data)
-        except (ValueError, TypeError):
-            return None, _corrupt_label_from_data(data, path)
-        if not character.save_slug:
-            character.save_slug = path.stem
-        return character, None
+        journal = journal_path(path)
+        if journal.exists():
+            entries, _torn = read_journal(journal)
+            data = replay(data, entries)
+        return character_from_payload(data, path.stem)
     except OSError:
         return None, path.stem
 
@@ -143,6 +209,10 @@ def save_character(
         if skills is None:
             skills = list(grants.skill_ids)
 
+    # HardCore: броски хранятся в персонаже, а не перебрасываются
+    hp_rolls: list[int] = []
+    if difficulty == "hardcore":
+        hp_rolls = roll_hp_history(get_class_hit_dice(class_id), level)
     hp = max_hp_for_level(
         class_id,
         stats,
@@ -151,6 +221,7 @@ def save_character(
         race_id,
         subrace_id,
         feat_ids,
+        hp_rolls=hp_rolls,
     )
 
     character = Character(
@@ -182,57 +253,323 @@ def save_character(
         feat_ids=list(feat_ids) if feat_ids else [],
         feat_choices=dict(feat_choices) if feat_choices else {},
         asi_choices=dict(asi_choices) if asi_choices else {},
+        hp_rolls=hp_rolls,
         class_features_applied=class_features_applied,
         save_slug=_unique_save_slug(name),
         created_at=datetime.now(UTC).isoformat(),
     )
 
-    _save_character_file(character)
+    try:
+        _WRITES.write(character)
+    finally:
+        # Сейв на диске (или создание не удалось) — бронь больше не нужна
+        release_save_slug(CHARACTERS_DIR, character.save_slug or "")
 
     return character
 
 
 def update_character(character: Character) -> None:
-    """Обновить существующего персонажа в JSON."""
+    """Обновить существующего персонажа.
+
+    В режиме ``fast`` запись откладывается: повторные обновления того
+    же персонажа до сброса очереди сливаются в одну.
+    """
     character.level = clamp_level(character.level)
-    _save_character_file(character)
+    if _durability_mode == "fast" and character.save_slug:
+        _WRITES.submit(character.save_slug, character)
+    else:
+        _WRITES.write(character)
+
+
+def update_characters(characters: Iterable[Character]) -> int:
+    """Записать пачку изменённых персонажей одним вызовом хранилища.
+
+    Отложенные записи режима ``fast`` сбрасываются заранее: они старше
+    пачки и не должны её перезаписать. SQLite пишет пачку одной
+    транзакцией, JSON — полными сейвами без журнала.
+
+    Returns:
+        Число записанных персонажей
+    """
+    flush_character_writes()
+    batch = []
+    for character in characters:
+        if not character.save_slug:
+            raise ValueError("У персонажа должен быть save_slug")
+        character.level = clamp_level(character.level)
+        batch.append(character)
+    return character_store().save_many(batch)
 
 
 SAVES_DIR = Path("saves")
 CHARACTERS_DIR = SAVES_DIR / "characters"
+CHARACTERS_DB = SAVES_DIR / "characters.sqlite3"
 CHARACTERS_SCHEMA_VERSION = 1
+DEFAULT_STORAGE_BACKEND: StorageBackend = "json"
+DEFAULT_DURABILITY_MODE: DurabilityMode = "safe"
+DEFAULT_LOAD_WORKERS = 1
 
+_storage_backend: StorageBackend = DEFAULT_STORAGE_BACKEND
+_durability_mode: DurabilityMode = DEFAULT_DURABILITY_MODE
+_load_workers = DEFAULT_LOAD_WORKERS
 
-def _existing_save_slugs() -> set[str]:
-    """Собрать save_slug из имён файлов и содержимого JSON."""
-    slugs: set[str] = set()
+
+def _character_paths() -> list[Path]:
+    """JSON-файлы персонажей (без файла индекса)."""
+    return [
+        path
+        for path in iter_save_files(CHARACTERS_DIR, ".json")
+        if path.name != INDEX_FILE_NAME
+    ]
+
+
+def _journal_file_stat(path: Path) -> os.stat_result | None:
+    """stat журнала персонажа; журнала нет — None."""
+    try:
+        return journal_path(path).stat()
+    except OSError:
+        return None
+
+
+def _summary_for_file(
+    path: Path, stat: os.stat_result
+) -> tuple[Character | None, CharacterSummary | None]:
+    """Разобрать сейв: персонаж и его запись индекса (None — файла нет)."""
+    # Отпечаток журнала — до чтения: дописанное позже перечитается
+    journal = _journal_file_stat(path)
+    character, corrupt_label = _try_load_character_file(path)
+    if character is not None:
+        return character, summary_from_character(character, stat, journal)
+    if corrupt_label is not None:
+        return None, corrupt_summary(corrupt_label, stat, journal)
+    return None, None
+
+
+def refresh_character_index() -> dict[str, CharacterSummary]:
+    """Сверить индекс с папкой сохранений и починить расхождения.
+
+    Файл с прежними (mtime_ns, размер) базы и журнала не открывается;
+    новый или изменённый — перечитывается, исчезнувший — выпадает из
+    индекса.
+
+    Returns:
+        Записи индекса по имени файла (без .json)
+    """
     if not CHARACTERS_DIR.exists():
-        return slugs
+        return {}
+    indexed = read_index(CHARACTERS_DIR)
+    # stat журнала — только у персонажей, у которых он есть
+    journaled = _journaled_stems()
+    entries: dict[str, CharacterSummary] = {}
+    for path in _character_paths():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        journal = _journal_file_stat(path) if path.stem in journaled else None
+        summary = indexed.get(path.stem)
+        if summary is None or not summary.matches(stat, journal):
+            _character, summary = _summary_for_file(path, stat)
+        if summary is not None:
+            entries[path.stem] = summary
+    _write_index_if_unchanged(indexed, entries)
+    return entries
+
+
+def _write_index_if_unchanged(
+    base: dict[str, CharacterSummary], entries: dict[str, CharacterSummary]
+) -> None:
+    """Записать починенный индекс под блокировкой папки.
+
+    Разбор идёт без блокировки; если индекс успел поменяться после
+    чтения base, его писал другой процесс — чужая запись свежее, наша
+    не пишется (следующая сверка дочинит).
+    """
+    if entries == base:
+        return
+    with directory_lock(CHARACTERS_DIR):
+        if read_index(CHARACTERS_DIR) == base:
+            write_index(CHARACTERS_DIR, entries)
+
+
+def _listed_summaries() -> list[CharacterSummary]:
+    """Записи индекса файлов и сводки архива (файл важнее архива)."""
+    entries = refresh_character_index()
+    archived = [
+        entry.summary
+        for slug, entry in read_archive(CHARACTERS_DIR).items()
+        if slug not in entries
+    ]
+    return [*entries.values(), *archived]
+
+
+def _json_summaries() -> tuple[CharacterSummary, ...]:
+    """Сводки целых JSON-сохранений и архива (старые → новые)."""
+    return _sorted_summaries(_listed_summaries())
+
+
+def _sorted_summaries(
+    entries: Iterable[CharacterSummary],
+) -> tuple[CharacterSummary, ...]:
+    """Целые сохранения по дате создания."""
+    summaries = [summary for summary in entries if not summary.corrupt]
+    summaries.sort(key=lambda summary: summary.created_timestamp)
+    return tuple(summaries)
+
+
+def _json_page(offset: int, limit: int) -> CharacterPage:
+    """Страница сводок из индекса; битые сейвы — в предупреждениях."""
+    entries = _listed_summaries()
+    summaries = _sorted_summaries(entries)
+    return CharacterPage(
+        summaries=summaries[offset : offset + limit],
+        total=len(summaries),
+        offset=offset,
+        corrupt_save_warnings=tuple(
+            summary.name for summary in entries if summary.corrupt
+        ),
+    )
+
 
-    for path in CHARACTERS_DIR.glob("*.json"):
-        slugs.add(path.stem)
-        character = _load_character_file(path)
-        if character is not None and character.save_slug:
-            slugs.add(character.save_slug)
+def _existing_save_slugs() -> set[str]:
+    """Занятые save_slug: имена файлов, slug из индекса и архива.
+
+    JSON персонажей читается, только если в индексе нет части файлов.
+    """
+    if not CHARACTERS_DIR.exists():
+        return set()
+    slugs = {path.stem for path in _character_paths()}
+    slugs.update(read_archive(CHARACTERS_DIR))
+    indexed = read_index(CHARACTERS_DIR)
+    if not slugs <= indexed.keys():
+        indexed = refresh_character_index()
+    slugs.update(
+        summary.save_slug for summary in indexed.values() if summary.save_slug
+    )
     return slugs
 
 
 def _unique_save_slug(name: str) -> str:
-    """Уникальный save_slug для нового персонажа."""
+    """Уникальный save_slug для нового персонажа, забронированный.
+
+    Выбор идёт под блокировкой папки с учётом броней других процессов;
+    бронь снимает ``save_character`` после записи сейва.
+    """
     base = make_save_slug(name)
-    existing = _existing_save_slugs()
-    if base not in existing:
-        return base
+    with directory_lock(CHARACTERS_DIR):
+        existing = character_store().slugs() | reserved_save_slugs(
+            CHARACTERS_DIR
+        )
+        slug = base
+        counter = 2
+        while slug in existing:
+            slug = f"{base}_{counter}"
+            counter += 1
+        reserve_save_slug(CHARACTERS_DIR, slug)
+    return slug
+
+
+def _index_saved_file(path: Path, character: Character) -> None:
+    """Обновить запись индекса после записи сейва (если она изменилась)."""
+    summary = summary_from_character(
+        character, path.stat(), _journal_file_stat(path)
+    )
+    with directory_lock(CHARACTERS_DIR):
+        entries = read_index(CHARACTERS_DIR)
+        if entries.get(path.stem) == summary:
+            return
+        entries[path.stem] = summary
+        write_index(CHARACTERS_DIR, entries)
+
+
+def _journaled_stems() -> set[str]:
+    """Имена персонажей (без суффикса), у которых есть журнал."""
+    return {
+        path.stem for path in iter_save_files(CHARACTERS_DIR, JOURNAL_SUFFIX)
+    }
+
 
-    counter = 2
-    while f"{base}_{counter}" in existing:
-        counter += 1
-    return f"{base}_{counter}"
+type _JournalStamp = tuple[int, int, int]
+
+# Путь базы → (отпечаток базы и журнала, сохранённый словарь, записей)
+_journal_states: dict[Path, tuple[_JournalStamp, dict[str, Any], int]] = {}
+
+
+def _journal_stamp(path: Path) -> _JournalStamp | None:
+    """(mtime_ns, размер) базового JSON и размер журнала; None — нет базы."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    try:
+        journal_size = journal_path(path).stat().st_size
+    except OSError:
+        journal_size = 0
+    return stat.st_mtime_ns, stat.st_size, journal_size
+
+
+def _persisted_state(path: Path) -> tuple[dict[str, Any], int] | None:
+    """Состояние на диске (база + журнал) и число записей журнала.
+
+    None — писать полный сейв: базы нет, она битая или журнал оборван.
+    """
+    stamp = _journal_stamp(path)
+    if stamp is None:
+        return None
+    cached = _journal_states.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+    base = load_json(path)
+    entries, torn = read_journal(journal_path(path))
+    if torn or not base.get("name"):
+        return None
+    return replay(base, entries), len(entries)
+
+
+def _journal_character(character: Character) -> None:
+    """Записать изменённые поля в журнал персонажа.
+
+    Новый персонаж, битая база, оборванный журнал и журнал из
+    ``JOURNAL_COMPACT_AFTER`` записей — полный сейв (сворачивание).
+    """
+    if not character.save_slug:
+        raise ValueError("У персонажа должен быть save_slug")
+    with character_lock(CHARACTERS_DIR, character.save_slug):
+        _journal_character_locked(character, character.save_slug)
+
+
+def _journal_character_locked(character: Character, save_slug: str) -> None:
+    """Журнал персонажа под его блокировкой записи."""
+    path = _character_file_path(save_slug)
+    state = _persisted_state(path)
+    if state is None or state[1] + 1 >= JOURNAL_COMPACT_AFTER:
+        _save_character_file(character)
+        return
+    persisted, count = state
+    # Как в базовом файле: иначе schema_version считался бы удалённым
+    after = {
+        "schema_version": CHARACTERS_SCHEMA_VERSION,
+        **character.to_dict(),
+    }
+    entry = JournalEntry(
+        field_delta(persisted, after), removed_fields(persisted, after)
+    )
+    if entry.values or entry.removed:
+        append_entry(
+            journal_path(path), entry, durable=_durability_mode == "safe"
+        )
+        persisted = dict(persisted)
+        apply_entry(persisted, entry)
+        count += 1
+        _index_saved_file(path, character)
+    stamp = _journal_stamp(path)
+    if stamp is not None:
+        _journal_states[path] = (stamp, persisted, count)
 
 
 def _character_file_path(save_slug: str) -> Path:
-    """Путь к JSON-файлу персонажа."""
-    return CHARACTERS_DIR / f"{save_slug}.json"
+    """Путь к JSON-файлу персонажа (плоская раскладка или шард)."""
+    return character_path(CHARACTERS_DIR, save_slug)
 
 
 def _save_character_file(character: Character) -> None:
@@ -240,15 +577,59 @@ def _save_character_file(character: Character) -> None:
     if not character.save_slug:
         raise ValueError("У персонажа должен быть save_slug")
 
-    CHARACTERS_DIR.mkdir(parents=True, exist_ok=True)
     path = _character_file_path(character.save_slug)
-    save_json(
-        path,
-        {
-            "schema_version": CHARACTERS_SCHEMA_VERSION,
-            **character.to_dict(),
-        },
-    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "schema_version": CHARACTERS_SCHEMA_VERSION,
+        **character.to_dict(),
+    }
+    with character_lock(CHARACTERS_DIR, character.save_slug):
+        save_json(path, data, durable=_durability_mode == "safe")
+        # Журнал удаляется после записи базы: сбой между шагами безопасен,
+        # повторное наложение значений на новую базу ничего не меняет
+        journal_path(path).unlink(missing_ok=True)
+        stamp = _journal_stamp(path)
+        if stamp is not None:
+            _journal_states[path] = (stamp, data, 0)
+        _index_saved_file(path, character)
+
+
+def _unarchive(save_slug: str) -> bool:
+    """Снять архивную запись персонажа. False — её не было."""
+    if save_slug not in read_archive(CHARACTERS_DIR):
+        return False
+    with directory_lock(CHARACTERS_DIR):
+        entries = read_archive(CHARACTERS_DIR)
+        if entries.pop(save_slug, None) is None:
+            return False
+        write_archive(
+            CHARACTERS_DIR, entries, durable=_durability_mode == "safe"
+        )
+    return True
+
+
+def _rehydrate_character(save_slug: str) -> Character | None:
+    """Вернуть персонажа из архива в файл и загрузить его.
+
+    Архивная запись остаётся до следующей упаковки: файл важнее неё.
+    """
+    with character_lock(CHARACTERS_DIR, save_slug):
+        path = _character_file_path(save_slug)
+        if path.exists():
+            # Другой процесс уже вернул персонажа
+            return _load_character_file(path)
+        entry = read_archive(CHARACTERS_DIR).get(save_slug)
+        if entry is None:
+            return None
+        try:
+            data = read_payload(CHARACTERS_DIR, entry)
+        except (OSError, ValueError) as exc:
+            logger.warning("Битая запись архива персонажа: %s", exc)
+            return None
+        character, _corrupt_label = character_from_payload(data, save_slug)
+        if character is not None:
+            _save_character_file(character)
+        return character
 
 
 def _load_character_file(path: Path) -> Character | None:
@@ -257,33 +638,71 @@ def _load_character_file(path: Path) -> Character | None:
     return character
 
 
-def _character_created_at_timestamp(character: Character, path: Path) -> float:
-    """Метка времени создания: из JSON или mtime для старых сохранений."""
-    if character.created_at:
-        try:
-            return datetime.fromisoformat(character.created_at).timestamp()
-        except ValueError:
-            pass
-    return path.stat().st_mtime
+type _ParsedSave = tuple[Path, Character | None, CharacterSummary | None]
+
+
+def _parse_save(path: Path) -> _ParsedSave:
+    """Разобрать файл сейва (в потоке пула при workers > 1)."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return path, None, None
+    character, summary = _summary_for_file(path, stat)
+    return path, character, summary
 
 
-def load_characters() -> LoadCharactersResult:
-    """Загрузить всех сохранённых персонажей (старые → новые) и битые сейвы."""
+def _iter_json_saves(
+    workers: int,
+) -> Iterator[tuple[Character | None, CharacterSummary]]:
+    """Сейвы в порядке файлов по мере разбора.
+
+    Попутно чинит индекс сохранений: stat каждого файла уже известен
+    (только если поток дочитан до конца).
+    """
     if not CHARACTERS_DIR.exists():
-        return LoadCharactersResult.empty()
+        return
+    indexed = read_index(CHARACTERS_DIR)
+    summaries: dict[str, CharacterSummary] = {}
+    for path, character, summary in map_saves(
+        _parse_save, _character_paths(), workers
+    ):
+        if summary is None:
+            continue
+        summaries[path.stem] = summary
+        if character is None:
+            logger.warning("Битый файл сохранения персонажа: %s", path)
+        yield character, summary
+    _write_index_if_unchanged(indexed, summaries)
+    # Архивные персонажи читаются без возврата в файлы
+    archived = {
+        save_slug: entry
+        for save_slug, entry in read_archive(CHARACTERS_DIR).items()
+        if save_slug not in summaries
+    }
+    for save_slug, data in iter_payloads(CHARACTERS_DIR, archived):
+        character = None
+        if data is not None:
+            character, _corrupt_label = character_from_payload(data, save_slug)
+        if character is None:
+            logger.warning("Битая запись архива персонажа: %s", save_slug)
+        yield character, archived[save_slug].summary
+
 
+def _iter_json_characters(workers: int = 1) -> Iterator[LoadedCharacter]:
+    """Поток JSON-сохранений без сортировки."""
+    for character, summary in _iter_json_saves(workers):
+        yield character, None if character is not None else summary.name
+
+
+def _load_json_characters(workers: int = 1) -> LoadCharactersResult:
+    """Все JSON-сохранения (старые → новые) и подписи битых."""
     entries: list[tuple[float, Character]] = []
     corrupt_labels: list[str] = []
-    for path in CHARACTERS_DIR.glob("*.json"):
-        character, corrupt_label = _try_load_character_file(path)
+    for character, summary in _iter_json_saves(workers):
         if character is not None:
-            entries.append(
-                (_character_created_at_timestamp(character, path), character)
-            )
-        elif corrupt_label is not None:
-            logger.warning("Битый файл сохранения персонажа: %s", path)
-            corrupt_labels.append(corrupt_label)
-
+            entries.append((summary.created_timestamp, character))
+        else:
+            corrupt_labels.append(summary.name)
     entries.sort(key=lambda item: item[0])
     return LoadCharactersResult(
         characters=tuple(character for _, character in entries),
@@ -291,22 +710,383 @@ def load_characters() -> LoadCharactersResult:
     )
 
 
-def delete_character(save_slug: str) -> bool:
-    """Удалить JSON-файл персонажа. False, если файла нет."""
+def _delete_json_character(save_slug: str) -> bool:
+    """Удалить JSON-файл или архивную запись. False, если их нет."""
     path = _character_file_path(save_slug)
-    if not path.exists():
-        return False
-    path.unlink()
+    with character_lock(CHARACTERS_DIR, save_slug):
+        archived = _unarchive(save_slug)
+        if not path.exists():
+            if archived:
+                remove_character_lock(CHARACTERS_DIR, save_slug)
+            return archived
+        path.unlink()
+        journal_path(path).unlink(missing_ok=True)
+        _journal_states.pop(path, None)
+        with directory_lock(CHARACTERS_DIR):
+            entries = read_index(CHARACTERS_DIR)
+            if entries.pop(save_slug, None) is not None:
+                write_index(CHARACTERS_DIR, entries)
+        remove_character_lock(CHARACTERS_DIR, save_slug)
     return True
 
 
-def delete_all_characters() -> int:
-    """Удалить всех персонажей. Возвращает число удалённых файлов."""
+def _delete_all_json_characters() -> int:
+    """Удалить все JSON-сохранения. Возвращает число удалённых файлов."""
     if not CHARACTERS_DIR.exists():
         return 0
 
     deleted = 0
-    for path in CHARACTERS_DIR.glob("*.json"):
-        path.unlink()
-        deleted += 1
-    return deleted
+    with directory_lock(CHARACTERS_DIR):
+        archived = set(read_archive(CHARACTERS_DIR))
+        for path in _character_paths():
+            path.unlink(missing_ok=True)
+            journal_path(path).unlink(missing_ok=True)
+            archived.discard(path.stem)
+            deleted += 1
+        _journal_states.clear()
+        index_path(CHARACTERS_DIR).unlink(missing_ok=True)
+        shutil.rmtree(archive_dir(CHARACTERS_DIR), ignore_errors=True)
+        remove_empty_shards(CHARACTERS_DIR)
+    return deleted + len(archived)
+
+
+def compact_character_journals() -> int:
+    """Свернуть журналы в базовые JSON; число свёрнутых персонажей."""
+    if not CHARACTERS_DIR.exists():
+        return 0
+    compacted = 0
+    for journal in list(iter_save_files(CHARACTERS_DIR, JOURNAL_SUFFIX)):
+        path = journal.with_suffix(".json")
+        if not path.exists():
+            # Персонаж удалён, журнал остался после сбоя
+            journal.unlink(missing_ok=True)
+            continue
+        # Чтение и перезапись — под блокировкой: другой процесс может
+        # дописывать журнал того же персонажа
+        with character_lock(CHARACTERS_DIR, path.stem):
+            character = _load_character_file(path)
+            if character is not None:
+                _save_character_file(character)
+                compacted += 1
+    return compacted
+
+
+def migrate_save_layout(layout: SaveLayout) -> int:
+    """Перенести JSON-сейвы в раскладку layout, не останавливая игру.
+
+    Сначала меняется ``.layout`` (новые сейвы сразу идут в новую
+    раскладку), затем каждый персонаж переносится под своей блокировкой
+    записи. Другие процессы продолжают читать и писать: поиск файла
+    прозрачен для обеих раскладок. Повторный запуск доделывает
+    прерванный перенос.
+
+    Returns:
+        Число перенесённых персонажей
+    """
+    flush_character_writes()
+    with directory_lock(CHARACTERS_DIR):
+        write_layout(CHARACTERS_DIR, layout)
+    if not CHARACTERS_DIR.exists():
+        return 0
+    moved = 0
+    for path in _character_paths():
+        target = layout_path(CHARACTERS_DIR, path.stem, layout)
+        if path == target:
+            continue
+        with character_lock(CHARACTERS_DIR, path.stem):
+            if not path.exists():
+                continue
+            move_save(path, target, JOURNAL_SUFFIX)
+            _journal_states.pop(path, None)
+            moved += 1
+    if layout == "flat":
+        remove_empty_shards(CHARACTERS_DIR)
+    return moved
+
+
+def _last_write_ns(path: Path) -> int:
+    """Время последней записи персонажа: база или её журнал.
+
+    Raises:
+        OSError: Файла персонажа нет
+    """
+    latest = path.stat().st_mtime_ns
+    try:
+        return max(latest, journal_path(path).stat().st_mtime_ns)
+    except OSError:
+        return latest
+
+
+def archive_cold_characters(days: int = DEFAULT_ARCHIVE_AFTER_DAYS) -> int:
+    """Упаковать персонажей, не менявшихся days дней, в архивный бандл.
+
+    Сначала бандл и индекс архива, затем файлы удаляются под
+    блокировкой записи каждого персонажа — только если персонаж не
+    менялся с момента чтения; иначе его архивная запись снимается.
+    Сбой на любом шаге оставляет персонажа в файле или в архиве.
+    Битые сейвы не архивируются; записи персонажей, уже вернувшихся
+    в файлы, снимаются.
+
+    Returns:
+        Число персонажей, перенесённых в архив
+    """
+    flush_character_writes()
+    if not CHARACTERS_DIR.exists():
+        return 0
+    cutoff = time.time_ns() - days * 86_400 * 1_000_000_000
+    durable = _durability_mode == "safe"
+    records: dict[str, tuple[dict[str, Any], CharacterSummary]] = {}
+    stamps: dict[str, tuple[Path, _JournalStamp]] = {}
+    for path in _character_paths():
+        try:
+            if _last_write_ns(path) >= cutoff:
+                continue
+        except OSError:
+            continue
+        with character_lock(CHARACTERS_DIR, path.stem):
+            stamp = _journal_stamp(path)
+            character = _load_character_file(path)
+            if stamp is None or character is None:
+                continue
+            records[path.stem] = (
+                {
+                    "schema_version": CHARACTERS_SCHEMA_VERSION,
+                    **character.to_dict(),
+                },
+                summary_from_character(character, path.stat()),
+            )
+            stamps[path.stem] = (path, stamp)
+    if records:
+        bundled = write_bundle(CHARACTERS_DIR, records, durable=durable)
+    else:
+        bundled = {}
+    with directory_lock(CHARACTERS_DIR):
+        entries = read_archive(CHARACTERS_DIR)
+        hot = {path.stem for path in _character_paths()} - stamps.keys()
+        if not bundled and not hot & entries.keys():
+            return 0
+        entries = {
+            slug: entry for slug, entry in entries.items() if slug not in hot
+        }
+        entries.update(bundled)
+        write_archive(CHARACTERS_DIR, entries, durable=durable)
+
+    archived: list[str] = []
+    changed: list[str] = []
+    for save_slug, (path, stamp) in stamps.items():
+        with character_lock(CHARACTERS_DIR, save_slug):
+            if _journal_stamp(path) != stamp:
+                changed.append(save_slug)
+                continue
+            path.unlink()
+            journal_path(path).unlink(missing_ok=True)
+            _journal_states.pop(path, None)
+            remove_character_lock(CHARACTERS_DIR, save_slug)
+            archived.append(save_slug)
+    with directory_lock(CHARACTERS_DIR):
+        index = read_index(CHARACTERS_DIR)
+        for save_slug in archived:
+            index.pop(save_slug, None)
+        write_index(CHARACTERS_DIR, index)
+        if changed:
+            entries = read_archive(CHARACTERS_DIR)
+            for save_slug in changed:
+                entries.pop(save_slug, None)
+            write_archive(CHARACTERS_DIR, entries, durable=durable)
+    remove_empty_shards(CHARACTERS_DIR)
+    return len(archived)
+
+
+class JsonCharacterStore:
+    """Бэкенд JSON: файл на персонажа в ``CHARACTERS_DIR`` + индекс."""
+
+    def save(self, character: Character) -> None:
+        """Записать персонажа: новый — файлом, существующий — в журнал."""
+        _journal_character(character)
+
+    def save_many(self, characters: Iterable[Character]) -> int:
+        """Записать персонажей по одному файлу."""
+        count = 0
+        for character in characters:
+            _save_character_file(character)
+            count += 1
+        return count
+
+    def load(self, save_slug: str) -> Character | None:
+        """Персонаж из его JSON-файла или из архива (с возвратом в файл)."""
+        path = _character_file_path(save_slug)
+        if path.exists():
+            return _load_character_file(path)
+        return _rehydrate_character(save_slug)
+
+    def load_all(self, workers: int = 1) -> LoadCharactersResult:
+        """Все JSON-сохранения."""
+        return _load_json_characters(workers)
+
+    def iter_characters(self, workers: int = 1) -> Iterator[LoadedCharacter]:
+        """Поток JSON-сохранений."""
+        return _iter_json_characters(workers)
+
+    def summaries(self) -> tuple[CharacterSummary, ...]:
+        """Сводки из индекса."""
+        return _json_summaries()
+
+    def page(self, offset: int, limit: int) -> CharacterPage:
+        """Страница сводок из индекса."""
+        return _json_page(offset, limit)
+
+    def slugs(self) -> set[str]:
+        """Имена файлов, save_slug из индекса и архива."""
+        return _existing_save_slugs()
+
+    def delete(self, save_slug: str) -> bool:
+        """Удалить JSON-файл или архивную запись персонажа."""
+        return _delete_json_character(save_slug)
+
+    def delete_all(self) -> int:
+        """Удалить все JSON-сохранения."""
+        return _delete_all_json_characters()
+
+
+def _write_character(character: Character) -> None:
+    """Записать персонажа в активное хранилище (через очередь записей)."""
+    character_store().save(character)
+
+
+_WRITES: WriteCoalescer[str, Character] = WriteCoalescer(_write_character)
+
+
+def flush_character_writes() -> int:
+    """Записать отложенные обновления персонажей; число записей."""
+    return _WRITES.flush()
+
+
+def character_write_stats() -> WriteStats:
+    """Счётчики записей: выполненные и слитые в режиме ``fast``."""
+    return _WRITES.stats
+
+
+def close_character_storage() -> None:
+    """Выход из игры: записать отложенное и свернуть журналы.
+
+    Регистрируется в ``atexit`` точкой входа после настройки хранилища:
+    импорт модуля не трогает папку сохранений.
+    """
+    flush_character_writes()
+    try:
+        compact_character_journals()
+    except OSError as exc:
+        logger.warning("Журналы персонажей не свёрнуты: %s", exc)
+
+
+def set_durability_mode(mode: DurabilityMode) -> None:
+    """Выбрать режим сохранения (из настроек ``durability``)."""
+    global _durability_mode
+    if mode != "fast":
+        flush_character_writes()
+    _durability_mode = mode
+
+
+def set_storage_backend(backend: StorageBackend) -> None:
+    """Выбрать активное хранилище (из настроек ``storage``)."""
+    global _storage_backend
+    # Отложенные записи принадлежат прежнему хранилищу
+    flush_character_writes()
+    _storage_backend = backend
+
+
+def character_store(backend: StorageBackend | None = None) -> CharacterStore:
+    """Хранилище персонажей: указанное или активное."""
+    if (backend or _storage_backend) == "sqlite":
+        store = open_sqlite_store(CHARACTERS_DB)
+        store.set_durable(_durability_mode == "safe")
+        return store
+    return JsonCharacterStore()
+
+
+def transfer_characters(source: StorageBackend, target: StorageBackend) -> int:
+    """Bulk-перенос персонажей между хранилищами (импорт/экспорт).
+
+    Returns:
+        Число перенесённых персонажей
+    """
+    flush_character_writes()
+    return copy_characters(character_store(source), character_store(target))
+
+
+def load_characters(workers: int | None = None) -> LoadCharactersResult:
+    """Загрузить всех сохранённых персонажей (старые → новые) и битые сейвы.
+
+    Args:
+        workers: Потоков разбора (None — ``set_load_workers``, 1 — без пула)
+    """
+    flush_character_writes()
+    return character_store().load_all(workers or _load_workers)
+
+
+def iter_characters(workers: int | None = None) -> Iterator[LoadedCharacter]:
+    """Персонажи потоком по мере разбора, без сортировки и без списка.
+
+    Каждый элемент — (персонаж, None) или (None, подпись битого сейва),
+    как в ``LoadCharactersResult.corrupt_save_warnings``.
+    """
+    flush_character_writes()
+    return character_store().iter_characters(workers or _load_workers)
+
+
+def set_load_workers(workers: int) -> None:
+    """Число потоков разбора сейвов по умолчанию (1 — без пула)."""
+    global _load_workers
+    _load_workers = max(1, workers)
+
+
+def list_character_summaries() -> tuple[CharacterSummary, ...]:
+    """Сводки сохранений без разбора персонажей (старые → новые)."""
+    flush_character_writes()
+    return character_store().summaries()
+
+
+def compact_characters(
+    workers: int | None = None,
+) -> tuple[CompactCharacter, ...]:
+    """Все целые персонажи в компактном виде (аналитика, сервер).
+
+    Поток без общего списка полных Character: в памяти одновременно
+    только компактные копии. Битые сейвы пропускаются. Таблица общих
+    кортежей id живёт только на время вызова.
+    """
+    shared: SharedIds = {}
+    return tuple(
+        CompactCharacter.from_character(character, shared)
+        for character, _label in iter_characters(workers)
+        if character is not None
+    )
+
+
+def list_character_page(offset: int, limit: int) -> CharacterPage:
+    """Сводки одной страницы списка и общее число персонажей.
+
+    Args:
+        offset: Сколько персонажей пропустить (старые → новые)
+        limit: Размер страницы
+    """
+    flush_character_writes()
+    return character_store().page(offset, limit)
+
+
+def load_character(save_slug: str) -> Character | None:
+    """Полный персонаж по save_slug (выбор из списка); битый — None."""
+    flush_character_writes()
+    return character_store().load(save_slug)
+
+
+def delete_character(save_slug: str) -> bool:
+    """Удалить персонажа. False, если его нет."""
+    _WRITES.discard(save_slug)
+    return character_store().delete(save_slug)
+
+
+def delete_all_characters() -> int:
+    """Удалить всех персонажей. Возвращает число удалённых."""
+    _WRITES.discard()
+    return character_store().delete_all()
@@ -0,0 +1,171 @@
+"""Интерфейс хранилища персонажей и общий разбор сохранений.
+
+Бэкенды: JSON-файлы (``core.character_storage.JsonCharacterStore``) и
+SQLite (``core.character_sqlite.SqliteCharacterStore``). Активный
+выбирается в настройках (``storage``); ``copy_characters`` переносит
+персонажей между любыми двумя.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from core.character_index import CharacterSummary
+from core.models import Character
+
+# Сейвов на одну задачу пула: меньше future на 100k файлов
+LOAD_BATCH_SIZE = 256
+
+type LoadedCharacter = tuple[Character | None, str | None]
+
+
+@dataclass(frozen=True)
+class LoadCharactersResult:
+    """Результат загрузки персонажей и предупреждений о битых сейвах."""
+
+    characters: tuple[Character, ...]
+    corrupt_save_warnings: tuple[str, ...] = ()
+
+    @classmethod
+    def empty(cls) -> "LoadCharactersResult":
+        """Пустой результат без персонажей и предупреждений."""
+        return cls(characters=())
+
+
+@dataclass(frozen=True)
+class CharacterPage:
+    """Страница сводок для списка персонажей (старые → новые)."""
+
+    summaries: tuple[CharacterSummary, ...]
+    total: int
+    offset: int
+    corrupt_save_warnings: tuple[str, ...] = ()
+
+
+def _corrupt_label(data: dict[str, Any], fallback: str) -> str:
+    """Имя персонажа из сохранения или save_slug, если имя недоступно."""
+    name = data.get("name")
+    if isinstance(name, str) and name.strip():
+        return name.strip()
+    return fallback
+
+
+def character_from_payload(
+    data: dict[str, Any], fallback_slug: str
+) -> tuple[Character | None, str | None]:
+    """Персонаж из словаря сохранения; при битом — (None, подпись).
+
+    Args:
+        data: Содержимое сохранения (``Character.to_dict()``)
+        fallback_slug: save_slug по месту хранения (имя файла, ключ)
+    """
+    if not data.get("name"):
+        return None, fallback_slug
+    try:
+        character = Character.from_dict(data)
+    except (ValueError, TypeError):
+        return None, _corrupt_label(data, fallback_slug)
+    if not character.save_slug:
+        character.save_slug = fallback_slug
+    return character, None
+
+
+def _map_batch[T, R](parse: Callable[[T], R], batch: Sequence[T]) -> list[R]:
+    """Разобрать пачку сейвов в потоке пула."""
+    return [parse(item) for item in batch]
+
+
+def map_saves[T, R](
+    parse: Callable[[T], R], items: Sequence[T], workers: int = 1
+) -> Iterator[R]:
+    """Разбор сейвов по порядку: последовательно или пулом потоков.
+
+    Пул получает пачки по ``LOAD_BATCH_SIZE``; результаты отдаются по
+    мере готовности, порядок items сохраняется. Генератор можно бросить
+    на середине: ещё не начатые пачки отменяются.
+
+    Args:
+        parse: Разбор одного сейва
+        items: Пути или строки хранилища
+        workers: Потоков пула (1 — без пула)
+    """
+    if workers <= 1 or len(items) <= LOAD_BATCH_SIZE:
+        yield from map(parse, items)
+        return
+    batches = [
+        items[start : start + LOAD_BATCH_SIZE]
+        for start in range(0, len(items), LOAD_BATCH_SIZE)
+    ]
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="load-saves"
+    )
+    # Окно из 2×workers пачек: поток не копит весь каталог в памяти
+    pending: deque[Future[list[R]]] = deque()
+    try:
+        for batch in batches:
+            pending.append(executor.submit(_map_batch, parse, batch))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Брошенный поток не ждёт разбора оставшихся пачек
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class CharacterStore(Protocol):
+    """Бэкенд сохранений персонажей."""
+
+    def save(self, character: Character) -> None:
+        """Записать персонажа (по ``save_slug``)."""
+        ...
+
+    def save_many(self, characters: Iterable[Character]) -> int:
+        """Записать пачку персонажей; число записанных."""
+        ...
+
+    def load(self, save_slug: str) -> Character | None:
+        """Один персонаж; нет или битый — None."""
+        ...
+
+    def load_all(self, workers: int = 1) -> LoadCharactersResult:
+        """Все персонажи (старые → новые) и подписи битых сейвов."""
+        ...
+
+    def iter_characters(self, workers: int = 1) -> Iterator[LoadedCharacter]:
+        """Поток (персонаж, None) / (None, подпись битого) без сортировки."""
+        ...
+
+    def summaries(self) -> tuple[CharacterSummary, ...]:
+        """Сводки целых сохранений (старые → новые) без разбора payload."""
+        ...
+
+    def page(self, offset: int, limit: int) -> CharacterPage:
+        """Сводки [offset, offset + limit) и общее число персонажей."""
+        ...
+
+    def slugs(self) -> set[str]:
+        """Занятые save_slug."""
+        ...
+
+    def delete(self, save_slug: str) -> bool:
+        """Удалить персонажа; False, если его нет."""
+        ...
+
+    def delete_all(self) -> int:
+        """Удалить всех; число удалённых."""
+        ...
+
+
+def copy_characters(source: CharacterStore, target: CharacterStore) -> int:
+    """Перенести всех целых персонажей из source в target.
+
+    Совпадающие save_slug в target перезаписываются; битые сейвы
+    source не переносятся.
+
+    Returns:
+        Число перенесённых персонажей
+    """
+    return target.save_many(source.load_all().characters)
@@ -1,18 +1,34 @@
 """Загрузка классов персонажей из YAML."""
 
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import (
+    catalog_projection,
+    compiled_catalog,
+    declare_catalog,
+    get_catalog,
+)
+from core.catalog_models import (
+    DEFAULT_HIT_DICE,
+    DEFAULT_SUBCLASS_CHOICE_LEVEL,
+    ClassDef,
+    compile_classes,
+    progression_grants,
+)
 from core.localization import resolve_localized_text
 
 CLASSES_FILE = Path("database/classes/classes.yaml")
-DEFAULT_SUBCLASS_CHOICE_LEVEL = 3
+
+declare_catalog("classes", CLASSES_FILE, "classes", compiler=compile_classes)
 
 
 def _load_classes_yaml() -> dict[str, Any]:
     """Загрузить данные классов из YAML."""
-    return load_catalog(CLASSES_FILE, "classes")
+    return get_catalog("classes")
 
 
 def get_class_dict(class_id: str) -> dict[str, Any]:
@@ -21,44 +37,13 @@ def get_class_dict(class_id: str) -> dict[str, Any]:
     return info if isinstance(info, dict) else {}
 
 
-def _grants_from_progression(
-    entity: dict[str, Any],
-    *,
-    max_level: int | None = None,
-) -> list[dict[str, Any]]:
-    """Grants из progression.<level>.grants с полем level."""
-    progression = entity.get("progression", {})
-    if not isinstance(progression, dict):
-        return []
-    result: list[dict[str, Any]] = []
-    for level_key, level_data in progression.items():
-        try:
-            level = int(level_key)
-        except (TypeError, ValueError):
-            continue
-        if max_level is not None and level > max_level:
-            continue
-        if not isinstance(level_data, dict):
-            continue
-        raw_grants = level_data.get("grants", [])
-        if not isinstance(raw_grants, list):
-            continue
-        for grant in raw_grants:
-            if not isinstance(grant, dict):
-                continue
-            entry = dict(grant)
-            entry["level"] = level
-            result.append(entry)
-    return result
-
-
 def iter_class_grants(
     class_info: dict[str, Any],
     *,
     max_level: int | None = None,
 ) -> list[dict[str, Any]]:
     """Все grants класса из progression."""
-    return _grants_from_progression(class_info, max_level=max_level)
+    return progression_grants(class_info, max_level=max_level)
 
 
 def grants_at_level(
@@ -84,22 +69,24 @@ def grants_at_level(
     return result
 
 
+def get_class_def(class_id: str) -> ClassDef | None:
+    """Скомпилированный класс или None."""
+    classes: Mapping[str, ClassDef] = compiled_catalog("classes")
+    return classes.get(class_id)
+
+
 def get_class_hit_dice(class_id: str) -> int:
     """Получить кость здоровья класса."""
-    hit_dice = get_class_dict(class_id).get("hit_dice", 8)
-    if isinstance(hit_dice, int):
-        return hit_dice
-    return 8
+    class_def = get_class_def(class_id)
+    return class_def.hit_dice if class_def else DEFAULT_HIT_DICE
 
 
 def get_subclass_choice_level(class_id: str) -> int:
     """Уровень класса, на котором выбирается подкласс (PHB / YAML)."""
-    level = get_class_dict(class_id).get(
-        "subclass_choice_level", DEFAULT_SUBCLASS_CHOICE_LEVEL
-    )
-    if isinstance(level, int):
-        return level
-    return DEFAULT_SUBCLASS_CHOICE_LEVEL
+    class_def = get_class_def(class_id)
+    if class_def is None:
+        return DEFAULT_SUBCLASS_CHOICE_LEVEL
+    return class_def.subclass_choice_level
 
 
 def get_subclass_dict(
@@ -116,18 +103,6 @@ def get_subclass_dict(
     return None
 
 
-def _spellcasting_from_entry(
-    entry: dict[str, Any], level: int, default_start: int
-) -> bool:
-    """Есть ли заклинания у класса/подкласса на данном уровне."""
-    if not entry.get("spellcasting"):
-        return False
-    start = entry.get("spellcasting_level", default_start)
-    if not isinstance(start, int):
-        start = default_start
-    return level >= start
-
-
 def character_has_spellcasting(
     class_id: str, subclass_id: str | None, level: int
 ) -> bool:
@@ -136,18 +111,18 @@ def character_has_spellcasting(
     Данные — поля ``spellcasting`` / ``spellcasting_level`` в
     ``database/classes/classes.yaml`` (PHB: «Использование заклинаний»).
     """
-    class_info = get_class_dict(class_id)
-    if not class_info:
+    class_def = get_class_def(class_id)
+    if class_def is None:
         return False
-    if _spellcasting_from_entry(class_info, level, 1):
+    start = class_def.spellcasting_level
+    if start is not None and level >= start:
         return True
     if not subclass_id:
         return False
-    subclass = get_subclass_dict(class_id, subclass_id)
-    if subclass is None:
+    subclass = class_def.subclasses.get(subclass_id)
+    if subclass is None or subclass.spellcasting_level is None:
         return False
-    choice_level = get_subclass_choice_level(class_id)
-    return _spellcasting_from_entry(subclass, level, choice_level)
+    return level >= subclass.spellcasting_level
 
 
 def _subclass_feature_ids_and_names(
@@ -210,22 +185,33 @@ def _normalize_class_dict(
     }
 
 
-def load_classes(language: str = "ru") -> list[dict[str, Any]]:
-    """Загрузить список всех доступных классов."""
-    result: list[dict[str, Any]] = []
+def _class_rows(language: str) -> tuple[Mapping[str, Any], ...]:
+    """Строки списка классов на языке (read-only)."""
+    rows: list[Mapping[str, Any]] = []
     for class_id, class_info in _load_classes_yaml().items():
         if isinstance(class_info, dict):
             normalized = _normalize_class_dict(class_id, class_info, language)
-            result.append(
-                {
-                    "id": normalized["id"],
-                    "name": normalized["name"],
-                    "description": normalized["description"],
-                    "hit_dice": normalized["hit_dice"],
-                    "prime_ability": normalized["prime_ability"],
-                }
+            rows.append(
+                MappingProxyType(
+                    {
+                        "id": normalized["id"],
+                        "name": normalized["name"],
+                        "description": normalized["description"],
+                        "hit_dice": normalized["hit_dice"],
+                        "prime_ability": normalized["prime_ability"],
+                    }
+                )
             )
-    return result
+    return tuple(rows)
+
+
+def load_classes(language: str = "ru") -> list[Mapping[str, Any]]:
+    """Загрузить список всех доступных классов (кэш по языку)."""
+    return list(
+        catalog_projection(
+            ("classes",), ("rows", language), partial(_class_rows, language)
+        )
+    )
 
 
 def load_class_full(class_id: str, language: str = "ru") -> dict[str, Any]:
@@ -3,11 +3,13 @@
 from pathlib import Path
 from typing import Any
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import declare_catalog, get_catalog
 from core.levels import clamp_level
 
 CONSTANTS_FILE = Path("database/core/constants.yaml")
 
+declare_catalog("constants", CONSTANTS_FILE, "constants")
+
 # Fallback если YAML недоступен
 _DEFAULT_PROFICIENCY_BONUS: dict[int, int] = {
     1: 2,
@@ -35,7 +37,7 @@ _DEFAULT_PROFICIENCY_BONUS: dict[int, int] = {
 
 def _load_constants() -> dict[str, Any]:
     """Загрузить блок constants из YAML."""
-    return load_catalog(CONSTANTS_FILE, "constants")
+    return get_catalog("constants")
 
 
 def proficiency_bonus(level: int) -> int:
@@ -0,0 +1,317 @@
+"""Точные распределения выражений кубиков — без выборки.
+
+Распределение — целочисленные веса исходов над общим знаменателем,
+поэтому вероятности, среднее и дисперсия точны (``Fraction``):
+
+- одна кость (с перебросом и взрывом, как в ``core.dice_expr``)
+  строится один раз на (грани, переброс, взрыв);
+- сумма N костей — свёртка степеней удвоением, каждая степень
+  кэшируется: ``8d6`` переиспользует ``4d6`` и ``2d6``;
+- keep/drop (``4d6kh3``, ``1d20 adv``) — динамика по значениям граней
+  от лучшего к худшему: сколько костей выпало на грань и сколько из них
+  попало в сумму;
+- группы выражения сворачиваются между собой, константа сдвигает
+  результат.
+
+Распределение выражения кэшируется по строке (``dice_distribution``).
+
+Взрыв при броске ограничен ``EXPLODE_LIMIT`` доп. костей, но цепочка
+распределения обрывается раньше — когда вероятность дойти до
+следующей кости не больше 2⁻⁶⁴ (``EXPLODE_TAIL_BITS``): d6 — 25 костей,
+d20 — 15. Исходы до обрыва точны, масса хвоста остаётся на последней
+кости; ошибка вероятностей ниже точности float.
+
+Стоимость растёт с числом костей и граней: группа, оценка работы
+которой больше ``MAX_KEEP_WORK`` (динамика keep — ``20d20!kh10``) или
+``MAX_SUM_WORK`` (свёртка больших целых — ``1000d20``), отклоняется
+``DiceExpressionError``, а не считается минутами. Бросок такого
+выражения по-прежнему работает.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from math import ceil, comb, gcd, log2
+
+from core.dice_expr import (
+    EXPLODE_LIMIT,
+    DiceExpressionError,
+    DiceGroup,
+    DicePlan,
+    compile_dice,
+)
+
+# Вероятность хвоста взрыва, которой можно пренебречь: 2 ** -bits
+EXPLODE_TAIL_BITS = 64
+# Пределы оценки работы группы: расчёт на пределе — порядка 1–2 с
+# Динамика keep/drop: грани × состояния × раскладки
+MAX_KEEP_WORK = 10_000_000
+# Свёртки: длина² × биты весов
+MAX_SUM_WORK = 10_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class DiceDistribution:
+    """Распределение суммы: weights[i] — вес исхода minimum + i."""
+
+    minimum: int
+    weights: tuple[int, ...]
+    total: int
+
+    @property
+    def maximum(self) -> int:
+        """Наибольший возможный результат."""
+        return self.minimum + len(self.weights) - 1
+
+    def probability(self, value: int) -> Fraction:
+        """Вероятность ровно value."""
+        index = value - self.minimum
+        if not 0 <= index < len(self.weights):
+            return Fraction(0)
+        return Fraction(self.weights[index], self.total)
+
+    def at_least(self, value: int) -> Fraction:
+        """Вероятность результата не меньше value."""
+        start = max(0, value - self.minimum)
+        return Fraction(sum(self.weights[start:]), self.total)
+
+    def table(self) -> list[tuple[int, Fraction]]:
+        """Таблица «результат → вероятность» без невозможных исходов."""
+        return [
+            (self.minimum + index, Fraction(weight, self.total))
+            for index, weight in enumerate(self.weights)
+            if weight
+        ]
+
+    @property
+    def mean(self) -> Fraction:
+        """Математическое ожидание."""
+        first = sum(
+            (self.minimum + index) * weight
+            for index, weight in enumerate(self.weights)
+        )
+        return Fraction(first, self.total)
+
+    @property
+    def variance(self) -> Fraction:
+        """Дисперсия: E[X²] − E[X]²."""
+        second = sum(
+            (self.minimum + index) ** 2 * weight
+            for index, weight in enumerate(self.weights)
+        )
+        return Fraction(second, self.total) - self.mean**2
+
+    def percentile(self, fraction: float | Fraction) -> int:
+        """Наименьший результат, не превышаемый с вероятностью fraction.
+
+        Raises:
+            ValueError: fraction вне [0, 1]
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"Перцентиль вне [0, 1]: {fraction}")
+        threshold = Fraction(fraction) * self.total
+        running = 0
+        for index, weight in enumerate(self.weights):
+            running += weight
+            if weight and running >= threshold:
+                return self.minimum + index
+        return self.maximum
+
+
+def _point(value: int) -> DiceDistribution:
+    """Распределение константы."""
+    return DiceDistribution(value, (1,), 1)
+
+
+def _reduced(minimum: int, weights: list[int], total: int) -> DiceDistribution:
+    """Распределение без нулевых краёв и с сокращённым знаменателем."""
+    start = next(index for index, weight in enumerate(weights) if weight)
+    end = len(weights)
+    while not weights[end - 1]:
+        end -= 1
+    trimmed = weights[start:end]
+    divisor = gcd(total, *trimmed)
+    return DiceDistribution(
+        minimum + start,
+        tuple(weight // divisor for weight in trimmed),
+        total // divisor,
+    )
+
+
+def _convolve(
+    left: DiceDistribution, right: DiceDistribution
+) -> DiceDistribution:
+    """Распределение суммы двух независимых величин."""
+    weights = [0] * (len(left.weights) + len(right.weights) - 1)
+    for i, a in enumerate(left.weights):
+        if not a:
+            continue
+        for j, b in enumerate(right.weights):
+            weights[i + j] += a * b
+    return _reduced(
+        left.minimum + right.minimum, weights, left.total * right.total
+    )
+
+
+def _negated(dist: DiceDistribution) -> DiceDistribution:
+    """Распределение −X."""
+    return DiceDistribution(-dist.maximum, dist.weights[::-1], dist.total)
+
+
+def _explode_depth(sides: int) -> int:
+    """Доп. костей в цепочке: до хвоста вероятностью ≤ 2⁻⁶⁴."""
+    return min(EXPLODE_LIMIT, ceil(EXPLODE_TAIL_BITS / log2(sides)))
+
+
+def _explode_chain(sides: int) -> DiceDistribution:
+    """Сумма доп. костей взрыва: бросаются, пока выпадает максимум."""
+    # С конца цепочки: последняя доп. кость уже не взрывается
+    chain = DiceDistribution(1, (1,) * sides, sides)
+    for _ in range(_explode_depth(sides) - 1):
+        weights = [chain.total] * (sides - 1) + [0] * (chain.maximum + 1)
+        for index, weight in enumerate(chain.weights):
+            weights[sides - 1 + chain.minimum + index] += weight
+        chain = _reduced(1, weights, sides * chain.total)
+    return chain
+
+
+@lru_cache(maxsize=256)
+def _die(sides: int, reroll_at_most: int, explode: bool) -> DiceDistribution:
+    """Одна кость: переброс не выше reroll_at_most, затем взрыв."""
+    # Переброс один раз: P(v) = [v > r]/s + (r/s)·(1/s)
+    weights = [
+        (sides if value > reroll_at_most else 0) + reroll_at_most
+        for value in range(1, sides + 1)
+    ]
+    die = _reduced(1, weights, sides * sides)
+    if not explode:
+        return die
+    chain = _explode_chain(sides)
+    top = die.weights[-1]
+    exploded = [0] * (sides - 1 + chain.maximum + 1)
+    for index, weight in enumerate(die.weights[:-1]):
+        exploded[die.minimum + index - 1] = weight * chain.total
+    for index, weight in enumerate(chain.weights):
+        exploded[sides - 1 + chain.minimum + index] += top * weight
+    return _reduced(1, exploded, die.total * chain.total)
+
+
+@lru_cache(maxsize=1024)
+def _dice_sum(
+    count: int, sides: int, reroll_at_most: int, explode: bool
+) -> DiceDistribution:
+    """Сумма count костей: свёртка степеней удвоением (с кэшем)."""
+    die = _die(sides, reroll_at_most, explode)
+    if count == 1:
+        return die
+    half = _dice_sum(count // 2, sides, reroll_at_most, explode)
+    result = _convolve(half, half)
+    return _convolve(result, die) if count % 2 else result
+
+
+@lru_cache(maxsize=256)
+def _kept_sum(
+    count: int,
+    sides: int,
+    reroll_at_most: int,
+    explode: bool,
+    keep: int,
+    keep_highest: bool,
+) -> DiceDistribution:
+    """Сумма keep лучших (или худших) из count костей."""
+    die = _die(sides, reroll_at_most, explode)
+    faces = [
+        (die.minimum + index, weight)
+        for index, weight in enumerate(die.weights)
+        if weight
+    ]
+    faces.sort(reverse=keep_highest)
+    # Вес граней, ещё не разобранных динамикой
+    suffix = [die.total]
+    for _value, weight in faces:
+        suffix.append(suffix[-1] - weight)
+    # (костей разложено, сумма оставленных) → вес
+    states: dict[tuple[int, int], int] = {(0, 0): 1}
+    sums: defaultdict[int, int] = defaultdict(int)
+    for position, (value, weight) in enumerate(faces):
+        step: defaultdict[tuple[int, int], int] = defaultdict(int)
+        for (placed, kept), state_weight in states.items():
+            remaining = count - placed
+            if placed >= keep:
+                # Сумма набрана: остальные кости — любые из оставшихся граней
+                sums[kept] += state_weight * suffix[position] ** remaining
+                continue
+            for same in range(remaining + 1):
+                taken = min(same, keep - placed)
+                step[(placed + same, kept + value * taken)] += (
+                    state_weight * comb(remaining, same) * weight**same
+                )
+        states = step
+    for (placed, kept), weight in states.items():
+        if placed == count:
+            sums[kept] += weight
+    low = min(sums)
+    weights = [0] * (max(sums) - low + 1)
+    for kept, weight in sums.items():
+        weights[kept - low] = weight
+    return _reduced(low, weights, die.total**count)
+
+
+def _too_costly(group: DiceGroup) -> bool:
+    """Оценка работы группы выше предела (keep или свёртка)."""
+    die = _die(group.sides, group.reroll_at_most, group.explode)
+    faces = len(die.weights)
+    if group.keep:
+        states = (group.count + 1) * group.keep * die.maximum
+        return faces * states * (group.count + 1) // 2 > MAX_KEEP_WORK
+    support = group.count * faces
+    bits = group.count * die.total.bit_length()
+    return support * support * bits > MAX_SUM_WORK
+
+
+def _group_distribution(group: DiceGroup) -> DiceDistribution:
+    """Распределение вклада одной группы костей (со знаком).
+
+    Raises:
+        DiceExpressionError: Оценка работы выше ``MAX_KEEP_WORK`` /
+            ``MAX_SUM_WORK``
+    """
+    if _too_costly(group):
+        raise DiceExpressionError(
+            f"Распределение слишком дорогое для точного расчёта:"
+            f" {group.count}d{group.sides}"
+        )
+    if group.keep:
+        dist = _kept_sum(
+            group.count,
+            group.sides,
+            group.reroll_at_most,
+            group.explode,
+            group.keep,
+            group.keep_highest,
+        )
+    else:
+        dist = _dice_sum(
+            group.count, group.sides, group.reroll_at_most, group.explode
+        )
+    return dist if group.sign > 0 else _negated(dist)
+
+
+def plan_distribution(plan: DicePlan) -> DiceDistribution:
+    """Точное распределение скомпилированного плана."""
+    result = _point(plan.modifier)
+    for group in plan.groups:
+        result = _convolve(result, _group_distribution(group))
+    return result
+
+
+@lru_cache(maxsize=256)
+def dice_distribution(expression: str) -> DiceDistribution:
+    """Точное распределение выражения кубиков (кэш по строке).
+
+    Raises:
+        DiceExpressionError: Выражение не разобрано или слишком дорогое
+            для точного расчёта
+    """
+    return plan_distribution(compile_dice(expression))
@@ -0,0 +1,307 @@
+"""Выражения кубиков: «2d6+3», «1d20 adv», «4d6kh3», «8d6 fire».
+
+Грамматика (регистр и пробелы не важны)::
+
+    выражение := слагаемое (("+" | "-") слагаемое)* [режим] [тип урона]
+    слагаемое := число | [N]d(S | %) модификатор*
+    модификатор := khN | klN | kN | dhN | dlN | rN | !
+    режим := adv | advantage | dis | disadvantage
+
+- ``kh``/``k`` — оставить N лучших, ``kl`` — N худших; ``dl``/``dh`` —
+  отбросить N худших/лучших (сводятся к keep);
+- ``rN`` — один переброс кости, выпавшей не выше N (Great Weapon
+  Fighting — ``2d6r2``);
+- ``!`` — взрыв: максимум граней добавляет ещё кость (не больше
+  ``EXPLODE_LIMIT`` на кость); при keep взорванная кость считается
+  одной суммой;
+- ``adv``/``dis`` — одиночная кость бросается дважды, берётся лучшая
+  или худшая (``1d20 adv`` = ``2d20kh1``);
+- последнее слово — тип урона, на бросок не влияет.
+
+Строка разбирается один раз: ``compile_dice`` кэширует план броска
+(``DicePlan``). Группа без keep/переброса/взрыва бросается одним
+вызовом ``choices`` на все кости; ``roll_many`` тянет кости сразу на
+всю серию бросков.
+"""
+
+import random
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import batched
+from typing import Protocol
+
+MAX_DICE = 1000
+MAX_SIDES = 1000
+EXPLODE_LIMIT = 100
+
+_TERM = re.compile(r"\s*([+-])?\s*(?:(\d*)d(\d+|%)([a-z0-9!]*)|(\d+))")
+_MODIFIER = re.compile(r"(kh|kl|k|dh|dl|r)(\d+)|(!)")
+_WORD = re.compile(r"[a-z_]+")
+_ADVANTAGE = frozenset({"adv", "advantage"})
+_DISADVANTAGE = frozenset({"dis", "disadvantage"})
+
+
+class DiceExpressionError(ValueError):
+    """Выражение кубиков не разобрано или вне допустимых границ."""
+
+
+@dataclass(frozen=True, slots=True)
+class DiceGroup:
+    """Группа одинаковых костей: NdS с модификаторами."""
+
+    count: int
+    sides: int
+    sign: int = 1
+    # 0 — в сумму идут все кости
+    keep: int = 0
+    keep_highest: bool = True
+    reroll_at_most: int = 0
+    explode: bool = False
+    # Грани 1..sides и признак быстрого пути — считаются при создании
+    faces: range = field(init=False, repr=False, compare=False)
+    simple: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "faces", range(1, self.sides + 1))
+        object.__setattr__(
+            self,
+            "simple",
+            not (self.keep or self.reroll_at_most or self.explode),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DicePlan:
+    """Скомпилированное выражение: группы костей и константа."""
+
+    expression: str
+    groups: tuple[DiceGroup, ...]
+    modifier: int = 0
+    damage_type: str | None = None
+
+
+def _apply_modifiers(
+    count: int, sides: int, sign: int, text: str, expression: str
+) -> DiceGroup:
+    """Группа костей с модификаторами keep/drop, переброса и взрыва."""
+    keep = 0
+    keep_highest = True
+    reroll = 0
+    explode = False
+    pos = 0
+    while pos < len(text):
+        match = _MODIFIER.match(text, pos)
+        if match is None:
+            raise DiceExpressionError(
+                f"Неизвестный модификатор кубиков: {expression!r}"
+            )
+        pos = match.end()
+        if match.group(3):
+            if explode or sides < 2:
+                raise DiceExpressionError(
+                    f"Взрыв нужен один раз и на d2+: {expression!r}"
+                )
+            explode = True
+            continue
+        kind, value = match.group(1), int(match.group(2))
+        if kind == "r":
+            if reroll or not 1 <= value < sides:
+                raise DiceExpressionError(
+                    f"Переброс: один раз, 1 ≤ N < граней: {expression!r}"
+                )
+            reroll = value
+            continue
+        if keep:
+            raise DiceExpressionError(
+                f"keep/drop указан дважды: {expression!r}"
+            )
+        if kind in ("dl", "dh"):
+            if not 1 <= value < count:
+                raise DiceExpressionError(
+                    f"Отбросить можно от 1 до N-1 костей: {expression!r}"
+                )
+            keep, keep_highest = count - value, kind == "dl"
+        else:
+            if not 1 <= value <= count:
+                raise DiceExpressionError(
+                    f"Оставить можно от 1 до N костей: {expression!r}"
+                )
+            keep, keep_highest = value, kind != "kl"
+    if keep == count:
+        keep = 0
+    return DiceGroup(count, sides, sign, keep, keep_highest, reroll, explode)
+
+
+def _with_advantage(
+    groups: list[DiceGroup], advantage: bool, expression: str
+) -> list[DiceGroup]:
+    """Преимущество/помеха: одиночная кость бросается дважды."""
+    if len(groups) != 1 or groups[0].count != 1 or groups[0].keep:
+        raise DiceExpressionError(
+            f"Преимущество — только для одной кости: {expression!r}"
+        )
+    group = groups[0]
+    return [
+        DiceGroup(
+            2,
+            group.sides,
+            group.sign,
+            1,
+            advantage,
+            group.reroll_at_most,
+            group.explode,
+        )
+    ]
+
+
+@lru_cache(maxsize=1024)
+def compile_dice(expression: str) -> DicePlan:
+    """Разобрать выражение в план броска (кэш по строке).
+
+    Raises:
+        DiceExpressionError: Синтаксис или границы (кости, грани, keep)
+    """
+    text = expression.strip().lower()
+    groups: list[DiceGroup] = []
+    modifier = 0
+    pos = 0
+    while True:
+        match = _TERM.match(text, pos)
+        if match is None or (pos > 0 and not match.group(1)):
+            break
+        pos = match.end()
+        sign = -1 if match.group(1) == "-" else 1
+        if match.group(5) is not None:
+            modifier += sign * int(match.group(5))
+            continue
+        count = int(match.group(2) or 1)
+        sides = 100 if match.group(3) == "%" else int(match.group(3))
+        if not (1 <= count <= MAX_DICE and 1 <= sides <= MAX_SIDES):
+            raise DiceExpressionError(
+                f"Кости 1..{MAX_DICE}, грани 1..{MAX_SIDES}: {expression!r}"
+            )
+        groups.append(
+            _apply_modifiers(count, sides, sign, match.group(4), expression)
+        )
+    if pos == 0:
+        raise DiceExpressionError(f"Пустое выражение кубиков: {expression!r}")
+    advantage: bool | None = None
+    damage_type: str | None = None
+    for word in text[pos:].split():
+        if not _WORD.fullmatch(word) or damage_type is not None:
+            raise DiceExpressionError(
+                f"Лишний текст в выражении кубиков: {expression!r}"
+            )
+        if word in _ADVANTAGE or word in _DISADVANTAGE:
+            if advantage is not None:
+                raise DiceExpressionError(
+                    f"Режим броска указан дважды: {expression!r}"
+                )
+            advantage = word in _ADVANTAGE
+        else:
+            damage_type = word
+    if advantage is not None:
+        groups = _with_advantage(groups, advantage, expression)
+    return DicePlan(expression, tuple(groups), modifier, damage_type)
+
+
+class _RandomSource(Protocol):
+    """Что нужно броску от источника: ``random.Random`` или модуль."""
+
+    def choices(self, population: Sequence[int], /, *, k: int) -> list[int]:
+        """k граней с возвращением."""
+        ...
+
+    def randrange(self, stop: int, /) -> int:
+        """Целое из [0, stop)."""
+        ...
+
+
+def _rng(rng: random.Random | None) -> _RandomSource:
+    """Источник случайности: переданный или функции модуля random.
+
+    Без rng бросок идёт через ``random.choices`` / ``random.randrange``,
+    как ``core.dice`` через ``random.randint``: действуют
+    ``random.seed`` и подмена функций в тестах.
+    """
+    return rng if rng is not None else random
+
+
+def _roll_die(group: DiceGroup, first: int, rng: _RandomSource) -> int:
+    """Одна кость группы: переброс и взрыв поверх первого броска."""
+    value = first
+    if value <= group.reroll_at_most:
+        value = rng.randrange(group.sides) + 1
+    if group.explode and value == group.sides:
+        for _ in range(EXPLODE_LIMIT):
+            extra = rng.randrange(group.sides) + 1
+            value += extra
+            if extra != group.sides:
+                break
+    return value
+
+
+def _group_total(
+    group: DiceGroup, draws: list[int], rng: _RandomSource
+) -> int:
+    """Сумма группы по уже выпавшим граням."""
+    if group.simple:
+        return sum(draws)
+    values = [_roll_die(group, first, rng) for first in draws]
+    if group.keep:
+        values.sort(reverse=group.keep_highest)
+        values = values[: group.keep]
+    return sum(values)
+
+
+def roll_plan(plan: DicePlan, rng: random.Random | None = None) -> int:
+    """Бросить скомпилированный план: все кости группы — одним вызовом."""
+    source = _rng(rng)
+    total = plan.modifier
+    for group in plan.groups:
+        draws = source.choices(group.faces, k=group.count)
+        total += group.sign * _group_total(group, draws, source)
+    return total
+
+
+def roll_dice(expression: str, rng: random.Random | None = None) -> int:
+    """Бросить выражение кубиков (план берётся из кэша).
+
+    Raises:
+        DiceExpressionError: Выражение не разобрано
+    """
+    return roll_plan(compile_dice(expression), rng)
+
+
+def roll_many(
+    expression: str, times: int, rng: random.Random | None = None
+) -> list[int]:
+    """Серия бросков одного выражения: кости тянутся сразу на всю серию.
+
+    Raises:
+        DiceExpressionError: Выражение не разобрано
+    """
+    if times <= 0:
+        return []
+    plan = compile_dice(expression)
+    source = _rng(rng)
+    totals = [plan.modifier] * times
+    for group in plan.groups:
+        draws = source.choices(group.faces, k=group.count * times)
+        if group.count == 1 and group.simple:
+            sums = draws
+        elif group.simple:
+            sums = list(map(sum, batched(draws, group.count)))
+        else:
+            sums = [
+                _group_total(group, list(chunk), source)
+                for chunk in batched(draws, group.count)
+            ]
+        sign = group.sign
+        totals = [
+            total + sign * value
+            for total, value in zip(totals, sums, strict=True)
+        ]
+    return totals
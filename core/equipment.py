@@ -1,9 +1,25 @@
 """Загрузка каталога снаряжения из YAML."""
 
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import (
+    catalog_entry_views,
+    catalog_projection,
+    compiled_catalog,
+    declare_catalog,
+    get_catalog,
+)
+from core.catalog_models import (
+    ArmorDef,
+    ToolDef,
+    WeaponDef,
+    compile_armor,
+    compile_tools,
+    compile_weapons,
+)
 from core.localization import get_string, resolve_localized_text
 from core.types import StringsDict
 
@@ -12,6 +28,13 @@ ARMOR_FILE = Path("database/equipment/armor.yaml")
 TOOLS_FILE = Path("database/equipment/tools.yaml")
 EQUIPMENT_FILE = Path("database/equipment/equipment.yaml")
 
+declare_catalog("weapons", WEAPONS_FILE, "weapons", compiler=compile_weapons)
+declare_catalog("armor", ARMOR_FILE, "armor", compiler=compile_armor)
+declare_catalog("tools", TOOLS_FILE, "tools", compiler=compile_tools)
+declare_catalog("equipment", EQUIPMENT_FILE, "equipment")
+
+_NO_ITEM: Mapping[str, Any] = MappingProxyType({})
+
 # Пулы инструментов для proficiencies
 TOOL_POOL_CATEGORIES: dict[str, str] = {
     "artisans_tools": "artisans_tools",
@@ -35,19 +58,15 @@ def _item_name(name: Any, language: str, fallback: str) -> str:
 
 
 def _load_weapons() -> dict[str, Any]:
-    return load_catalog(WEAPONS_FILE, "weapons")
+    return get_catalog("weapons")
 
 
 def _load_armor() -> dict[str, Any]:
-    return load_catalog(ARMOR_FILE, "armor")
+    return get_catalog("armor")
 
 
 def _load_tools() -> dict[str, Any]:
-    return load_catalog(TOOLS_FILE, "tools")
-
-
-def _load_equipment_items() -> dict[str, Any]:
-    return load_catalog(EQUIPMENT_FILE, "equipment")
+    return get_catalog("tools")
 
 
 def all_weapon_ids() -> list[str]:
@@ -60,44 +79,60 @@ def all_tool_ids() -> list[str]:
     return sorted(_load_tools().keys())
 
 
-def load_weapon(weapon_id: str) -> dict[str, Any]:
-    """Данные оружия по id."""
-    info = _load_weapons().get(weapon_id, {})
-    return dict(info) if isinstance(info, dict) else {}
+def load_weapon(weapon_id: str) -> Mapping[str, Any]:
+    """Данные оружия по id (read-only вид, без копирования)."""
+    return catalog_entry_views("weapons").get(weapon_id, _NO_ITEM)
+
+
+def load_armor(armor_id: str) -> Mapping[str, Any]:
+    """Данные доспеха по id (read-only вид, без копирования)."""
+    return catalog_entry_views("armor").get(armor_id, _NO_ITEM)
 
 
-def load_armor(armor_id: str) -> dict[str, Any]:
-    """Данные доспеха по id."""
-    info = _load_armor().get(armor_id, {})
-    return dict(info) if isinstance(info, dict) else {}
+def load_tool(tool_id: str) -> Mapping[str, Any]:
+    """Данные инструмента по id (read-only вид, без копирования)."""
+    return catalog_entry_views("tools").get(tool_id, _NO_ITEM)
 
 
-def load_tool(tool_id: str) -> dict[str, Any]:
-    """Данные инструмента по id."""
-    info = _load_tools().get(tool_id, {})
-    return dict(info) if isinstance(info, dict) else {}
+def load_equipment_item(item_id: str) -> Mapping[str, Any]:
+    """Данные предмета снаряжения по id (read-only вид, без копирования)."""
+    return catalog_entry_views("equipment").get(item_id, _NO_ITEM)
 
 
-def load_equipment_item(item_id: str) -> dict[str, Any]:
-    """Данные предмета снаряжения по id."""
-    info = _load_equipment_items().get(item_id, {})
-    return dict(info) if isinstance(info, dict) else {}
+def get_weapon_def(weapon_id: str) -> WeaponDef | None:
+    """Скомпилированное оружие или None."""
+    weapons: Mapping[str, WeaponDef] = compiled_catalog("weapons")
+    return weapons.get(weapon_id)
+
+
+def get_armor_def(armor_id: str) -> ArmorDef | None:
+    """Скомпилированный доспех или None."""
+    armor: Mapping[str, ArmorDef] = compiled_catalog("armor")
+    return armor.get(armor_id)
+
+
+def get_tool_def(tool_id: str) -> ToolDef | None:
+    """Скомпилированный инструмент или None."""
+    tools: Mapping[str, ToolDef] = compiled_catalog("tools")
+    return tools.get(tool_id)
 
 
 def weapon_category(weapon_id: str) -> str:
     """Категория оружия (simple_melee, martial_ranged, …)."""
-    return str(load_weapon(weapon_id).get("category", ""))
+    weapon = get_weapon_def(weapon_id)
+    return weapon.category if weapon else ""
 
 
 def armor_category(armor_id: str) -> str:
     """Категория доспеха (light, medium, heavy) или shield."""
-    cat = load_armor(armor_id).get("category", "")
-    return str(cat)
+    armor = get_armor_def(armor_id)
+    return armor.category if armor else ""
 
 
 def tool_category(tool_id: str) -> str:
     """Категория инструмента."""
-    return str(load_tool(tool_id).get("category", ""))
+    tool = get_tool_def(tool_id)
+    return tool.category if tool else ""
 
 
 def tools_by_category(category: str) -> list[str]:
@@ -120,20 +155,23 @@ def resolve_tool_pool(pool: str) -> list[str]:
 
 def get_weapon_name(weapon_id: str, language: str = "ru") -> str:
     """Локализованное имя оружия."""
-    info = load_weapon(weapon_id)
-    return _item_name(info.get("name", weapon_id), language, weapon_id)
+    weapon = get_weapon_def(weapon_id)
+    name = weapon.name if weapon else weapon_id
+    return _item_name(name, language, weapon_id)
 
 
 def get_armor_name(armor_id: str, language: str = "ru") -> str:
     """Локализованное имя доспеха."""
-    info = load_armor(armor_id)
-    return _item_name(info.get("name", armor_id), language, armor_id)
+    armor = get_armor_def(armor_id)
+    name = armor.name if armor else armor_id
+    return _item_name(name, language, armor_id)
 
 
 def get_tool_name(tool_id: str, language: str = "ru") -> str:
     """Локализованное имя инструмента."""
-    info = load_tool(tool_id)
-    return _item_name(info.get("name", tool_id), language, tool_id)
+    tool = get_tool_def(tool_id)
+    name = tool.name if tool else tool_id
+    return _item_name(name, language, tool_id)
 
 
 def proficiency_token_label(
@@ -148,6 +186,17 @@ def proficiency_token_label(
     tool_label = get_string(strings, f"tools.{token}", default="")
     if tool_label:
         return tool_label
+    labels: dict[str, str] = catalog_projection(
+        ("weapons", "armor", "tools"), ("token_labels", language), dict
+    )
+    label = labels.get(token)
+    if label is None:
+        label = labels[token] = _catalog_token_label(token, language)
+    return label
+
+
+def _catalog_token_label(token: str, language: str) -> str:
+    """Подпись токена по каталогам оружия, доспехов и инструментов."""
     if weapon_category(token):
         return get_weapon_name(token, language)
     if armor_category(token) or token in _load_armor():
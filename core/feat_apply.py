@@ -3,9 +3,9 @@
 from dataclasses import replace
 from typing import Any
 
-from core.feats_loader import load_feat
+from core.feats_loader import get_feat_def
 from core.grant_mechanics import proficiency_tokens_and_skills_from_grant
-from core.hp_bonuses import HpBonusSource, hit_point_bonus_amount
+from core.hp_bonuses import HpBonusSource
 from core.types import StatMap
 
 
@@ -18,19 +18,9 @@ def get_feat_hp_bonus_sources(feat_ids: list[str]) -> list[HpBonusSource]:
     """Бонусы HP за уровень из выбранных черт (имя — название черты)."""
     sources: list[HpBonusSource] = []
     for feat_id in feat_ids:
-        feat = load_feat(feat_id)
-        feat_name = str(feat.get("name", feat_id)).strip() or feat_id
-        raw_grants = feat.get("grants", [])
-        if not isinstance(raw_grants, list):
-            continue
-        for grant in raw_grants:
-            if not isinstance(grant, dict):
-                continue
-            amount = hit_point_bonus_amount(grant)
-            if amount <= 0:
-                continue
-            name = str(grant.get("name", "")).strip() or feat_name
-            sources.append(HpBonusSource(name=name, amount=amount))
+        feat = get_feat_def(feat_id)
+        if feat is not None:
+            sources.extend(feat.hp_bonus_sources)
     return sources
 
 
@@ -38,23 +28,13 @@ def resolve_feat_ability_bonuses(
     feat_id: str, choices: dict[str, Any] | None = None
 ) -> StatMap:
     """Бонусы к характеристикам из черты."""
-    from core.stats import STAT_NAMES
-
-    feat = load_feat(feat_id)
-    choices = choices or {}
-    bonuses: StatMap = {}
-    fixed = feat.get("ability_bonuses", {})
-    if isinstance(fixed, dict):
-        for key, val in fixed.items():
-            if key in STAT_NAMES:
-                bonuses[key] = int(val)
-
-    choice_list = feat.get("ability_bonuses_choice", [])
-    amount = int(feat.get("ability_bonuses_amount", 1))
-    if isinstance(choice_list, list) and choice_list:
-        picked = choices.get("ability")
-        if isinstance(picked, str) and picked in choice_list:
-            bonuses[picked] = bonuses.get(picked, 0) + amount
+    feat = get_feat_def(feat_id)
+    if feat is None:
+        return {}
+    bonuses: StatMap = dict(feat.ability_bonuses)
+    picked = (choices or {}).get("ability")
+    if isinstance(picked, str) and picked in feat.ability_bonuses_choice:
+        bonuses[picked] = bonuses.get(picked, 0) + feat.ability_bonuses_amount
     return bonuses
 
 
@@ -62,18 +42,15 @@ def resolve_feat_grants(
     feat_id: str, choices: dict[str, Any] | None = None
 ) -> tuple[list[str], list[str], list[str], list[str]]:
     """Владения из черты с учётом подвыборов."""
-    feat = load_feat(feat_id)
+    feat = get_feat_def(feat_id)
     choices = choices or {}
     weapons: list[str] = []
     armors: list[str] = []
     tools: list[str] = []
     skills: list[str] = []
-    raw_grants = feat.get("grants", [])
-    if not isinstance(raw_grants, list):
+    if feat is None:
         return weapons, armors, tools, skills
-    for grant in raw_grants:
-        if not isinstance(grant, dict):
-            continue
+    for grant in feat.grants:
         w, a, t, s = proficiency_tokens_and_skills_from_grant(grant, choices)
         weapons.extend(w)
         armors.extend(a)
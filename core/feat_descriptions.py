@@ -1,6 +1,7 @@
 """Текстовые описания черт из YAML."""
 
 import re
+from collections.abc import Mapping
 from typing import Any
 
 _BENEFITS_MARKER = re.compile(
@@ -42,7 +43,7 @@ def feat_benefit_lines_from_full(description_full: str) -> list[str]:
     return lines
 
 
-def feat_summary_description(feat: dict[str, Any]) -> str:
+def feat_summary_description(feat: Mapping[str, Any]) -> str:
     """Краткое описание для списка выбора."""
     short = feat.get("description_short")
     if isinstance(short, str) and short.strip():
@@ -56,7 +57,7 @@ def feat_summary_description(feat: dict[str, Any]) -> str:
     return str(raw).strip()
 
 
-def feat_full_description_lines(feat: dict[str, Any]) -> list[str]:
+def feat_full_description_lines(feat: Mapping[str, Any]) -> list[str]:
     """Строки детального описания (преимущества) для экрана подтверждения."""
     full = feat.get("description_full")
     if isinstance(full, str) and full.strip():
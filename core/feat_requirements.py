@@ -1,5 +1,6 @@
 """Требования черт и отбор для меню выбора."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from core.feat_visibility import feat_visible_for_selection
@@ -136,11 +137,13 @@ def feat_has_requirements(feat_id: str) -> bool:
 def list_feats_for_selection(
     ctx: FeatRequirementContext,
     existing_ids: list[str],
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+) -> tuple[
+    list[Mapping[str, Any]], list[Mapping[str, Any]], list[Mapping[str, Any]]
+]:
     """Черты для меню: (доступные, требования не выполнены, скрытые)."""
-    eligible: list[dict[str, Any]] = []
-    blocked: list[dict[str, Any]] = []
-    hidden: list[dict[str, Any]] = []
+    eligible: list[Mapping[str, Any]] = []
+    blocked: list[Mapping[str, Any]] = []
+    hidden: list[Mapping[str, Any]] = []
     for feat in load_feats():
         feat_id = str(feat.get("id", ""))
         if not feat_id or not can_take_feat(feat_id, existing_ids):
@@ -1,14 +1,23 @@
 """Загрузка каталога черт из YAML."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import (
+    catalog_entry_views,
+    compiled_catalog,
+    declare_catalog,
+)
+from core.catalog_models import FeatDef, compile_feats
 from core.types import StatMap
 
 FEATS_FILE = Path("database/progression/feats.yaml")
 
+declare_catalog("feats", FEATS_FILE, "feats", compiler=compile_feats)
+
 
 @dataclass(frozen=True)
 class FeatGrant:
@@ -37,27 +46,25 @@ class FeatRequirementContext:
     skills: list[str] = field(default_factory=list)
 
 
-def _load_feats_yaml() -> dict[str, Any]:
-    """Загрузить feats из YAML."""
-    return load_catalog(FEATS_FILE, "feats")
+def _feat_views() -> Mapping[str, Mapping[str, Any]]:
+    """Read-only виды черт с ключом ``id``."""
+    return catalog_entry_views("feats", id_key="id")
+
+
+def load_feats() -> list[Mapping[str, Any]]:
+    """Список всех черт (read-only виды)."""
+    return list(_feat_views().values())
 
 
-def load_feats() -> list[dict[str, Any]]:
-    """Список всех черт."""
-    result: list[dict[str, Any]] = []
-    for feat_id, info in _load_feats_yaml().items():
-        if isinstance(info, dict):
-            entry = dict(info)
-            entry["id"] = feat_id
-            result.append(entry)
-    return result
+def load_feat(feat_id: str) -> Mapping[str, Any]:
+    """Данные одной черты (read-only вид, без копирования)."""
+    view = _feat_views().get(feat_id)
+    if view is None:
+        return MappingProxyType({"id": feat_id})
+    return view
 
 
-def load_feat(feat_id: str) -> dict[str, Any]:
-    """Данные одной черты."""
-    info = _load_feats_yaml().get(feat_id, {})
-    if isinstance(info, dict):
-        entry = dict(info)
-        entry["id"] = feat_id
-        return entry
-    return {"id": feat_id}
+def get_feat_def(feat_id: str) -> FeatDef | None:
+    """Скомпилированная черта или None."""
+    feats: Mapping[str, FeatDef] = compiled_catalog("feats")
+    return feats.get(feat_id)
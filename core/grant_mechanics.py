@@ -1,5 +1,6 @@
 """Разбор proficiency-grants из YAML (расы, классы, черты)."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from core.abilities import skill_ids
@@ -18,7 +19,7 @@ def normalize_armor_token(token: str) -> str:
     return _ARMOR_ALIASES.get(token, token)
 
 
-def mechanics_from_grant_entry(entry: dict[str, Any]) -> dict[str, Any]:
+def mechanics_from_grant_entry(entry: Mapping[str, Any]) -> dict[str, Any]:
     """Плоский grant или mechanics из class feature."""
     if "mechanics" in entry:
         merged = (
@@ -33,7 +34,7 @@ def mechanics_from_grant_entry(entry: dict[str, Any]) -> dict[str, Any]:
 
 
 def proficiency_tokens_and_skills_from_grant(
-    grant: dict[str, Any],
+    grant: Mapping[str, Any],
     choices: dict[str, Any] | None = None,
 ) -> tuple[list[str], list[str], list[str], list[str]]:
     """Оружие, доспехи, инструменты и навыки из grant."""
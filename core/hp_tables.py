@@ -0,0 +1,56 @@
+"""Таблицы максимума HP: любой уровень за O(1).
+
+Вне HardCore прирост за уровень постоянен: ``max(1, кость + CON)`` на
+1 уровне и ``кость // 2 + 1 + CON`` дальше, плюс бонус за уровень
+(раса, черты). Максимум HP по уровням — арифметическая прогрессия;
+таблица на ключ (кость хитов, CON, сложность, бонус) строится один раз.
+
+В HardCore каждый уровень — бросок кости. Броски хранятся в персонаже
+(``Character.hp_rolls``), и максимум HP считается по ним без перебросов.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+from core.levels import MAX_CHARACTER_LEVEL, clamp_level
+from core.types import GameDifficulty
+
+
+@lru_cache(maxsize=1024)
+def hp_table(
+    hit_dice: int, con_mod: int, difficulty: GameDifficulty, bonus: int
+) -> tuple[int, ...]:
+    """Максимум HP по уровням; индекс — уровень (0 — пусто).
+
+    Raises:
+        ValueError: HardCore — максимум считается по броскам
+    """
+    if difficulty == "hardcore":
+        raise ValueError("HardCore: максимум HP считается по броскам")
+    first = max(1, hit_dice + con_mod) + bonus
+    per_level = hit_dice // 2 + 1 + con_mod + bonus
+    return (0,) + tuple(
+        first + per_level * (level - 1)
+        for level in range(1, MAX_CHARACTER_LEVEL + 1)
+    )
+
+
+def fixed_max_hp(
+    level: int,
+    hit_dice: int,
+    con_mod: int,
+    difficulty: GameDifficulty,
+    bonus: int,
+) -> int:
+    """Максимум HP на уровне вне HardCore (из таблицы)."""
+    return hp_table(hit_dice, con_mod, difficulty, bonus)[clamp_level(level)]
+
+
+def rolled_hp_gain(dice_roll: int, con_mod: int, bonus: int) -> int:
+    """Прирост HP HardCore за один бросок кости."""
+    return max(1, dice_roll + con_mod) + bonus
+
+
+def rolled_max_hp(rolls: Sequence[int], con_mod: int, bonus: int) -> int:
+    """Максимум HP HardCore по броскам кости (по одному на уровень)."""
+    return sum(max(1, dice + con_mod) for dice in rolls) + bonus * len(rolls)
@@ -2,6 +2,8 @@
 
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -102,8 +104,43 @@ def load_json(
     return fallback.copy()
 
 
-def save_json(path: Path, data: dict[str, Any]) -> None:
-    """Записать словарь в JSON-файл."""
+def _fsync_directory(directory: Path) -> None:
+    """Зафиксировать rename на диске (POSIX; на Windows — no-op)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_json(
+    path: Path, data: dict[str, Any], *, durable: bool = False
+) -> None:
+    """Записать словарь в JSON-файл атомарно (временный файл + rename).
+
+    Сбой посреди записи оставляет прежний файл целым, а не обрезанный.
+
+    Args:
+        path: Путь к файлу
+        data: Словарь для записи
+        durable: fsync файла и папки до возврата (переживает сбой питания)
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Точка в начале и суффикс .tmp: не совпадает с glob("*.json")
+    tmp = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if durable:
+        _fsync_directory(path.parent)
@@ -1,36 +1,55 @@
 """Загрузка языков и пулов выбора при создании персонажа."""
 
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Literal
 
-from core.catalog_loader import load_catalog
+from core.catalog_loader import (
+    catalog_projection,
+    declare_catalog,
+    get_catalog,
+)
 from core.grants import grants_from_entity, grants_of_type, inherit_flags
 from core.localization import resolve_localized_text
 from core.races import collect_race_grants, get_race_and_subrace
 
 LANGUAGES_FILE = Path("database/core/languages.yaml")
+
+declare_catalog("languages", LANGUAGES_FILE, "languages")
 LanguagePool = Literal["common", "exotic", "any"]
 
 
 def _load_languages_yaml() -> dict[str, Any]:
     """Загрузить каталог языков."""
-    return load_catalog(LANGUAGES_FILE, "languages")
+    return get_catalog("languages")
 
 
-def load_languages(language: str = "ru") -> list[dict[str, Any]]:
-    """Список языков с локализованными полями."""
-    result: list[dict[str, Any]] = []
-    for lang_id, info in _load_languages_yaml().items():
-        if not isinstance(info, dict):
-            continue
-        result.append(
+def _language_rows(language: str) -> tuple[Mapping[str, Any], ...]:
+    """Строки списка языков на языке интерфейса (read-only)."""
+    return tuple(
+        MappingProxyType(
             {
                 "id": lang_id,
                 "name": resolve_localized_text(info.get("name", {}), language),
                 "category": info.get("category", "common"),
             }
         )
-    return result
+        for lang_id, info in _load_languages_yaml().items()
+        if isinstance(info, dict)
+    )
+
+
+def load_languages(language: str = "ru") -> list[Mapping[str, Any]]:
+    """Список языков с локализованными полями (кэш по языку)."""
+    return list(
+        catalog_projection(
+            ("languages",),
+            ("rows", language),
+            partial(_language_rows, language),
+        )
+    )
 
 
 def get_language_name(lang_id: str, language: str = "ru") -> str:
@@ -2,10 +2,18 @@
 
 Строки хранятся в YAML-файлах в папке database/strings/.
 Язык по умолчанию — русский, если нет — английский (запасной).
+
+``load_strings`` возвращает ``StringTable``: дерево строк (обычный
+словарь) и плоскую таблицу «ключ через точку → шаблон», собранную
+один раз. ``get_string`` по ней — один поиск в словаре вместо разбора
+ключа и спуска по вложенным словарям.
 """
 
+import sys
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
+from string import Formatter
 from typing import Any
 
 from core.io import load_yaml
@@ -14,6 +22,99 @@ from core.types import LanguageCode, StringsDict
 STRINGS_DIR = Path("database/strings")
 
 
+@dataclass(frozen=True, slots=True)
+class StringTemplate:
+    """Строка интерфейса, разобранная как шаблон format один раз."""
+
+    raw: str
+    # Результат format() без подстановок; None — в шаблоне есть поля
+    plain: str | None
+    # Именованные поля; None — есть позиционные или составные поля
+    fields: frozenset[str] | None
+
+    def render(self, kwargs: dict[str, Any]) -> str:
+        """Подставить параметры; нехватка параметра — шаблон как есть."""
+        if self.plain is not None:
+            return self.plain
+        if self.fields is not None and not self.fields <= kwargs.keys():
+            return self.raw
+        try:
+            return self.raw.format(**kwargs)
+        except KeyError:
+            return self.raw
+
+
+def _parse_template(value: object) -> StringTemplate:
+    """Разобрать значение листа YAML в шаблон."""
+    if not isinstance(value, str):
+        text = str(value)
+        return StringTemplate(text, text, frozenset())
+    raw = sys.intern(value)
+    try:
+        parsed = list(Formatter().parse(raw))
+    except ValueError:
+        # Битый шаблон: format() упадёт так же, как раньше
+        return StringTemplate(raw, None, None)
+    names = [
+        field for _text, field, _spec, _conv in parsed if field is not None
+    ]
+    if not names:
+        return StringTemplate(raw, "".join(t for t, *_ in parsed), frozenset())
+    if all(name.isidentifier() for name in names):
+        return StringTemplate(raw, None, frozenset(names))
+    return StringTemplate(raw, None, None)
+
+
+def _flatten_templates(
+    tree: dict[str, Any], prefix: str = ""
+) -> dict[str, StringTemplate]:
+    """Плоская таблица «ключ через точку → шаблон» (интернированные ключи)."""
+    table: dict[str, StringTemplate] = {}
+    for key, value in tree.items():
+        full_key = f"{prefix}{key}"
+        if isinstance(value, dict):
+            table.update(_flatten_templates(value, f"{full_key}."))
+        elif value is not None:
+            table[sys.intern(full_key)] = _parse_template(value)
+    return table
+
+
+def _subtree_keys(tree: dict[str, Any], prefix: str = "") -> set[str]:
+    """Ключи через точку, указывающие на вложенные словари."""
+    keys: set[str] = set()
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            full_key = f"{prefix}{key}"
+            keys.add(full_key)
+            keys |= _subtree_keys(value, f"{full_key}.")
+    return keys
+
+
+class StringTable(dict[str, Any]):
+    """Дерево строк с плоской таблицей шаблонов (только для чтения)."""
+
+    __slots__ = ("subtrees", "templates")
+
+    def __init__(self, tree: dict[str, Any]) -> None:
+        super().__init__(tree)
+        self.templates = _flatten_templates(tree)
+        self.subtrees = frozenset(_subtree_keys(tree))
+
+
+def _merge_fallback(
+    fallback: dict[str, Any], strings: dict[str, Any]
+) -> dict[str, Any]:
+    """Наложить строки языка на запасные на любой глубине вложенности."""
+    result = dict(fallback)
+    for key, value in strings.items():
+        base = result.get(key)
+        if isinstance(base, dict) and isinstance(value, dict):
+            result[key] = _merge_fallback(base, value)
+        else:
+            result[key] = value
+    return result
+
+
 def clear_strings_cache() -> None:
     """Сбросить кэш строк локализации (для тестов)."""
     load_strings.cache_clear()
@@ -23,14 +124,14 @@ def clear_strings_cache() -> None:
 def load_strings(language: LanguageCode) -> StringsDict:
     """Загрузить строки для указанного языка.
 
-    Сначала пытается загрузить файл language.yaml.
-    Если его нет — загружает en.yaml как запасной вариант.
+    Строки language.yaml накладываются на en.yaml (запасной вариант)
+    на любой глубине: недостающий вложенный ключ берётся из en.yaml.
 
     Args:
         language: Код языка ('ru', 'en' и т.д.)
 
     Returns:
-        Словарь со строками
+        Таблица строк (словарь-дерево с плоским индексом шаблонов)
     """
     strings_path = STRINGS_DIR / f"{language}.yaml"
     fallback_path = STRINGS_DIR / "en.yaml"
@@ -38,9 +139,7 @@ def load_strings(language: LanguageCode) -> StringsDict:
     strings = load_yaml(strings_path)
     fallback = load_yaml(fallback_path)
 
-    result = fallback.copy()
-    result.update(strings)
-    return result
+    return StringTable(_merge_fallback(fallback, strings))
 
 
 def resolve_localized_text(
@@ -87,6 +186,14 @@ def get_string(
     Returns:
         Строка, default или ключ, если строка не найдена
     """
+    if isinstance(strings, StringTable):
+        template = strings.templates.get(key)
+        if template is not None:
+            return template.render(kwargs) if kwargs else template.raw
+        if key not in strings.subtrees:
+            return default if default is not None else key
+
+    # Обычный словарь или ключ поддерева
     parts = key.split(".")
 
     value: Any = strings
@@ -1,10 +1,17 @@
 """Загрузка YAML-каталогов с overlay модов."""
 
 import logging
+import time
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from core.catalog_snapshot import (
+    load_snapshot,
+    save_snapshot,
+    snapshot_fingerprint,
+)
 from core.io import CatalogLoadError, load_json, load_yaml
 
 logger = logging.getLogger(__name__)
@@ -12,6 +19,8 @@ logger = logging.getLogger(__name__)
 MODS_DIR = Path("mods")
 MODS_STATE_FILE = Path("database/core/mods_state.json")
 
+type FileStamp = tuple[str, int, int]
+
 
 def _deep_merge(base: Any, overlay: Any) -> Any:
     """Рекурсивно объединить overlay в base."""
@@ -49,48 +58,125 @@ def _load_mod_manifest(mod_id: str) -> dict[str, Any]:
         return {}
 
 
-def _apply_mod_overlays(
-    data: dict[str, Any], target_path: Path
-) -> dict[str, Any]:
-    """Применить overlay всех включённых модов к данным файла."""
-    target = str(target_path).replace("\\", "/")
-    result = dict(data)
-    for mod_id in _enabled_mod_ids():
+def normalize_catalog_path(target: object) -> str:
+    """Путь каталога или target из manifest в POSIX-виде (ключ кэшей)."""
+    return Path(str(target).replace("\\", "/")).as_posix()
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """(путь, mtime_ns, размер) файла; отсутствующий — нули."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return path.as_posix(), 0, 0
+    return path.as_posix(), stat.st_mtime_ns, stat.st_size
+
+
+def _mod_index_stamp() -> tuple[FileStamp, ...]:
+    """Stat-отпечаток mods_state.json и всех manifest.yaml."""
+    manifests = sorted(MODS_DIR.glob("*/manifest.yaml"))
+    return (
+        file_stamp(MODS_STATE_FILE),
+        *(file_stamp(path) for path in manifests),
+    )
+
+
+@dataclass(frozen=True)
+class ModIndex:
+    """Индекс overlay включённых модов: target → overlay-файлы."""
+
+    overlays: dict[str, tuple[Path, ...]]
+    mod_ids: tuple[str, ...] = ()
+    build_seconds: float = 0.0
+
+    def overlays_for(self, target_path: Path) -> tuple[Path, ...]:
+        """Overlay-файлы для target в порядке включения модов."""
+        return self.overlays.get(normalize_catalog_path(target_path), ())
+
+
+def build_mod_index() -> ModIndex:
+    """Прочитать mods_state.json и manifest включённых модов один раз."""
+    start = time.perf_counter()
+    mod_ids = _enabled_mod_ids()
+    overlays: dict[str, list[Path]] = {}
+    for mod_id in mod_ids:
         manifest = _load_mod_manifest(mod_id)
-        overlays = manifest.get("overlays", [])
-        if not isinstance(overlays, list):
+        entries = manifest.get("overlays", [])
+        if not isinstance(entries, list):
             continue
-        for entry in overlays:
+        for entry in entries:
             if not isinstance(entry, dict):
                 continue
-            if str(entry.get("target", "")).replace("\\", "/") != target:
-                continue
             overlay_path = MODS_DIR / mod_id / str(entry.get("path", ""))
             if not overlay_path.exists():
                 continue
-            overlay_data = load_yaml(overlay_path)
-            if isinstance(overlay_data, dict):
-                result = _deep_merge(result, overlay_data)
+            target = normalize_catalog_path(entry.get("target", ""))
+            overlays.setdefault(target, []).append(overlay_path)
+    build_seconds = time.perf_counter() - start
+    logger.debug(
+        "Индекс модов: %d модов, %d target, %.2f мс",
+        len(mod_ids),
+        len(overlays),
+        build_seconds * 1000,
+    )
+    return ModIndex(
+        overlays={target: tuple(paths) for target, paths in overlays.items()},
+        mod_ids=tuple(mod_ids),
+        build_seconds=build_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def _cached_mod_index(stamp: tuple[FileStamp, ...]) -> ModIndex:
+    """Индекс модов для данного stat-отпечатка."""
+    return build_mod_index()
+
+
+def get_mod_index() -> ModIndex:
+    """Индекс модов; пересобирается при изменении mods_state или manifest."""
+    return _cached_mod_index(_mod_index_stamp())
+
+
+def _apply_mod_overlays(
+    data: dict[str, Any], overlay_paths: tuple[Path, ...]
+) -> dict[str, Any]:
+    """Применить overlay-файлы модов к данным файла."""
+    result = dict(data)
+    for overlay_path in overlay_paths:
+        overlay_data = load_yaml(overlay_path)
+        if isinstance(overlay_data, dict):
+            result = _deep_merge(result, overlay_data)
     return result
 
 
 def load_merged_yaml(path: Path) -> dict[str, Any]:
-    """Загрузить YAML с deep-merge overlay включённых модов."""
-    data = load_yaml(path, strict=True)
-    return _apply_mod_overlays(data, path)
+    """Загрузить YAML с deep-merge overlay включённых модов.
+
+    Сначала проверяется снапшот в ``.cache/``: если базовый YAML, overlay
+    и mods_state.json не менялись, PyYAML не вызывается.
+    """
+    overlay_paths = get_mod_index().overlays_for(path)
+    fingerprint = snapshot_fingerprint([path, MODS_STATE_FILE, *overlay_paths])
+    cached = load_snapshot(path, fingerprint)
+    if cached is not None:
+        return cached
+    data = _apply_mod_overlays(load_yaml(path, strict=True), overlay_paths)
+    save_snapshot(path, fingerprint, data)
+    return data
 
 
 def clear_mod_loader_cache() -> None:
-    """Сбросить кэш загрузчиков каталогов (для тестов)."""
-    load_merged_catalog.cache_clear()
+    """Сбросить индекс модов (для тестов)."""
+    _cached_mod_index.cache_clear()
 
 
-@lru_cache(maxsize=16)
 def load_merged_catalog(path_str: str, catalog_key: str) -> dict[str, Any]:
-    """Загрузить словарь каталога (races, classes, …) с модами."""
-    path = Path(path_str)
-    data = load_merged_yaml(path)
+    """Загрузить словарь каталога (races, classes, …) с модами.
+
+    Без кэша: резидентность и сброс — в ``core.catalog_registry``.
+    """
+    data = load_merged_yaml(Path(path_str))
     catalog = data.get(catalog_key, {})
-    if isinstance(catalog, dict):
-        return catalog
-    return {}
+    if not isinstance(catalog, dict):
+        return {}
+    return catalog
@@ -0,0 +1,183 @@
+"""Сериализаторы dataclass, сгенерированные из полей модели.
+
+``compile_codec`` один раз собирает исходный код двух функций по
+``dataclasses.fields`` и аннотациям и компилирует его через ``exec``:
+
+- ``to_dict`` — словарь сохранения; поле с ``None`` по умолчанию
+  пропускается, пока оно None, коллекции и флаги — пока пусты;
+  ``metadata=SERIALIZE_ALWAYS`` пишет поле всегда;
+- ``from_clean_dict`` — строгий быстрый разбор: только точные типы
+  (``type(x) is str``), без приведения. Любое отклонение — None, и
+  вызывающий код уходит в медленный разбор с приведением типов.
+
+Поля без пропуска в ``to_dict`` строгий разбор считает обязательными:
+быстрый путь принимает ровно то, что пишет ``to_dict``.
+"""
+
+import typing
+from collections.abc import Callable, Mapping
+from dataclasses import MISSING, Field, dataclass, fields
+from types import MappingProxyType, NoneType, UnionType
+from typing import Any, Literal
+
+SERIALIZE_ALWAYS: Mapping[str, Any] = MappingProxyType({"serialize": True})
+
+_FIELD_PREFIX = "f_"
+
+
+@dataclass(frozen=True, slots=True)
+class ModelCodec[T]:
+    """Сгенерированные сериализаторы модели и их исходный код."""
+
+    to_dict: Callable[[T], dict[str, Any]]
+    from_clean_dict: Callable[[dict[str, Any]], T | None]
+    source: str
+
+
+def value_bounds(low: int, high: int) -> Mapping[str, Any]:
+    """metadata поля int: строгий разбор принимает только [low, high]."""
+    return MappingProxyType({"bounds": (low, high)})
+
+
+def _resolve(hint: Any) -> Any:
+    """Раскрыть псевдонимы ``type X = ...``."""
+    while isinstance(hint, typing.TypeAliasType):
+        hint = hint.__value__
+    return hint
+
+
+def _check_value(hint: Any, var: str) -> str:
+    """Условие «значение var не подходит» для элемента коллекции."""
+    hint = _resolve(hint)
+    if hint is Any:
+        return "False"
+    origin = typing.get_origin(hint)
+    if hint in (str, int, bool):
+        return f"type({var}) is not {hint.__name__}"
+    if origin in (dict, list):
+        return f"type({var}) is not {origin.__name__}"
+    raise TypeError(f"Неподдерживаемый тип элемента: {hint!r}")
+
+
+def _omit_test(f: Field[Any]) -> str | None:
+    """Условие записи поля в to_dict (None — писать всегда)."""
+    if f.metadata.get("serialize"):
+        return None
+    if f.default is None:
+        return "value is not None"
+    if f.default is False or f.default_factory is not MISSING:
+        return "value"
+    return None
+
+
+def _to_dict_source(model_fields: tuple[Field[Any], ...]) -> list[str]:
+    """Тело to_dict."""
+    always = [f for f in model_fields if _omit_test(f) is None]
+    lines = ["def to_dict(self):", "    data = {"]
+    lines += [f"        {f.name!r}: self.{f.name}," for f in always]
+    lines.append("    }")
+    for f in model_fields:
+        test = _omit_test(f)
+        if test is None:
+            continue
+        lines += [
+            f"    value = self.{f.name}",
+            f"    if {test}:",
+            f"        data[{f.name!r}] = value",
+        ]
+    lines.append("    return data")
+    return lines
+
+
+def _field_check(f: Field[Any], hint: Any, var: str) -> list[str]:
+    """Проверка и копия значения поля в строгом разборе."""
+    hint = _resolve(hint)
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if hint in (str, int, bool):
+        lines = [f"    if type({var}) is not {hint.__name__}: return None"]
+        bounds = f.metadata.get("bounds")
+        if bounds is not None:
+            low, high = bounds
+            lines.append(f"    if not {low} <= {var} <= {high}: return None")
+        return lines
+    if isinstance(hint, UnionType) and set(args) == {str, NoneType}:
+        return [
+            f"    if {var} is not None and type({var}) is not str:"
+            " return None"
+        ]
+    if origin is Literal:
+        return [f"    if {var} not in {args!r}: return None"]
+    if origin is list:
+        (item,) = args
+        return [
+            f"    if type({var}) is not list: return None",
+            f"    for item in {var}:",
+            f"        if {_check_value(item, 'item')}: return None",
+            f"    {var} = {var}[:]",
+        ]
+    if origin is dict:
+        key, item = args
+        return [
+            f"    if type({var}) is not dict: return None",
+            f"    for key, item in {var}.items():",
+            f"        if {_check_value(key, 'key')}: return None",
+            f"        if {_check_value(item, 'item')}: return None",
+            f"    {var} = {var}.copy()",
+        ]
+    raise TypeError(f"Неподдерживаемый тип поля {f.name}: {hint!r}")
+
+
+def _from_clean_dict_source(
+    model_fields: tuple[Field[Any], ...], hints: dict[str, Any]
+) -> list[str]:
+    """Тело from_clean_dict."""
+    lines = ["def from_clean_dict(data):", "    get = data.get"]
+    for f in model_fields:
+        var = _FIELD_PREFIX + f.name
+        if _omit_test(f) is None:
+            # Проверка типа отвергает и _MISSING, кроме полей «X | None»
+            lines.append(f"    {var} = get({f.name!r}, _MISSING)")
+            if isinstance(_resolve(hints[f.name]), UnionType):
+                lines.append(f"    if {var} is _MISSING: return None")
+        elif f.default_factory is not MISSING:
+            # Пустая коллекция в to_dict пропущена — новая по умолчанию
+            lines += [
+                f"    {var} = get({f.name!r})",
+                f"    if {var} is None:",
+                f"        {var} = _default_{f.name}()",
+                "    else:",
+            ]
+            lines += [
+                "    " + line for line in _field_check(f, hints[f.name], var)
+            ]
+            continue
+        else:
+            lines.append(f"    {var} = get({f.name!r}, {f.default!r})")
+        lines += _field_check(f, hints[f.name], var)
+    args = ", ".join(_FIELD_PREFIX + f.name for f in model_fields)
+    lines.append(f"    return _cls({args})")
+    return lines
+
+
+def compile_codec[T](cls: type[T]) -> ModelCodec[T]:
+    """Сгенерировать to_dict / from_clean_dict для dataclass cls."""
+    model_fields = fields(cls)  # type: ignore[arg-type]
+    hints = typing.get_type_hints(cls)
+    source = "\n".join(
+        _to_dict_source(model_fields)
+        + [""]
+        + _from_clean_dict_source(model_fields, hints)
+    )
+    namespace: dict[str, Any] = {"_cls": cls, "_MISSING": MISSING}
+    namespace.update(
+        (f"_default_{f.name}", f.default_factory)
+        for f in model_fields
+        if f.default_factory is not MISSING
+    )
+    exec(compile(source, f"<codec {cls.__name__}>", "exec"), namespace)
+    return ModelCodec(
+        to_dict=namespace["to_dict"],
+        from_clean_dict=namespace["from_clean_dict"],
+        source=source,
+    )
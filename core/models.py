@@ -3,11 +3,15 @@
 Используем dataclasses для type-safety и удобной сериализации.
 """
 
+import sys
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
-from core.levels import clamp_level
+from core.levels import MAX_CHARACTER_LEVEL, clamp_level
 from core.localization import resolve_localized_text
+from core.model_codec import SERIALIZE_ALWAYS, compile_codec, value_bounds
 from core.types import GameDifficulty, StatMap
 
 
@@ -18,6 +22,19 @@ def _coerce_str_list(raw: object) -> list[str]:
     return []
 
 
+def _coerce_int_list(raw: object) -> list[int]:
+    """Список целых из JSON (нечисловые элементы отбрасываются)."""
+    if not isinstance(raw, list):
+        return []
+    values: list[int] = []
+    for item in raw:
+        try:
+            values.append(int(item))
+        except (TypeError, ValueError):
+            continue
+    return values
+
+
 def _coerce_str_dict(raw: object) -> dict[str, str]:
     """Словарь str→str из JSON."""
     if isinstance(raw, dict):
@@ -45,15 +62,17 @@ def _parse_difficulty(raw: object) -> GameDifficulty:
     return "normal"
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """Модель персонажа."""
 
     name: str
     race: str
     class_id: str
-    level: int = 1
-    stats: StatMap = field(default_factory=dict)
+    level: int = field(
+        default=1, metadata=value_bounds(1, MAX_CHARACTER_LEVEL)
+    )
+    stats: StatMap = field(default_factory=dict, metadata=SERIALIZE_ALWAYS)
     current_hp: int = 0
     max_hp: int = 0
     experience: int = 0
@@ -71,60 +90,34 @@ class Character:
     feat_ids: list[str] = field(default_factory=list)
     feat_choices: dict[str, dict[str, Any]] = field(default_factory=dict)
     asi_choices: dict[str, str] = field(default_factory=dict)
+    hp_rolls: list[int] = field(default_factory=list)
     class_features_applied: bool = False
     save_slug: str | None = None
     created_at: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Сериализовать в словарь для сохранения в JSON."""
-        data: dict[str, Any] = {
-            "name": self.name,
-            "race": self.race,
-            "class_id": self.class_id,
-            "level": self.level,
-            "stats": self.stats,
-            "current_hp": self.current_hp,
-            "max_hp": self.max_hp,
-            "experience": self.experience,
-            "difficulty": self.difficulty,
-        }
-        if self.subrace is not None:
-            data["subrace"] = self.subrace
-        if self.subclass_id is not None:
-            data["subclass_id"] = self.subclass_id
-        if self.languages:
-            data["languages"] = self.languages
-        if self.background_id is not None:
-            data["background_id"] = self.background_id
-        if self.skills:
-            data["skills"] = self.skills
-        if self.skill_expertise:
-            data["skill_expertise"] = self.skill_expertise
-        if self.tool_expertise:
-            data["tool_expertise"] = self.tool_expertise
-        if self.weapon_proficiencies:
-            data["weapon_proficiencies"] = self.weapon_proficiencies
-        if self.armor_proficiencies:
-            data["armor_proficiencies"] = self.armor_proficiencies
-        if self.tool_proficiencies:
-            data["tool_proficiencies"] = self.tool_proficiencies
-        if self.feat_ids:
-            data["feat_ids"] = self.feat_ids
-        if self.feat_choices:
-            data["feat_choices"] = self.feat_choices
-        if self.asi_choices:
-            data["asi_choices"] = self.asi_choices
-        if self.class_features_applied:
-            data["class_features_applied"] = True
-        if self.save_slug is not None:
-            data["save_slug"] = self.save_slug
-        if self.created_at is not None:
-            data["created_at"] = self.created_at
-        return data
+        """Сериализовать в словарь для сохранения в JSON.
+
+        Пустые необязательные поля (None, пустые списки, False)
+        пропускаются; код сгенерирован ``compile_codec``.
+        """
+        return _CHARACTER_CODEC.to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Character":
-        """Создать из словаря."""
+        """Создать из словаря.
+
+        Чистый сейв (точные типы, как пишет ``to_dict``) разбирается
+        сгенерированным строгим путём; иначе — приведение типов.
+        """
+        character = _CHARACTER_CODEC.from_clean_dict(data)
+        if character is not None:
+            return character
+        return cls.coerce_dict(data)
+
+    @classmethod
+    def coerce_dict(cls, data: dict[str, Any]) -> "Character":
+        """Создать из словаря с приведением типов (старые и ручные сейвы)."""
         subrace = data.get("subrace")
         current_hp = int(data.get("current_hp", 0))
         max_hp_raw = data.get("max_hp")
@@ -166,6 +159,7 @@ class Character:
             feat_ids=_coerce_str_list(data.get("feat_ids", [])),
             feat_choices=_coerce_feat_choices(data.get("feat_choices", {})),
             asi_choices=_coerce_str_dict(data.get("asi_choices", {})),
+            hp_rolls=_coerce_int_list(data.get("hp_rolls", [])),
             class_features_applied=bool(
                 data.get("class_features_applied", False)
             ),
@@ -174,6 +168,184 @@ class Character:
         )
 
 
+_CHARACTER_CODEC = compile_codec(Character)
+
+
+# Общие кортежи id одной пачки: набор → его единственный экземпляр
+type SharedIds = dict[tuple[str, ...], tuple[str, ...]]
+
+
+def _shared_ids(
+    values: Iterable[str], shared: SharedIds | None
+) -> tuple[str, ...]:
+    """Кортеж интернированных id; с таблицей пачки — общий экземпляр."""
+    items = tuple(sys.intern(value) for value in values)
+    if shared is None:
+        return items
+    return shared.setdefault(items, items)
+
+
+def _id_pairs[V](mapping: Mapping[str, V]) -> tuple[tuple[str, V], ...]:
+    """Кортеж пар (интернированный id, значение) вместо словаря."""
+    return tuple((sys.intern(key), value) for key, value in mapping.items())
+
+
+def _optional_id(value: str | None) -> str | None:
+    """Интернированный id или None."""
+    return sys.intern(value) if value is not None else None
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only копия JSON-значения: dict → MappingProxyType, list → tuple."""
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Обратно к JSON-значению (dict / list)."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class CompactCharacter:
+    """Read-only персонаж для аналитики и сервера.
+
+    Slots вместо ``__dict__``, id интернированы, коллекции — кортежи;
+    одинаковые наборы id (языки, навыки, владения, черты) у персонажей
+    одной пачки — один общий объект (таблица ``shared`` живёт, пока
+    строится пачка).
+    """
+
+    name: str
+    race: str
+    class_id: str
+    level: int
+    stats: tuple[tuple[str, int], ...]
+    current_hp: int
+    max_hp: int
+    experience: int
+    difficulty: GameDifficulty
+    subrace: str | None
+    subclass_id: str | None
+    languages: tuple[str, ...]
+    background_id: str | None
+    skills: tuple[str, ...]
+    skill_expertise: tuple[str, ...]
+    tool_expertise: tuple[str, ...]
+    weapon_proficiencies: tuple[str, ...]
+    armor_proficiencies: tuple[str, ...]
+    tool_proficiencies: tuple[str, ...]
+    feat_ids: tuple[str, ...]
+    feat_choices: tuple[tuple[str, Mapping[str, Any]], ...]
+    asi_choices: tuple[tuple[str, str], ...]
+    hp_rolls: tuple[int, ...]
+    class_features_applied: bool
+    save_slug: str | None
+    created_at: str | None
+
+    @classmethod
+    def from_character(
+        cls, character: Character, shared: SharedIds | None = None
+    ) -> "CompactCharacter":
+        """Компактная копия персонажа.
+
+        Args:
+            character: Исходный персонаж
+            shared: Таблица общих кортежей пачки (None — без общих)
+        """
+        return cls(
+            name=character.name,
+            race=sys.intern(character.race),
+            class_id=sys.intern(character.class_id),
+            level=character.level,
+            stats=_id_pairs(character.stats),
+            current_hp=character.current_hp,
+            max_hp=character.max_hp,
+            experience=character.experience,
+            difficulty=character.difficulty,
+            subrace=_optional_id(character.subrace),
+            subclass_id=_optional_id(character.subclass_id),
+            languages=_shared_ids(character.languages, shared),
+            background_id=_optional_id(character.background_id),
+            skills=_shared_ids(character.skills, shared),
+            skill_expertise=_shared_ids(character.skill_expertise, shared),
+            tool_expertise=_shared_ids(character.tool_expertise, shared),
+            weapon_proficiencies=_shared_ids(
+                character.weapon_proficiencies, shared
+            ),
+            armor_proficiencies=_shared_ids(
+                character.armor_proficiencies, shared
+            ),
+            tool_proficiencies=_shared_ids(
+                character.tool_proficiencies, shared
+            ),
+            feat_ids=_shared_ids(character.feat_ids, shared),
+            feat_choices=tuple(
+                (sys.intern(feat_id), _freeze(choices))
+                for feat_id, choices in character.feat_choices.items()
+            ),
+            asi_choices=_id_pairs(character.asi_choices),
+            hp_rolls=tuple(character.hp_rolls),
+            class_features_applied=character.class_features_applied,
+            save_slug=character.save_slug,
+            created_at=character.created_at,
+        )
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], shared: SharedIds | None = None
+    ) -> "CompactCharacter":
+        """Из словаря сохранения (приведение типов — как у Character)."""
+        return cls.from_character(Character.from_dict(data), shared)
+
+    def to_character(self) -> Character:
+        """Изменяемый Character (новые списки и словари)."""
+        return Character(
+            name=self.name,
+            race=self.race,
+            class_id=self.class_id,
+            level=self.level,
+            stats=dict(self.stats),
+            current_hp=self.current_hp,
+            max_hp=self.max_hp,
+            experience=self.experience,
+            difficulty=self.difficulty,
+            subrace=self.subrace,
+            subclass_id=self.subclass_id,
+            languages=list(self.languages),
+            background_id=self.background_id,
+            skills=list(self.skills),
+            skill_expertise=list(self.skill_expertise),
+            tool_expertise=list(self.tool_expertise),
+            weapon_proficiencies=list(self.weapon_proficiencies),
+            armor_proficiencies=list(self.armor_proficiencies),
+            tool_proficiencies=list(self.tool_proficiencies),
+            feat_ids=list(self.feat_ids),
+            feat_choices={
+                feat_id: _thaw(choices)
+                for feat_id, choices in self.feat_choices
+            },
+            asi_choices=dict(self.asi_choices),
+            hp_rolls=list(self.hp_rolls),
+            class_features_applied=self.class_features_applied,
+            save_slug=self.save_slug,
+            created_at=self.created_at,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Словарь сохранения (тот же формат, что у Character)."""
+        return self.to_character().to_dict()
+
+
 @dataclass
 class Adventure:
     """Модель приключения."""
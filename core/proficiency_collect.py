@@ -1,22 +1,18 @@
 """Сбор владений из grants, классов и рас."""
 
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
-from core.classes import (
-    get_class_dict,
-    get_subclass_dict,
-    iter_class_grants,
-)
+from core.classes import get_class_def, get_class_dict
 from core.equipment import resolve_tool_pool
 from core.feats import get_feat_proficiency_grants
 from core.grant_mechanics import (
     mechanics_from_grant_entry,
-    normalize_armor_token,
 )
 from core.io import merge_unique
 from core.models import Character
-from core.races import collect_race_grants
+from core.races import race_grants
 
 
 @dataclass
@@ -43,13 +39,13 @@ def _tokens_from_mechanics(
     return proficiency_tokens_from_grant(mechanics)
 
 
-def _mechanics_from_entry(entry: dict[str, Any]) -> dict[str, Any]:
+def _mechanics_from_entry(entry: Mapping[str, Any]) -> dict[str, Any]:
     """Плоский grant или mechanics из class feature."""
     return mechanics_from_grant_entry(entry)
 
 
 def _collect_from_grants(
-    grants: list[dict[str, Any]],
+    grants: Iterable[Mapping[str, Any]],
     level: int,
     *,
     require_level: bool,
@@ -98,23 +94,14 @@ def get_class_proficiency_tokens(
     class_id: str,
 ) -> tuple[list[str], list[str], list[str]]:
     """Базовые владения класса."""
-    info = get_class_dict(class_id)
-    if not info:
-        return [], [], []
-    prof = info.get("proficiencies", {})
-    if not isinstance(prof, dict):
+    class_def = get_class_def(class_id)
+    if class_def is None:
         return [], [], []
-    raw_w = prof.get("weapons", [])
-    weapons = [str(w) for w in raw_w] if isinstance(raw_w, list) else []
-    raw_a = prof.get("armor", [])
-    armors = (
-        [normalize_armor_token(str(a)) for a in raw_a]
-        if isinstance(raw_a, list)
-        else []
+    return (
+        list(class_def.weapon_proficiencies),
+        list(class_def.armor_proficiencies),
+        list(class_def.tool_proficiencies),
     )
-    raw_t = prof.get("tools", [])
-    tools = [str(t) for t in raw_t] if isinstance(raw_t, list) else []
-    return weapons, armors, tools
 
 
 def get_class_tool_choices(class_id: str) -> list[ProficiencyChoice]:
@@ -153,14 +140,11 @@ def get_subclass_proficiency_tokens(
     """Владения подкласса с учётом уровня feature."""
     if not subclass_id:
         return [], [], [], []
-    sub = get_subclass_dict(class_id, subclass_id)
+    class_def = get_class_def(class_id)
+    sub = class_def.subclasses.get(subclass_id) if class_def else None
     if sub is None:
         return [], [], [], []
-    return _collect_from_grants(
-        iter_class_grants(sub),
-        level,
-        require_level=True,
-    )
+    return _collect_from_grants(sub.grants, level, require_level=True)
 
 
 def get_racial_proficiency_tokens(
@@ -168,7 +152,7 @@ def get_racial_proficiency_tokens(
     subrace_id: str | None = None,
 ) -> tuple[list[str], list[str], list[str], list[ProficiencyChoice]]:
     """Расовые владения из grants."""
-    grants = collect_race_grants(race_id, subrace_id)
+    grants = race_grants(race_id, subrace_id)
     return _collect_from_grants(grants, level=99, require_level=False)
 
 
@@ -1,13 +1,17 @@
 """Прогрессия персонажа: опыт и уровни (PHB, макс. 10 уровень)."""
 
-from collections.abc import Callable
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, replace
+from functools import partial
 from typing import Any
 
+from core.catalog_loader import catalog_projection
 from core.classes import get_class_hit_dice
 from core.dice import ability_modifier, roll
 from core.feats import get_feat_hp_bonus_sources
 from core.hp_bonuses import HpBonusSource
+from core.hp_tables import fixed_max_hp, rolled_max_hp
 from core.levels import MAX_CHARACTER_LEVEL, clamp_level
 from core.models import Character
 from core.races import get_racial_hp_bonus_sources
@@ -27,14 +31,40 @@ def extra_hp_bonus_sources(
     return tuple(sources)
 
 
+def _race_hp_bonus(race_id: str, subrace_id: str | None) -> int:
+    """Бонус HP за уровень от расы/подрасы."""
+    sources = get_racial_hp_bonus_sources(race_id, subrace_id)
+    return sum(source.amount for source in sources)
+
+
+def _feat_hp_bonus(feat_id: str) -> int:
+    """Бонус HP за уровень от одной черты."""
+    return sum(
+        source.amount for source in get_feat_hp_bonus_sources([feat_id])
+    )
+
+
 def extra_hp_per_level(
     race_id: str | None = None,
     subrace_id: str | None = None,
     feat_ids: list[str] | None = None,
 ) -> int:
-    """Суммарный бонус HP за уровень: раса/подраса + черты."""
-    sources = extra_hp_bonus_sources(race_id, subrace_id, feat_ids)
-    return sum(s.amount for s in sources)
+    """Суммарный бонус HP за уровень: раса/подраса + черты.
+
+    Бонус расы и каждой черты кэшируется до сброса их каталога.
+    """
+    total = 0
+    if race_id:
+        total += catalog_projection(
+            ("races",),
+            ("hp_bonus", race_id, subrace_id),
+            partial(_race_hp_bonus, race_id, subrace_id),
+        )
+    for feat_id in feat_ids or ():
+        total += catalog_projection(
+            ("feats",), ("hp_bonus", feat_id), partial(_feat_hp_bonus, feat_id)
+        )
+    return total
 
 
 @dataclass(frozen=True)
@@ -46,6 +76,8 @@ class HpGainBreakdown:
     bonus_sources: tuple[HpBonusSource, ...] = ()
     is_first_level: bool = False
     dice_roll: int | None = None
+    # Грани кости при броске HardCore — для шансов на экране повышения
+    hit_dice: int | None = None
 
     @property
     def extra_bonus(self) -> int:
@@ -81,11 +113,7 @@ XP_THRESHOLDS: list[int] = [
 
 def level_from_xp(experience: int) -> int:
     """Уровень персонажа по накопленному опыту (1–MAX_CHARACTER_LEVEL)."""
-    level = 1
-    for idx, threshold in enumerate(XP_THRESHOLDS, start=1):
-        if experience >= threshold:
-            level = idx
-    return min(level, MAX_CHARACTER_LEVEL)
+    return clamp_level(bisect_right(XP_THRESHOLDS, experience))
 
 
 def hp_gain_for_level(
@@ -123,6 +151,7 @@ def hp_gain_breakdown_for_level_up(
             con_mod=con_mod,
             bonus_sources=bonus_sources,
             dice_roll=dice,
+            hit_dice=hit_dice,
         )
     if new_level <= 1:
         return HpGainBreakdown(
@@ -163,6 +192,11 @@ def roll_hp_gain_for_level_up(
     return breakdown.total, breakdown.dice_roll
 
 
+def roll_hp_history(hit_dice: int, count: int) -> list[int]:
+    """Броски кости хитов HardCore на count уровней подряд."""
+    return [roll(1, hit_dice) for _ in range(count)]
+
+
 def max_hp_for_level(
     class_id: str,
     stats: StatMap,
@@ -171,18 +205,23 @@ def max_hp_for_level(
     race_id: str | None = None,
     subrace_id: str | None = None,
     feat_ids: list[str] | None = None,
+    *,
+    hp_rolls: Sequence[int] | None = None,
 ) -> int:
-    """Максимум HP на заданном уровне с учётом режима сложности."""
+    """Максимум HP на заданном уровне с учётом режима сложности.
+
+    Вне HardCore — из таблицы ``core.hp_tables`` за O(1). HardCore —
+    по истории бросков hp_rolls; недостающие уровни бросаются заново.
+    """
     level = clamp_level(level)
     hit_dice = get_class_hit_dice(class_id)
     con_mod = ability_modifier(stats.get("constitution", 10))
     hp_bonus = extra_hp_per_level(race_id, subrace_id, feat_ids)
-    total = 0
-    for lvl in range(1, level + 1):
-        total += hp_gain_for_level(
-            lvl, hit_dice, con_mod, difficulty, hp_bonus
-        )
-    return total
+    if difficulty == "hardcore":
+        rolls = list(hp_rolls or ())[:level]
+        rolls += roll_hp_history(hit_dice, level - len(rolls))
+        return rolled_max_hp(rolls, con_mod, hp_bonus)
+    return fixed_max_hp(level, hit_dice, con_mod, difficulty, hp_bonus)
 
 
 def grant_experience(character: Character, amount: int) -> Character:
@@ -199,16 +238,34 @@ def has_pending_level_up(character: Character) -> bool:
     return character.level < level_from_xp(character.experience)
 
 
-def apply_level_up(character: Character, hp_gain: int) -> Character:
-    """Повысить персонажа на один уровень с заданным приростом HP."""
+def extend_hp_rolls(character: Character, rolls: Sequence[int]) -> list[int]:
+    """История бросков HP после повышения на len(rolls) уровней.
+
+    Дописывается только полная история (бросок на каждый уровень):
+    у персонажей, созданных до её появления, она остаётся как есть.
+    """
+    if not rolls or len(character.hp_rolls) != character.level:
+        return character.hp_rolls
+    return [*character.hp_rolls, *rolls]
+
+
+def apply_level_up(
+    character: Character, hp_gain: int, dice_roll: int | None = None
+) -> Character:
+    """Повысить персонажа на один уровень с заданным приростом HP.
+
+    dice_roll — бросок кости HardCore, он попадает в ``hp_rolls``.
+    """
     if not has_pending_level_up(character):
         return character
     new_level = character.level + 1
+    rolls = () if dice_roll is None else (dice_roll,)
     return replace(
         character,
         level=new_level,
         max_hp=character.max_hp + hp_gain,
         current_hp=character.current_hp + hp_gain,
+        hp_rolls=extend_hp_rolls(character, rolls),
     )
 
 
@@ -286,62 +343,83 @@ def _headless_asi_resolution(
     )
 
 
+type ResolveAsi = Callable[[Character, int], AsiResolution | None]
+type OnLevelUp = Callable[[Character, int, HpGainBreakdown, int, int], bool]
+
+
+def advance_one_level(
+    character: Character,
+    *,
+    resolve_asi: ResolveAsi | None = None,
+    on_level_up: OnLevelUp | None = None,
+) -> tuple[Character, bool]:
+    """Применить одно ожидающее повышение.
+
+    Returns:
+        (персонаж, повышен ли); False — UI прервал повышение, выбор
+        ASI до прерывания уже может быть записан в персонажа
+    """
+    from core.asi import pending_asi_at_level
+
+    char = character
+    new_level = char.level + 1
+    con_bonus = 0
+    tough_bonus = 0
+
+    if pending_asi_at_level(char, new_level):
+        resolution: AsiResolution | None
+        if resolve_asi is None:
+            resolution = _headless_asi_resolution(char, new_level)
+        else:
+            resolution = resolve_asi(char, new_level)
+        if resolution is None:
+            return char, False
+        char = resolution.character
+        con_bonus = resolution.con_bonus
+        tough_bonus = resolution.tough_bonus
+    elif str(new_level) in char.asi_choices:
+        resolution = _headless_asi_resolution(char, new_level)
+        char = resolution.character
+        con_bonus = resolution.con_bonus
+        tough_bonus = resolution.tough_bonus
+
+    roll_feat_ids = list(char.feat_ids)
+    if tough_bonus > 0:
+        roll_feat_ids = [
+            feat_id for feat_id in roll_feat_ids if feat_id != "tough"
+        ]
+
+    breakdown = hp_gain_breakdown_for_level_up(
+        char.class_id,
+        char.stats,
+        new_level,
+        char.difficulty,
+        char.race,
+        char.subrace,
+        roll_feat_ids,
+    )
+    if on_level_up is not None and not on_level_up(
+        char, new_level, breakdown, con_bonus, tough_bonus
+    ):
+        return char, False
+    gain = breakdown.total + con_bonus + tough_bonus
+    return apply_level_up(char, gain, breakdown.dice_roll), True
+
+
 def process_pending_level_ups(
     character: Character,
     *,
-    resolve_asi: (
-        Callable[[Character, int], AsiResolution | None] | None
-    ) = None,
-    on_level_up: (
-        Callable[[Character, int, HpGainBreakdown, int, int], bool] | None
-    ) = None,
+    resolve_asi: ResolveAsi | None = None,
+    on_level_up: OnLevelUp | None = None,
 ) -> Character:
     """Применить все ожидающие повышения; resolve_asi — UI или headless."""
-    from core.asi import pending_asi_at_level
-
     char = character
     while has_pending_level_up(char):
-        new_level = char.level + 1
-        con_bonus = 0
-        tough_bonus = 0
-
-        if pending_asi_at_level(char, new_level):
-            resolution: AsiResolution | None
-            if resolve_asi is None:
-                resolution = _headless_asi_resolution(char, new_level)
-            else:
-                resolution = resolve_asi(char, new_level)
-            if resolution is None:
-                break
-            char = resolution.character
-            con_bonus = resolution.con_bonus
-            tough_bonus = resolution.tough_bonus
-        elif str(new_level) in char.asi_choices:
-            resolution = _headless_asi_resolution(char, new_level)
-            char = resolution.character
-            con_bonus = resolution.con_bonus
-            tough_bonus = resolution.tough_bonus
-
-        roll_feat_ids = list(char.feat_ids)
-        if tough_bonus > 0:
-            roll_feat_ids = [
-                feat_id for feat_id in roll_feat_ids if feat_id != "tough"
-            ]
-
-        breakdown = hp_gain_breakdown_for_level_up(
-            char.class_id,
-            char.stats,
-            new_level,
-            char.difficulty,
-            char.race,
-            char.subrace,
-            roll_feat_ids,
+        char, advanced = advance_one_level(
+            char, resolve_asi=resolve_asi, on_level_up=on_level_up
         )
-        if on_level_up is not None and not on_level_up(
-            char, new_level, breakdown, con_bonus, tough_bonus
-        ):
+        if not advanced:
             break
-        char = apply_level_up(char, breakdown.total + con_bonus + tough_bonus)
     return char
 
 
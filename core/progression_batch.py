@@ -0,0 +1,132 @@
+"""Пакетное начисление опыта: партия или целый шард за один вызов.
+
+``award_experience`` даёт тот же результат, что ``apply_experience`` для
+каждого персонажа, но:
+
+- целевой уровень ищется бисекцией по ``XP_THRESHOLDS``;
+- уровни без ASI (и без сохранённого выбора ASI) проходятся одним
+  прыжком; кость хитов и уровни ASI класса берутся из таблицы класса,
+  построенной один раз на версию каталога ``classes``. Фиксированный
+  прирост HP — разность ``fixed_max_hp``, в HardCore все броски прыжка
+  делаются одним ``roll_hp_history`` в том же порядке, что и по шагам;
+- по шагам, как в ``process_pending_level_ups``, идут только уровни
+  с ASI;
+- изменённые персонажи записываются одной пачкой (``update_characters``).
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from functools import partial
+
+from core.asi import class_asi_levels
+from core.catalog_loader import catalog_projection
+from core.character_storage import update_characters
+from core.classes import get_class_hit_dice
+from core.dice import ability_modifier
+from core.hp_tables import fixed_max_hp, rolled_max_hp
+from core.models import Character
+from core.progression import (
+    advance_one_level,
+    extend_hp_rolls,
+    extra_hp_per_level,
+    grant_experience,
+    level_from_xp,
+    roll_hp_history,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ClassProgressionTable:
+    """Таблица класса для пакетных повышений."""
+
+    hit_dice: int
+    asi_levels: frozenset[int]
+
+
+def _build_class_table(class_id: str) -> ClassProgressionTable:
+    """Кость хитов и уровни ASI класса из каталога."""
+    return ClassProgressionTable(
+        hit_dice=get_class_hit_dice(class_id),
+        asi_levels=class_asi_levels(class_id),
+    )
+
+
+def class_progression_table(class_id: str) -> ClassProgressionTable:
+    """Таблица класса (кэш до сброса каталога ``classes``)."""
+    return catalog_projection(
+        ("classes",),
+        ("progression_table", class_id),
+        partial(_build_class_table, class_id),
+    )
+
+
+def _jump_levels(
+    character: Character, target: int, table: ClassProgressionTable
+) -> Character:
+    """Повысить до target одним replace: уровни без ASI."""
+    con_mod = ability_modifier(character.stats.get("constitution", 10))
+    bonus = extra_hp_per_level(
+        character.race, character.subrace, character.feat_ids
+    )
+    rolls: list[int] = []
+    if character.difficulty == "hardcore":
+        # Бросок на каждый уровень — в том же порядке, что и по шагам
+        rolls = roll_hp_history(table.hit_dice, target - character.level)
+        gain = rolled_max_hp(rolls, con_mod, bonus)
+    else:
+        args = (table.hit_dice, con_mod, character.difficulty, bonus)
+        gain = fixed_max_hp(target, *args) - fixed_max_hp(
+            character.level, *args
+        )
+    return replace(
+        character,
+        level=target,
+        max_hp=character.max_hp + gain,
+        current_hp=character.current_hp + gain,
+        hp_rolls=extend_hp_rolls(character, rolls),
+    )
+
+
+def _resolve_level_ups(character: Character) -> Character:
+    """Все ожидающие повышения без UI: прыжки между уровнями ASI."""
+    target = level_from_xp(character.experience)
+    table = class_progression_table(character.class_id)
+    char = character
+    while char.level < target:
+        step = char.level + 1
+        if step in table.asi_levels or str(step) in char.asi_choices:
+            char, _advanced = advance_one_level(char)
+            continue
+        stop = step
+        while (
+            stop < target
+            and stop + 1 not in table.asi_levels
+            and str(stop + 1) not in char.asi_choices
+        ):
+            stop += 1
+        char = _jump_levels(char, stop, table)
+    return char
+
+
+def award_experience(
+    awards: Iterable[tuple[Character, int]], *, save: bool = True
+) -> list[Character]:
+    """Начислить опыт многим персонажам и применить повышения без UI.
+
+    Args:
+        awards: Пары (персонаж, опыт); порядок сохраняется
+        save: Записать изменённых персонажей одной пачкой
+
+    Returns:
+        Обновлённые персонажи; без изменений — тот же объект
+    """
+    updated: list[Character] = []
+    changed: list[Character] = []
+    for character, amount in awards:
+        result = _resolve_level_ups(grant_experience(character, amount))
+        updated.append(result)
+        if result is not character:
+            changed.append(result)
+    if save and changed:
+        update_characters(changed)
+    return updated
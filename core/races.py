@@ -1,25 +1,28 @@
 """Загрузка рас и расовых бонусов из YAML."""
 
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from core.catalog_loader import clear_catalog_cache, load_catalog
-from core.grants import (
-    ABILITY_INCREASE,
-    grants_from_entity,
-    grants_of_type,
-    inherit_flags,
-    merge_entity_grants,
-)
-from core.hp_bonuses import (
-    HpBonusSource,
-    hit_point_bonus_sources_from_grants,
+from core.catalog_loader import (
+    catalog_projection,
+    clear_catalog_cache,
+    compiled_catalog,
+    declare_catalog,
+    get_catalog,
 )
+from core.catalog_models import Grants, RaceDef, compile_races
+from core.grants import ABILITY_INCREASE, grants_of_type
+from core.hp_bonuses import HpBonusSource
 from core.localization import resolve_localized_text
 from core.types import StatMap
 
 RACES_FILE = Path("database/races/races.yaml")
 
+declare_catalog("races", RACES_FILE, "races", compiler=compile_races)
+
 
 def clear_races_cache() -> None:
     """Сбросить кэш рас (для тестов)."""
@@ -28,24 +31,21 @@ def clear_races_cache() -> None:
 
 def _load_races_yaml() -> dict[str, Any]:
     """Загрузить данные рас из YAML."""
-    return load_catalog(RACES_FILE, "races")
+    return get_catalog("races")
+
+
+def get_race_def(race_id: str) -> RaceDef | None:
+    """Скомпилированная раса (подрасы с наследованием) или None."""
+    races: Mapping[str, RaceDef] = compiled_catalog("races")
+    return races.get(race_id)
 
 
 def resolve_subrace_id(race_id: str, subrace_id: str | None) -> str | None:
     """Нормализовать id подрасы (fallback human → standard)."""
-    race_info = _load_races_yaml().get(race_id, {})
-    if not isinstance(race_info, dict):
+    race = get_race_def(race_id)
+    if race is None:
         return subrace_id
-    subraces = race_info.get("subraces", {})
-    if not isinstance(subraces, dict) or not subraces:
-        return subrace_id
-    if subrace_id and subrace_id in subraces:
-        return subrace_id
-    if subrace_id is None and race_id == "human" and "standard" in subraces:
-        return "standard"
-    if subrace_id is None and len(subraces) == 1:
-        return str(next(iter(subraces)))
-    return subrace_id
+    return race.resolve_subrace_id(subrace_id)
 
 
 def get_race_and_subrace(
@@ -78,37 +78,25 @@ def _merge_bonus_dicts(base: StatMap, extra: StatMap) -> StatMap:
 
 def get_race_bonuses(race_id: str, subrace_id: str | None = None) -> StatMap:
     """Получить расовые и подрасовые бонусы к характеристикам."""
-    race_info, subrace_info = get_race_and_subrace(race_id, subrace_id)
-    if not race_info:
+    race = get_race_def(race_id)
+    if race is None:
         return {}
+    return dict(race.variant(subrace_id).ability_bonuses)
 
-    bonuses: StatMap = {}
-    if subrace_info:
-        inherit_bonuses, _ = inherit_flags(subrace_info)
-        if inherit_bonuses:
-            base_bonuses = race_info.get("ability_bonuses", {})
-            if isinstance(base_bonuses, dict):
-                bonuses.update(base_bonuses)
-        sub_bonuses = subrace_info.get("ability_bonuses", {})
-        if isinstance(sub_bonuses, dict):
-            bonuses = _merge_bonus_dicts(bonuses, sub_bonuses)
-    else:
-        base_bonuses = race_info.get("ability_bonuses", {})
-        if isinstance(base_bonuses, dict):
-            bonuses.update(base_bonuses)
-    return bonuses
+
+def race_grants(race_id: str, subrace_id: str | None = None) -> Grants:
+    """Read-only grants расы и подрасы с учётом наследования."""
+    race = get_race_def(race_id)
+    if race is None:
+        return ()
+    return race.variant(subrace_id).grants
 
 
 def collect_race_grants(
     race_id: str, subrace_id: str | None = None
 ) -> list[dict[str, Any]]:
-    """Grants расы и подрасы с учётом наследования."""
-    race_info, subrace_info = get_race_and_subrace(race_id, subrace_id)
-    if not race_info:
-        return []
-    if subrace_info:
-        return merge_entity_grants(race_info, subrace_info, use_parent=True)
-    return grants_from_entity(race_info)
+    """Grants расы и подрасы с учётом наследования (изменяемые копии)."""
+    return [dict(grant) for grant in race_grants(race_id, subrace_id)]
 
 
 def get_choice_ability_bonus_mechanics(
@@ -145,9 +133,10 @@ def get_racial_hp_bonus_sources(
     race_id: str, subrace_id: str | None = None
 ) -> list[HpBonusSource]:
     """Именованные бонусы HP за уровень из grants расы/подрасы."""
-    return hit_point_bonus_sources_from_grants(
-        collect_race_grants(race_id, subrace_id)
-    )
+    race = get_race_def(race_id)
+    if race is None:
+        return []
+    return list(race.variant(subrace_id).hp_bonus_sources)
 
 
 def get_effective_race_bonuses(
@@ -186,22 +175,31 @@ def _localize_race_info(
     return result
 
 
-def load_races(language: str = "ru") -> list[dict[str, Any]]:
-    """Загрузить список всех доступных рас."""
-    result: list[dict[str, Any]] = []
-    for race_id, race_info in _load_races_yaml().items():
-        if isinstance(race_info, dict):
-            result.append(
-                {
-                    "id": race_id,
-                    "name": resolve_localized_text(
-                        race_info.get("name", race_id),
-                        language,
-                        fallback=race_id,
-                    ),
-                }
-            )
-    return result
+def _race_rows(language: str) -> tuple[Mapping[str, Any], ...]:
+    """Строки списка рас на языке (read-only)."""
+    return tuple(
+        MappingProxyType(
+            {
+                "id": race_id,
+                "name": resolve_localized_text(
+                    race_info.get("name", race_id),
+                    language,
+                    fallback=race_id,
+                ),
+            }
+        )
+        for race_id, race_info in _load_races_yaml().items()
+        if isinstance(race_info, dict)
+    )
+
+
+def load_races(language: str = "ru") -> list[Mapping[str, Any]]:
+    """Загрузить список всех доступных рас (строки кэшируются по языку)."""
+    return list(
+        catalog_projection(
+            ("races",), ("rows", language), partial(_race_rows, language)
+        )
+    )
 
 
 def load_race_full(race_id: str, language: str = "ru") -> dict[str, Any]:
@@ -214,10 +212,7 @@ def load_race_full(race_id: str, language: str = "ru") -> dict[str, Any]:
 
 def auto_select_subrace_id(race_id: str) -> str | None:
     """Автовыбор подрасы, если в YAML ровно одна."""
-    race_info = _load_races_yaml().get(race_id, {})
-    if not isinstance(race_info, dict):
-        return None
-    subraces = race_info.get("subraces", {})
-    if isinstance(subraces, dict) and len(subraces) == 1:
-        return str(next(iter(subraces)))
+    race = get_race_def(race_id)
+    if race is not None and len(race.subraces) == 1:
+        return next(iter(race.subraces))
     return None
@@ -0,0 +1,256 @@
+"""Холодный архив персонажей: ``saves/characters/.archive/``.
+
+Персонажи, которых не трогали N дней, упаковываются в бандлы
+``{время}-{pid}.zbundle``: каждая запись — компактный JSON, сжатый
+zlib с общим словарём (``zdict``) имён полей и частых значений, поэтому
+даже одиночная запись в пару сотен байт сжимается хорошо. Смещение и
+длина записи — в ``index.json`` архива вместе со сводкой для списка
+персонажей: список и выбор slug не распаковывают бандлы, а чтение
+одного персонажа распаковывает только его запись.
+
+Бандлы неизменяемы. Файл персонажа важнее его архивной записи: возврат
+из архива — это обычная запись файла, а устаревшая запись снимается при
+следующей упаковке или удалении персонажа. Бандл без живых записей
+удаляется.
+Бандл пишется до правки индекса: сбой между шагами оставляет лишь
+бандл, на который никто не ссылается.
+"""
+
+import json
+import os
+import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core.character_index import CharacterSummary, summary_from_record
+from core.io import load_json, save_json
+
+ARCHIVE_DIR_NAME = ".archive"
+ARCHIVE_INDEX_NAME = "index.json"
+ARCHIVE_SCHEMA_VERSION = 1
+BUNDLE_SUFFIX = ".zbundle"
+DEFAULT_ARCHIVE_AFTER_DAYS = 30
+
+# Словарь сжатия v1: менять только вместе с ARCHIVE_SCHEMA_VERSION
+_ZDICT = (
+    b'{"schema_version": 1, "name": "", "race": "human", "class_id": '
+    b'"fighter", "level": 1, "stats": {"strength": 10, "dexterity": 10, '
+    b'"constitution": 10, "intelligence": 10, "wisdom": 10, '
+    b'"charisma": 10}, "current_hp": 10, "max_hp": 10, "experience": 0, '
+    b'"difficulty": "normal", "subrace": "", "subclass_id": "", '
+    b'"languages": ["common", "elvish", "dwarvish"], "background_id": '
+    b'"acolyte", "skills": ["athletics", "perception", "arcana", '
+    b'"history", "stealth", "insight"], "skill_expertise": [], '
+    b'"tool_expertise": [], "weapon_proficiencies": ["simple", '
+    b'"martial"], "armor_proficiencies": ["light", "medium", "heavy", '
+    b'"shields"], "tool_proficiencies": [], "feat_ids": [], '
+    b'"feat_choices": {}, "asi_choices": {}, "class_features_applied": '
+    b'true, "save_slug": "", "created_at": "2026-01-01T00:00:00+00:00"}'
+)
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Запись архива: где лежит персонаж и его сводка для списка."""
+
+    bundle: str
+    offset: int
+    length: int
+    summary: CharacterSummary
+
+
+type _ArchiveStamp = tuple[str, int, int]
+
+# Разобранный индекс архива процесса: (путь, mtime_ns, размер) → записи
+_cached_archive: tuple[_ArchiveStamp, dict[str, ArchiveEntry]] | None = None
+
+
+def archive_dir(directory: Path) -> Path:
+    """Папка архива внутри папки сохранений."""
+    return directory / ARCHIVE_DIR_NAME
+
+
+def _archive_index_path(directory: Path) -> Path:
+    """Путь к индексу архива."""
+    return archive_dir(directory) / ARCHIVE_INDEX_NAME
+
+
+def _entry_from_dict(data: Any) -> ArchiveEntry | None:
+    """Запись индекса архива из JSON; чужой формат — None."""
+    if not isinstance(data, dict):
+        return None
+    summary = summary_from_record(data.get("summary"))
+    if summary is None:
+        return None
+    try:
+        return ArchiveEntry(
+            bundle=str(data["bundle"]),
+            offset=int(data["offset"]),
+            length=int(data["length"]),
+            summary=summary,
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def read_archive(directory: Path) -> dict[str, ArchiveEntry]:
+    """Записи архива по save_slug; нет архива — пусто.
+
+    Неизменившийся индекс архива повторно не разбирается.
+    """
+    global _cached_archive
+    path = _archive_index_path(directory)
+    try:
+        stat = path.stat()
+    except OSError:
+        return {}
+    stamp = (path.as_posix(), stat.st_mtime_ns, stat.st_size)
+    if _cached_archive is not None and _cached_archive[0] == stamp:
+        return dict(_cached_archive[1])
+    data = load_json(path)
+    raw = data.get("characters")
+    entries: dict[str, ArchiveEntry] = {}
+    if data.get("schema_version") == ARCHIVE_SCHEMA_VERSION and isinstance(
+        raw, dict
+    ):
+        for slug, item in raw.items():
+            entry = _entry_from_dict(item)
+            if entry is not None:
+                entries[str(slug)] = entry
+    _cached_archive = (stamp, entries)
+    return dict(entries)
+
+
+def write_archive(
+    directory: Path, entries: dict[str, ArchiveEntry], *, durable: bool
+) -> None:
+    """Записать индекс архива и удалить бандлы без живых записей.
+
+    Удаляются только бандлы, на которые ссылался прежний индекс: свежий
+    бандл другого процесса, ещё не попавший в индекс, не трогается.
+    Вызывать под ``directory_lock``.
+    """
+    global _cached_archive
+    path = _archive_index_path(directory)
+    previous = {entry.bundle for entry in read_archive(directory).values()}
+    save_json(
+        path,
+        {
+            "schema_version": ARCHIVE_SCHEMA_VERSION,
+            "characters": {
+                slug: asdict(entry) for slug, entry in sorted(entries.items())
+            },
+        },
+        durable=durable,
+    )
+    stat = path.stat()
+    _cached_archive = (
+        (path.as_posix(), stat.st_mtime_ns, stat.st_size),
+        dict(entries),
+    )
+    live = {entry.bundle for entry in entries.values()}
+    for name in previous - live:
+        (archive_dir(directory) / name).unlink(missing_ok=True)
+
+
+def _compress(payload: dict[str, Any]) -> bytes:
+    """Компактный JSON персонажа, сжатый со словарём."""
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    compressor = zlib.compressobj(level=9, zdict=_ZDICT)
+    return compressor.compress(raw.encode("utf-8")) + compressor.flush()
+
+
+def write_bundle(
+    directory: Path,
+    records: dict[str, tuple[dict[str, Any], CharacterSummary]],
+    *,
+    durable: bool,
+) -> dict[str, ArchiveEntry]:
+    """Упаковать персонажей в новый бандл.
+
+    Args:
+        directory: Папка сохранений
+        records: save_slug → (словарь сохранения, сводка)
+        durable: fsync бандла до возврата
+
+    Returns:
+        Записи для индекса архива (индекс не меняется)
+    """
+    folder = archive_dir(directory)
+    folder.mkdir(parents=True, exist_ok=True)
+    name = f"{time.time_ns()}-{os.getpid()}{BUNDLE_SUFFIX}"
+    tmp = folder / f".{name}.tmp"
+    entries: dict[str, ArchiveEntry] = {}
+    offset = 0
+    try:
+        with open(tmp, "wb") as f:
+            for slug, (payload, summary) in records.items():
+                blob = _compress(payload)
+                f.write(blob)
+                entries[slug] = ArchiveEntry(name, offset, len(blob), summary)
+                offset += len(blob)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, folder / name)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return entries
+
+
+def _decode(blob: bytes, bundle: str) -> dict[str, Any]:
+    """Распаковать запись бандла.
+
+    Raises:
+        ValueError: Запись повреждена
+    """
+    try:
+        raw = zlib.decompressobj(zdict=_ZDICT).decompress(blob)
+    except zlib.error as exc:
+        raise ValueError(f"Битая запись архива: {bundle}") from exc
+    data: Any = json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"Битая запись архива: {bundle}")
+    return data
+
+
+def read_payload(directory: Path, entry: ArchiveEntry) -> dict[str, Any]:
+    """Словарь сохранения из архива (распаковывается одна запись).
+
+    Raises:
+        OSError: Бандла нет или он не читается
+        ValueError: Запись повреждена
+    """
+    with open(archive_dir(directory) / entry.bundle, "rb") as f:
+        f.seek(entry.offset)
+        blob = f.read(entry.length)
+    return _decode(blob, entry.bundle)
+
+
+def iter_payloads(
+    directory: Path, entries: dict[str, ArchiveEntry]
+) -> Iterator[tuple[str, dict[str, Any] | None]]:
+    """Словари сохранений по save_slug; каждый бандл читается один раз.
+
+    Битая запись или нечитаемый бандл — (save_slug, None).
+    """
+    by_bundle: dict[str, list[tuple[str, ArchiveEntry]]] = {}
+    for slug, entry in entries.items():
+        by_bundle.setdefault(entry.bundle, []).append((slug, entry))
+    for bundle, items in by_bundle.items():
+        try:
+            data = (archive_dir(directory) / bundle).read_bytes()
+        except OSError:
+            for slug, _entry in items:
+                yield slug, None
+            continue
+        for slug, entry in items:
+            blob = data[entry.offset : entry.offset + entry.length]
+            try:
+                yield slug, _decode(blob, bundle)
+            except ValueError:
+                yield slug, None
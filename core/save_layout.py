@@ -0,0 +1,121 @@
+"""Раскладка файлов персонажей: плоская или по шардам.
+
+- ``flat`` (по умолчанию) — ``saves/characters/{slug}.json``;
+- ``sharded`` — ``saves/characters/{xx}/{slug}.json``, где ``xx`` —
+  два hex-символа хэша save_slug (256 подпапок). На сотнях тысяч
+  сейвов ``glob`` и метаданные ФС работают с папками по сотне файлов.
+
+Раскладку задаёт файл ``.layout`` в папке сохранений (общий для всех
+процессов). Чтение прозрачно: файл персонажа ищется в обеих
+раскладках, поэтому папка в середине переноса остаётся рабочей.
+"""
+
+import hashlib
+import os
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+from core.types import SaveLayout
+
+LAYOUT_FILE_NAME = ".layout"
+DEFAULT_SAVE_LAYOUT: SaveLayout = "flat"
+
+_SHARD_GLOB = "[0-9a-f][0-9a-f]"
+
+# (путь, mtime_ns, размер) файла .layout
+type _LayoutStamp = tuple[str, int, int]
+
+_cached_layout: tuple[_LayoutStamp, SaveLayout] | None = None
+
+
+def shard_name(save_slug: str) -> str:
+    """Подпапка шарда: два hex-символа blake2b(save_slug)."""
+    return hashlib.blake2b(save_slug.encode(), digest_size=1).hexdigest()
+
+
+def read_layout(directory: Path) -> SaveLayout:
+    """Раскладка папки сохранений (нет файла — ``flat``).
+
+    Неизменившийся ``.layout`` повторно не читается: хватает его stat.
+    """
+    global _cached_layout
+    path = directory / LAYOUT_FILE_NAME
+    try:
+        stat = path.stat()
+    except OSError:
+        return DEFAULT_SAVE_LAYOUT
+    stamp = (path.as_posix(), stat.st_mtime_ns, stat.st_size)
+    if _cached_layout is not None and _cached_layout[0] == stamp:
+        return _cached_layout[1]
+    try:
+        marker = path.read_text(encoding="utf-8")
+    except OSError:
+        return DEFAULT_SAVE_LAYOUT
+    layout: SaveLayout = "sharded" if marker.strip() == "sharded" else "flat"
+    _cached_layout = (stamp, layout)
+    return layout
+
+
+def write_layout(directory: Path, layout: SaveLayout) -> None:
+    """Записать раскладку: новые сейвы пойдут в неё."""
+    marker = directory / LAYOUT_FILE_NAME
+    if layout == DEFAULT_SAVE_LAYOUT:
+        marker.unlink(missing_ok=True)
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    marker.write_text(f"{layout}\n", encoding="utf-8")
+
+
+def layout_path(directory: Path, save_slug: str, layout: SaveLayout) -> Path:
+    """Путь сейва в указанной раскладке."""
+    if layout == "sharded":
+        return directory / shard_name(save_slug) / f"{save_slug}.json"
+    return directory / f"{save_slug}.json"
+
+
+def character_path(directory: Path, save_slug: str) -> Path:
+    """Путь сейва: существующий в любой раскладке, иначе — в текущей."""
+    layout = read_layout(directory)
+    preferred = layout_path(directory, save_slug, layout)
+    if preferred.exists():
+        return preferred
+    other = layout_path(
+        directory, save_slug, "flat" if layout == "sharded" else "sharded"
+    )
+    return other if other.exists() else preferred
+
+
+def iter_save_files(directory: Path, suffix: str) -> Iterator[Path]:
+    """Файлы с suffix в корне папки и в подпапках шардов."""
+    yield from directory.glob(f"*{suffix}")
+    yield from directory.glob(f"{_SHARD_GLOB}/*{suffix}")
+
+
+def move_save(source: Path, target: Path, journal_suffix: str) -> None:
+    """Перенести сейв и его журнал в другую раскладку.
+
+    Журнал сначала появляется рядом с целью (жёсткая ссылка или копия),
+    затем переносится база: читатель без блокировки на любом шаге видит
+    базу вместе с её журналом. rename сохраняет mtime — запись индекса
+    остаётся действительной.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    journal = source.with_suffix(journal_suffix)
+    moved_journal = target.with_suffix(journal_suffix)
+    if journal.exists():
+        try:
+            os.link(journal, moved_journal)
+        except OSError:
+            shutil.copy2(journal, moved_journal)
+    os.replace(source, target)
+    journal.unlink(missing_ok=True)
+
+
+def remove_empty_shards(directory: Path) -> None:
+    """Удалить опустевшие подпапки шардов."""
+    for shard in directory.glob(_SHARD_GLOB):
+        try:
+            shard.rmdir()
+        except OSError:
+            continue
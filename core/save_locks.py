@@ -0,0 +1,242 @@
+"""Межпроцессные блокировки сохранений: ``saves/characters/.locks/``.
+
+Несколько процессов игры на одной папке ``saves/`` согласуются через
+advisory-блокировки ``fcntl.flock``:
+
+- ``.directory.lock`` — короткие операции над папкой: выбор save_slug
+  и правка индекса;
+- ``{slug}.lock`` — запись одного персонажа (база, журнал, удаление);
+- ``{slug}.reserved`` — бронь save_slug от выбора до первой записи
+  сейва. Бронь умершего процесса (или старше ``RESERVATION_TTL``)
+  считается протухшей и снимается.
+
+Блокировку ``flock`` ядро снимает само, когда процесс-владелец умирает,
+поэтому файл ``.lock`` не бывает «занят навсегда»; в нём лишь записан
+pid последнего владельца для сообщения о таймауте. Внутри процесса
+блокировка реентерабельна и разделяет потоки (таймер очереди записей
+и основной поток). На Windows ``fcntl`` нет — остаются только
+блокировки между потоками одного процесса.
+"""
+
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+
+if sys.platform != "win32":
+    import fcntl
+
+LOCKS_DIR_NAME = ".locks"
+DIRECTORY_LOCK_NAME = ".directory.lock"
+LOCK_SUFFIX = ".lock"
+RESERVATION_SUFFIX = ".reserved"
+DEFAULT_LOCK_TIMEOUT = 10.0
+RESERVATION_TTL = 600.0
+
+_POLL_INTERVAL = 0.005
+_HOLDER_WIDTH = 79
+
+
+class SaveLockTimeoutError(TimeoutError):
+    """Блокировка сохранения не получена за отведённое время."""
+
+
+class _ProcessLock:
+    """Блокировка файла в процессе: поток-владелец, глубина, fd."""
+
+    def __init__(self) -> None:
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.fd: int | None = None
+
+
+_process_locks: dict[Path, _ProcessLock] = {}
+_registry_lock = threading.Lock()
+
+
+def locks_dir(directory: Path) -> Path:
+    """Папка блокировок внутри папки сохранений."""
+    return directory / LOCKS_DIR_NAME
+
+
+def _process_lock(path: Path) -> _ProcessLock:
+    """Общая для потоков процесса блокировка пути."""
+    with _registry_lock:
+        lock = _process_locks.get(path)
+        if lock is None:
+            lock = _process_locks[path] = _ProcessLock()
+        return lock
+
+
+def _holder(path: Path) -> str:
+    """Подпись последнего владельца из файла блокировки."""
+    try:
+        return path.read_text(encoding="utf-8").strip() or "?"
+    except OSError:
+        return "?"
+
+
+def _try_flock(path: Path) -> int | None:
+    """Открыть и захватить файл блокировки; занят — None.
+
+    Файл могли удалить и создать заново, пока мы ждали: захват
+    засчитывается, только если fd указывает на текущий файл пути.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform != "win32":
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        if os.fstat(fd).st_ino != os.stat(path).st_ino:
+            raise BlockingIOError
+    except (BlockingIOError, FileNotFoundError):
+        os.close(fd)
+        return None
+    except BaseException:
+        os.close(fd)
+        raise
+    # Запись фиксированной ширины поверх прежней: без ftruncate
+    holder = f"{os.getpid()} {socket.gethostname()}".encode()
+    os.pwrite(fd, holder[:_HOLDER_WIDTH].ljust(_HOLDER_WIDTH) + b"\n", 0)
+    return fd
+
+
+def _acquire(path: Path, lock: _ProcessLock, deadline: float) -> None:
+    """Захватить flock, опрашивая до deadline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    while True:
+        fd = _try_flock(path)
+        if fd is not None:
+            lock.fd = fd
+            return
+        if time.monotonic() >= deadline:
+            raise SaveLockTimeoutError(
+                f"Сохранение занято другим процессом ({_holder(path)}):"
+                f" {path}"
+            )
+        time.sleep(_POLL_INTERVAL)
+
+
+@contextmanager
+def file_lock(
+    path: Path, timeout: float = DEFAULT_LOCK_TIMEOUT
+) -> Iterator[None]:
+    """Эксклюзивная блокировка файла между процессами и потоками.
+
+    Повторный вход из того же потока не блокируется.
+
+    Raises:
+        SaveLockTimeoutError: Блокировка не получена за timeout секунд
+    """
+    lock = _process_lock(path)
+    deadline = time.monotonic() + timeout
+    if not lock.thread_lock.acquire(timeout=timeout):
+        raise SaveLockTimeoutError(f"Сохранение занято другим потоком: {path}")
+    try:
+        if lock.depth == 0:
+            _acquire(path, lock, deadline)
+        lock.depth += 1
+        try:
+            yield
+        finally:
+            lock.depth -= 1
+            if lock.depth == 0 and lock.fd is not None:
+                # Закрытие fd снимает flock
+                os.close(lock.fd)
+                lock.fd = None
+    finally:
+        lock.thread_lock.release()
+
+
+def directory_lock(
+    directory: Path, timeout: float = DEFAULT_LOCK_TIMEOUT
+) -> AbstractContextManager[None]:
+    """Блокировка папки сохранений (выбор slug, индекс)."""
+    return file_lock(locks_dir(directory) / DIRECTORY_LOCK_NAME, timeout)
+
+
+def character_lock(
+    directory: Path, save_slug: str, timeout: float = DEFAULT_LOCK_TIMEOUT
+) -> AbstractContextManager[None]:
+    """Блокировка записи одного персонажа."""
+    return file_lock(
+        locks_dir(directory) / f"{save_slug}{LOCK_SUFFIX}", timeout
+    )
+
+
+def remove_character_lock(directory: Path, save_slug: str) -> None:
+    """Удалить файл блокировки удалённого персонажа (под его блокировкой).
+
+    Ждущий процесс заметит подмену файла по inode и захватит новый.
+    """
+    path = locks_dir(directory) / f"{save_slug}{LOCK_SUFFIX}"
+    path.unlink(missing_ok=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Процесс с pid существует на этом хосте."""
+    if sys.platform == "win32":
+        # os.kill на Windows завершает процесс: полагаемся на TTL
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _reservation_stale(path: Path) -> bool:
+    """Бронь умершего процесса этого хоста, старая или нечитаемая."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        pid = int(data["pid"])
+        host = str(data["host"])
+        created = float(data["created"])
+    except (OSError, ValueError, TypeError, KeyError):
+        return True
+    if time.time() - created > RESERVATION_TTL:
+        return True
+    return host == socket.gethostname() and not _pid_alive(pid)
+
+
+def reserved_save_slugs(directory: Path) -> set[str]:
+    """Живые брони save_slug; протухшие удаляются.
+
+    Вызывать под ``directory_lock``.
+    """
+    folder = locks_dir(directory)
+    if not folder.exists():
+        return set()
+    reserved: set[str] = set()
+    for path in folder.glob(f"*{RESERVATION_SUFFIX}"):
+        if _reservation_stale(path):
+            path.unlink(missing_ok=True)
+        else:
+            reserved.add(path.name.removesuffix(RESERVATION_SUFFIX))
+    return reserved
+
+
+def reserve_save_slug(directory: Path, save_slug: str) -> None:
+    """Забронировать save_slug до первой записи (под ``directory_lock``)."""
+    folder = locks_dir(directory)
+    folder.mkdir(parents=True, exist_ok=True)
+    record = {
+        "pid": os.getpid(),
+        "host": socket.gethostname(),
+        "created": time.time(),
+    }
+    (folder / f"{save_slug}{RESERVATION_SUFFIX}").write_text(
+        json.dumps(record), encoding="utf-8"
+    )
+
+
+def release_save_slug(directory: Path, save_slug: str) -> None:
+    """Снять бронь: сейв записан или создание не удалось."""
+    path = locks_dir(directory) / f"{save_slug}{RESERVATION_SUFFIX}"
+    path.unlink(missing_ok=True)
@@ -7,10 +7,17 @@ from pathlib import Path
 from typing import Any
 
 from core.io import load_json, save_json
-from core.types import LanguageCode, RuntimeSettings
+from core.types import (
+    DurabilityMode,
+    LanguageCode,
+    RuntimeSettings,
+    StorageBackend,
+)
 
 SETTINGS_PATH = Path("database/core/settings.json")
 DEFAULT_LANGUAGE: LanguageCode = "ru"
+DEFAULT_STORAGE: StorageBackend = "json"
+DEFAULT_DURABILITY: DurabilityMode = "safe"
 SCHEMA_VERSION = 1
 
 
@@ -19,6 +26,8 @@ def _default_settings_file() -> dict[str, Any]:
     return {
         "schema_version": SCHEMA_VERSION,
         "language": DEFAULT_LANGUAGE,
+        "storage": DEFAULT_STORAGE,
+        "durability": DEFAULT_DURABILITY,
     }
 
 
@@ -29,10 +38,28 @@ def _parse_language(value: object) -> LanguageCode:
     return "ru"
 
 
+def _parse_storage(value: object) -> StorageBackend:
+    """Извлечь хранилище персонажей из JSON."""
+    if value == "sqlite":
+        return "sqlite"
+    return "json"
+
+
+def _parse_durability(value: object) -> DurabilityMode:
+    """Извлечь режим сохранения из JSON."""
+    if value == "fast":
+        return "fast"
+    return "safe"
+
+
 def _runtime_settings(data: dict[str, Any]) -> RuntimeSettings:
     """Извлечь настройки для runtime."""
     return {
         "language": _parse_language(data.get("language", DEFAULT_LANGUAGE)),
+        "storage": _parse_storage(data.get("storage", DEFAULT_STORAGE)),
+        "durability": _parse_durability(
+            data.get("durability", DEFAULT_DURABILITY)
+        ),
     }
 
 
@@ -40,7 +67,7 @@ def load_settings() -> RuntimeSettings:
     """Загрузить настройки из JSON-файла.
 
     Returns:
-        Runtime-настройки: language
+        Runtime-настройки: language, storage, durability
     """
     if not SETTINGS_PATH.exists():
         return _runtime_settings(_default_settings_file())
@@ -54,15 +81,23 @@ def _write_settings(data: dict[str, Any]) -> None:
     save_json(SETTINGS_PATH, data)
 
 
-def save_settings(language: LanguageCode) -> None:
+def save_settings(
+    language: LanguageCode,
+    storage: StorageBackend = DEFAULT_STORAGE,
+    durability: DurabilityMode = DEFAULT_DURABILITY,
+) -> None:
     """Сохранить настройки в JSON-файл.
 
     Args:
         language: Код языка ('ru', 'en')
+        storage: Хранилище персонажей ('json', 'sqlite')
+        durability: Режим сохранения персонажей ('safe', 'fast')
     """
     _write_settings(
         {
             "schema_version": SCHEMA_VERSION,
             "language": language,
+            "storage": storage,
+            "durability": durability,
         }
     )
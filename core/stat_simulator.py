@@ -0,0 +1,240 @@
+"""Симуляция генерации характеристик (4d6 drop lowest) для баланса.
+
+Миллионы наборов из шести значений тянутся пачками:
+
+- значение характеристики — выбор из таблицы всех 6⁴ равновероятных
+  бросков 4d6 (сумма трёх лучших), поэтому пачка — один вызов
+  ``choices`` без цикла по костям;
+- с NumPy (``pip install .[sim]``) пачка — массив индексов таблицы,
+  без NumPy — ``random.choices`` и срезы списка;
+- бонусы расы не меняют бросков: выборка делается один раз, а итоги
+  по расам — сдвиг гистограмм на бонусы ``get_race_bonuses``;
+- большие выборки делятся между процессами (``processes``), итоги
+  складываются.
+
+Значения назначаются характеристикам по порядку ``STAT_NAMES``, как в
+``generate_stats_random``.
+"""
+
+import random
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from importlib.util import find_spec
+from itertools import batched, product
+from multiprocessing import get_context
+
+from core.catalog_loader import get_catalog
+from core.dice import ability_modifier
+from core.races import get_race_bonuses, get_race_def
+from core.stats import STAT_NAMES
+from core.types import SimulationBackend
+
+# Сумма трёх лучших для каждого из 6⁴ равновероятных бросков 4d6
+_ABILITY_TABLE = tuple(
+    sum(sorted(dice)[1:]) for dice in product(range(1, 7), repeat=4)
+)
+# Наборов в одной пачке: память пачки ограничена (~10 МБ без NumPy)
+SIMULATION_CHUNK = 200_000
+
+# (суммы шести значений, по характеристике: значение → выборок)
+type _SampleCounts = tuple[Counter[int], tuple[Counter[int], ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class StatDistribution:
+    """Итоги симуляции для расы (подрасы): гистограммы по выборкам."""
+
+    race_id: str
+    subrace_id: str | None
+    samples: int
+    # Сумма шести итоговых значений → число выборок
+    totals: dict[int, int]
+    # Характеристика → модификатор → число выборок
+    modifiers: dict[str, dict[int, int]]
+
+    @property
+    def mean_total(self) -> float:
+        """Средняя сумма шести значений."""
+        weighted = sum(total * count for total, count in self.totals.items())
+        return weighted / self.samples
+
+    def total_percentile(self, fraction: float) -> int:
+        """Наименьшая сумма, не превышаемая с долей выборок fraction.
+
+        Raises:
+            ValueError: fraction вне [0, 1]
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"Перцентиль вне [0, 1]: {fraction}")
+        running = 0
+        for total in sorted(self.totals):
+            running += self.totals[total]
+            if running >= fraction * self.samples:
+                return total
+        return max(self.totals)
+
+    def modifier_share(self, stat: str, modifier: int) -> float:
+        """Доля выборок с данным модификатором характеристики."""
+        return self.modifiers[stat].get(modifier, 0) / self.samples
+
+
+def numpy_available() -> bool:
+    """NumPy установлен (необязательная зависимость ``sim``)."""
+    return find_spec("numpy") is not None
+
+
+def _counts_python(samples: int, seed: int) -> _SampleCounts:
+    """Пачки без NumPy: random.choices по таблице и срезы."""
+    rng = random.Random(seed)
+    width = len(STAT_NAMES)
+    totals: Counter[int] = Counter()
+    per_stat: tuple[Counter[int], ...] = tuple(Counter() for _ in STAT_NAMES)
+    remaining = samples
+    while remaining > 0:
+        size = min(remaining, SIMULATION_CHUNK)
+        scores = rng.choices(_ABILITY_TABLE, k=size * width)
+        totals.update(map(sum, batched(scores, width)))
+        for index, counter in enumerate(per_stat):
+            counter.update(scores[index::width])
+        remaining -= size
+    return totals, per_stat
+
+
+def _counts_numpy(samples: int, seed: int) -> _SampleCounts:
+    """Пачки NumPy: массив индексов таблицы и bincount."""
+    import numpy as np
+
+    generator = np.random.default_rng(seed)
+    table = np.asarray(_ABILITY_TABLE, dtype=np.int16)
+    width = len(STAT_NAMES)
+    total_bins = np.zeros(18 * width + 1, dtype=np.int64)
+    stat_bins = np.zeros((width, 19), dtype=np.int64)
+    remaining = samples
+    while remaining > 0:
+        size = min(remaining, SIMULATION_CHUNK)
+        scores = table[generator.integers(0, len(table), size=(size, width))]
+        total_bins += np.bincount(
+            scores.sum(axis=1), minlength=len(total_bins)
+        )
+        for index in range(width):
+            stat_bins[index] += np.bincount(scores[:, index], minlength=19)
+        remaining -= size
+    totals = Counter(
+        {value: int(count) for value, count in enumerate(total_bins) if count}
+    )
+    per_stat = tuple(
+        Counter(
+            {value: int(count) for value, count in enumerate(row) if count}
+        )
+        for row in stat_bins
+    )
+    return totals, per_stat
+
+
+def _sample_counts(samples: int, seed: int, use_numpy: bool) -> _SampleCounts:
+    """Гистограммы базовых наборов (без бонусов) одного процесса."""
+    if use_numpy:
+        return _counts_numpy(samples, seed)
+    return _counts_python(samples, seed)
+
+
+def _merge(parts: Iterable[_SampleCounts]) -> _SampleCounts:
+    """Сложить гистограммы процессов."""
+    totals: Counter[int] = Counter()
+    per_stat: tuple[Counter[int], ...] = tuple(Counter() for _ in STAT_NAMES)
+    for part_totals, part_stats in parts:
+        totals.update(part_totals)
+        for counter, part in zip(per_stat, part_stats, strict=True):
+            counter.update(part)
+    return totals, per_stat
+
+
+def race_variants() -> list[tuple[str, str | None]]:
+    """Все расы каталога с подрасами: (race_id, subrace_id)."""
+    variants: list[tuple[str, str | None]] = []
+    for race_id in sorted(get_catalog("races")):
+        race = get_race_def(race_id)
+        if race is None:
+            continue
+        if race.subraces:
+            variants.extend((race_id, sub) for sub in sorted(race.subraces))
+        else:
+            variants.append((race_id, None))
+    return variants
+
+
+def _race_distribution(
+    counts: _SampleCounts, samples: int, race_id: str, subrace_id: str | None
+) -> StatDistribution:
+    """Итоги расы: гистограммы базовых наборов, сдвинутые на бонусы."""
+    base_totals, base_stats = counts
+    bonuses = get_race_bonuses(race_id, subrace_id)
+    shift = sum(bonuses.get(stat, 0) for stat in STAT_NAMES)
+    modifiers: dict[str, dict[int, int]] = {}
+    for stat, scores in zip(STAT_NAMES, base_stats, strict=True):
+        bonus = bonuses.get(stat, 0)
+        by_modifier: Counter[int] = Counter()
+        for score, count in scores.items():
+            by_modifier[ability_modifier(score + bonus)] += count
+        modifiers[stat] = dict(sorted(by_modifier.items()))
+    return StatDistribution(
+        race_id=race_id,
+        subrace_id=subrace_id,
+        samples=samples,
+        totals={total + shift: count for total, count in base_totals.items()},
+        modifiers=modifiers,
+    )
+
+
+def simulate_stats(
+    samples: int,
+    races: Iterable[tuple[str, str | None]] | None = None,
+    *,
+    seed: int | None = None,
+    processes: int = 1,
+    backend: SimulationBackend = "auto",
+) -> list[StatDistribution]:
+    """Распределения сумм и модификаторов по расам методом Монте-Карло.
+
+    Args:
+        samples: Сколько наборов из шести значений сгенерировать
+        races: Пары (race_id, subrace_id); None — все из каталога
+        seed: Зерно для воспроизводимости (при том же processes)
+        processes: Процессов для выборки (1 — в текущем)
+        backend: ``numpy``, ``python`` или ``auto`` (NumPy, если есть)
+
+    Returns:
+        Итоги по расам в порядке races
+
+    Raises:
+        ValueError: samples или processes меньше 1
+        ModuleNotFoundError: backend ``numpy`` без установленного NumPy
+    """
+    if samples < 1 or processes < 1:
+        raise ValueError("samples и processes должны быть не меньше 1")
+    use_numpy = backend == "numpy" or (backend == "auto" and numpy_available())
+    if use_numpy and not numpy_available():
+        raise ModuleNotFoundError("Для backend='numpy' нужен NumPy")
+    seeder = random.Random(seed)
+    workers = min(processes, samples)
+    sizes = [
+        samples // workers + (1 if index < samples % workers else 0)
+        for index in range(workers)
+    ]
+    seeds = [seeder.getrandbits(64) for _ in sizes]
+    if workers == 1:
+        counts = _sample_counts(samples, seeds[0], use_numpy)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn")
+        ) as pool:
+            counts = _merge(
+                pool.map(_sample_counts, sizes, seeds, [use_numpy] * workers)
+            )
+    variants = list(races) if races is not None else race_variants()
+    return [
+        _race_distribution(counts, samples, race_id, subrace_id)
+        for race_id, subrace_id in variants
+    ]
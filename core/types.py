@@ -1,14 +1,20 @@
 """Общие типы домена (PEP 695 / PEP 692)."""
 
-from typing import Any, Literal, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict
 
 type StatMap = dict[str, int]
 type StringsDict = dict[str, Any]
 type GameDifficulty = Literal["easy", "normal", "hardcore"]
 type LanguageCode = Literal["ru", "en"]
+type StorageBackend = Literal["json", "sqlite"]
+type DurabilityMode = Literal["safe", "fast"]
+type SaveLayout = Literal["flat", "sharded"]
+type SimulationBackend = Literal["auto", "numpy", "python"]
 
 
 class RuntimeSettings(TypedDict):
     """Runtime-настройки пользователя."""
 
     language: LanguageCode
+    storage: NotRequired[StorageBackend]
+    durability: NotRequired[DurabilityMode]
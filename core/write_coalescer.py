@@ -0,0 +1,105 @@
+"""Group commit: повторные записи одного ключа сливаются в одну.
+
+Режим сохранения ``fast``: ``update_character`` после каждого действия
+сценария не пишет файл сразу, а кладёт персонажа в очередь по
+save_slug. Очередь сбрасывается по короткому таймеру, перед чтением
+сохранений и при выходе из процесса — на диск попадает последнее
+состояние каждого персонажа.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COALESCE_DELAY = 0.5
+
+
+@dataclass(frozen=True)
+class WriteStats:
+    """Счётчики записей: выполненные и поглощённые более поздними."""
+
+    issued: int = 0
+    coalesced: int = 0
+
+
+class WriteCoalescer[K, V]:
+    """Очередь отложенных записей по ключу с таймером сброса."""
+
+    def __init__(
+        self,
+        write: Callable[[V], None],
+        delay: float = DEFAULT_COALESCE_DELAY,
+    ) -> None:
+        self._write = write
+        self.delay = delay
+        # RLock: запись под замком сериализует таймер и основной поток
+        self._lock = threading.RLock()
+        self._pending: dict[K, V] = {}
+        self._timer: threading.Timer | None = None
+        self._issued = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> WriteStats:
+        """Снимок счётчиков."""
+        with self._lock:
+            return WriteStats(issued=self._issued, coalesced=self._coalesced)
+
+    def pending(self) -> int:
+        """Число ключей, ждущих записи."""
+        with self._lock:
+            return len(self._pending)
+
+    def write(self, value: V) -> None:
+        """Записать сразу (режим ``safe`` и новые персонажи)."""
+        with self._lock:
+            self._write(value)
+            self._issued += 1
+
+    def submit(self, key: K, value: V) -> None:
+        """Отложить запись; прежняя запись того же ключа поглощается."""
+        with self._lock:
+            if key in self._pending:
+                self._coalesced += 1
+            self._pending[key] = value
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self._flush_quietly)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def discard(self, key: K | None = None) -> None:
+        """Отменить отложенную запись ключа (None — всех ключей)."""
+        with self._lock:
+            if key is None:
+                self._pending.clear()
+            else:
+                self._pending.pop(key, None)
+
+    def flush(self) -> int:
+        """Записать всё отложенное; число записей."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            written = 0
+            # Ключ покидает очередь только после успешной записи
+            while self._pending:
+                key = next(iter(self._pending))
+                self._write(self._pending[key])
+                del self._pending[key]
+                self._issued += 1
+                written += 1
+            return written
+
+    def _flush_quietly(self) -> None:
+        """Сброс по таймеру: ошибка записи не роняет фоновый поток.
+
+        Незаписанный ключ остаётся в очереди до следующего сброса.
+        """
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Отложенная запись не выполнена")
@@ -4,6 +4,8 @@
 и запускает цикл главного меню.
 """
 
+import argparse
+import atexit
 import sys
 import tomllib
 from importlib.metadata import PackageNotFoundError, version
@@ -11,8 +13,25 @@ from pathlib import Path
 
 from colorama import Fore, Style, init
 
+from core.catalog_loader import rebuild_catalog_snapshots
+from core.catalog_warmup import start_catalog_warmup
+from core.catalog_watcher import poll_catalog_changes, start_catalog_watcher
+from core.character import (
+    archive_cold_characters,
+    close_character_storage,
+    migrate_save_layout,
+    set_durability_mode,
+    set_load_workers,
+    set_storage_backend,
+    transfer_characters,
+)
 from core.localization import get_string, load_strings
-from core.settings import load_settings, save_settings
+from core.settings import (
+    DEFAULT_DURABILITY,
+    DEFAULT_STORAGE,
+    load_settings,
+    save_settings,
+)
 from core.types import RuntimeSettings, StringsDict
 from ui.menus import (
     show_characters_menu,
@@ -61,32 +80,126 @@ def _save_and_reload_settings(
     Returns:
         Кортеж (обновлённые_настройки, обновлённые_строки)
     """
-    save_settings(language=settings["language"])
+    storage = settings.get("storage", DEFAULT_STORAGE)
+    durability = settings.get("durability", DEFAULT_DURABILITY)
+    save_settings(
+        language=settings["language"], storage=storage, durability=durability
+    )
+    set_storage_backend(storage)
+    set_durability_mode(durability)
     strings = load_strings(settings["language"])
     return settings, strings
 
 
-def main() -> int:
+def _build_parser() -> argparse.ArgumentParser:
+    """Аргументы командной строки."""
+    parser = argparse.ArgumentParser(prog="dnd_mud", description=__doc__)
+    parser.add_argument(
+        "--rebuild-catalog-cache",
+        action="store_true",
+        help="пересобрать снапшоты каталогов в .cache/ и выйти",
+    )
+    parser.add_argument(
+        "--watch-catalogs",
+        action="store_true",
+        help="подхватывать правки database/ и mods/ без перезапуска",
+    )
+    parser.add_argument(
+        "--warm-catalogs",
+        action="store_true",
+        help="загружать каталоги в фоне, пока открыто приветствие и меню",
+    )
+    parser.add_argument(
+        "--copy-characters",
+        nargs=2,
+        choices=("json", "sqlite"),
+        metavar=("SRC", "DST"),
+        help="перенести персонажей между хранилищами (json, sqlite) и выйти",
+    )
+    parser.add_argument(
+        "--migrate-saves",
+        choices=("flat", "sharded"),
+        metavar="LAYOUT",
+        help="перенести JSON-сейвы в раскладку flat или sharded и выйти",
+    )
+    parser.add_argument(
+        "--archive-saves",
+        type=int,
+        metavar="DAYS",
+        help="упаковать в архив персонажей, не менявшихся DAYS дней, и выйти",
+    )
+    parser.add_argument(
+        "--load-workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="потоков разбора сохранений при загрузке списка персонажей",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
     """Запустить игру.
 
+    Args:
+        argv: Аргументы командной строки (None — sys.argv)
+
     Returns:
         0 при успешном завершении
     """
+    args = _build_parser().parse_args(argv)
+
     # Инициализация цветного вывода в терминале
     init(autoreset=True)
 
     # Загружаем настройки
     settings = load_settings()
+    set_storage_backend(settings.get("storage", DEFAULT_STORAGE))
+    set_durability_mode(settings.get("durability", DEFAULT_DURABILITY))
+    # При выходе: отложенные записи и сворачивание журналов
+    atexit.register(close_character_storage)
 
     # Загружаем строки интерфейса на выбранном языке
     strings = load_strings(settings["language"])
 
+    if args.rebuild_catalog_cache:
+        count = rebuild_catalog_snapshots()
+        print(get_string(strings, "info.catalog_cache_rebuilt", count=count))
+        return 0
+
+    if args.copy_characters:
+        source, target = args.copy_characters
+        count = transfer_characters(source, target)
+        print(get_string(strings, "info.characters_copied", count=count))
+        return 0
+
+    if args.migrate_saves:
+        count = migrate_save_layout(args.migrate_saves)
+        print(get_string(strings, "info.saves_migrated", count=count))
+        return 0
+
+    if args.archive_saves is not None:
+        count = archive_cold_characters(args.archive_saves)
+        print(get_string(strings, "info.saves_archived", count=count))
+        return 0
+
+    set_load_workers(args.load_workers)
+
+    if args.watch_catalogs:
+        start_catalog_watcher()
+
+    if args.warm_catalogs:
+        start_catalog_warmup()
+
     # Показываем приветствие
     show_welcome_screen(VERSION, strings)
 
     # Главный цикл меню
     running = True
     while running:
+        # При --watch-catalogs строки могли смениться на любом экране
+        poll_catalog_changes()
+        strings = load_strings(settings["language"])
         choice = show_main_menu(strings)
 
         match choice:
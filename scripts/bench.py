@@ -0,0 +1,1312 @@
+#!/usr/bin/env python3
+"""Микробенчмарки горячих путей dnd_mud.
+
+Запуск из корня репозитория: ``python -m scripts.bench <сценарий>``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _median_ms(samples: list[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+def _timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def _print_row(label: str, value_ms: float) -> None:
+    print(f"  {label:<28} {value_ms:9.2f} ms")
+
+
+def _print_speedup(before: list[float], after: list[float]) -> None:
+    ratio = statistics.median(before) / statistics.median(after)
+    print(f"  ускорение: x{ratio:.1f}")
+
+
+def cmd_catalog_snapshot(args: argparse.Namespace) -> int:
+    """Холодный (PyYAML) и тёплый (снапшот) старт загрузки каталогов."""
+    import core.catalog_snapshot as snapshot_mod
+    from core.catalog_loader import (
+        catalog_source_files,
+        clear_catalog_cache,
+    )
+    from core.mod_loader import load_merged_yaml
+
+    sources = catalog_source_files()
+
+    def load_all() -> None:
+        for path in sources:
+            load_merged_yaml(path)
+
+    cold: list[float] = []
+    warm: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_mod.SNAPSHOT_DIR = Path(tmp)
+        for _ in range(args.rounds):
+            snapshot_mod.clear_snapshots()
+            clear_catalog_cache()
+            cold.append(_timed(load_all))
+            clear_catalog_cache()
+            warm.append(_timed(load_all))
+
+    print(f"catalog-snapshot: {len(sources)} файлов, {args.rounds} раундов")
+    _print_row("cold (PyYAML + запись)", _median_ms(cold))
+    _print_row("warm (снапшот marshal)", _median_ms(warm))
+    _print_speedup(cold, warm)
+    return 0
+
+
+def _retained_bytes(func: Callable[[], list[object]]) -> int:
+    """Байты, удерживаемые результатом func (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        kept = func()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+def _peak_bytes(func: Callable[[], object]) -> int:
+    """Пик памяти во время func (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def cmd_catalog_views(args: argparse.Namespace) -> int:
+    """Поиск оружия/черт: копии dict(info) против read-only видов."""
+    from core.catalog_loader import get_catalog
+    from core.equipment import load_weapon, weapon_category
+    from core.feats_loader import load_feat
+
+    weapons = get_catalog("weapons")
+    feats = get_catalog("feats")
+    lookups = [
+        *(("w", wid) for wid in weapons),
+        *(("f", fid) for fid in feats),
+    ]
+    repeat = 200
+
+    def copy_lookup(kind: str, entry_id: str) -> object:
+        # Тела load_weapon / load_feat до read-only видов
+        info = get_catalog("weapons" if kind == "w" else "feats").get(entry_id)
+        entry = dict(info) if isinstance(info, dict) else {}
+        if kind == "f":
+            entry["id"] = entry_id
+        return entry
+
+    def view_lookup(kind: str, entry_id: str) -> object:
+        if kind == "w":
+            return load_weapon(entry_id)
+        return load_feat(entry_id)
+
+    def run_copies() -> list[object]:
+        return [copy_lookup(*item) for _ in range(repeat) for item in lookups]
+
+    def run_views() -> list[object]:
+        return [view_lookup(*item) for _ in range(repeat) for item in lookups]
+
+    def category_loop() -> None:
+        for _ in range(repeat):
+            for wid in weapons:
+                weapon_category(wid)
+
+    run_views()
+    copies = [_timed(run_copies) for _ in range(args.rounds)]
+    views = [_timed(run_views) for _ in range(args.rounds)]
+    calls = repeat * len(lookups)
+    copy_bytes = _retained_bytes(run_copies)
+    view_bytes = _retained_bytes(run_views)
+
+    print(f"catalog-views: {calls} поисков, {args.rounds} раундов")
+    _print_row("dict(info) копии", _median_ms(copies))
+    _print_row("read-only виды", _median_ms(views))
+    _print_speedup(copies, views)
+    print(
+        f"  байт на поиск: копии {copy_bytes / calls:.0f}, "
+        f"виды {view_bytes / calls:.0f}"
+    )
+    loop = [_timed(category_loop) for _ in range(args.rounds)]
+    _print_row(f"weapon_category x{repeat * len(weapons)}", _median_ms(loop))
+    return 0
+
+
+def cmd_catalog_warmup(args: argparse.Namespace) -> int:
+    """Первое обращение к каталогам: холодное vs после фонового прогрева."""
+    import core.catalog_snapshot as snapshot_mod
+    import ui.menus  # noqa: F401 — объявляет все каталоги
+    from core.catalog_loader import clear_catalog_cache
+    from core.catalog_registry import CATALOGS
+    from core.catalog_warmup import start_catalog_warmup
+
+    names = CATALOGS.names()
+
+    def touch_all() -> None:
+        for name in names:
+            CATALOGS.warm(name)
+
+    cold: list[float] = []
+    warmup: list[float] = []
+    after: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_mod.SNAPSHOT_DIR = Path(tmp)
+        for _ in range(args.rounds):
+            snapshot_mod.clear_snapshots()
+            clear_catalog_cache()
+            cold.append(_timed(touch_all))
+            snapshot_mod.clear_snapshots()
+            clear_catalog_cache()
+            warmup.append(_timed(lambda: start_catalog_warmup().wait()))
+            after.append(_timed(touch_all))
+
+    print(f"catalog-warmup: {len(names)} каталогов, {args.rounds} раундов")
+    _print_row("холодный первый экран", _median_ms(cold))
+    _print_row("прогрев в фоне (стена)", _median_ms(warmup))
+    _print_row("первый экран после прогрева", _median_ms(after))
+    return 0
+
+
+def cmd_strings_render(args: argparse.Namespace) -> int:
+    """Отрисовка экранов: плоская таблица строк vs спуск по словарям."""
+    import contextlib
+    import io
+
+    from core.localization import StringTable, get_string, load_strings
+    from core.models import Character
+    from ui.menus._display._character import _print_character_card
+
+    table = load_strings("ru")
+    assert isinstance(table, StringTable)
+    tree = dict(table)  # обычный словарь — прежний путь get_string
+    keys = list(table.templates)
+    char = Character(
+        name="Арагорн",
+        race="human",
+        class_id="fighter",
+        level=3,
+        subclass_id="champion",
+        current_hp=28,
+        max_hp=28,
+        stats={"strength": 16, "dexterity": 14, "constitution": 14},
+    )
+    repeat = 50
+
+    def sweep(strings: dict[str, object]) -> Callable[[], None]:
+        def run() -> None:
+            for _ in range(repeat):
+                for key in keys:
+                    get_string(strings, key, name="x", count=1)
+
+        return run
+
+    def cards(strings: dict[str, object]) -> Callable[[], None]:
+        def run() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                for idx in range(repeat):
+                    _print_character_card(idx, char, strings, "ru")
+
+        return run
+
+    sweep_tree = [_timed(sweep(tree)) for _ in range(args.rounds)]
+    sweep_table = [_timed(sweep(table)) for _ in range(args.rounds)]
+    cards_tree = [_timed(cards(tree)) for _ in range(args.rounds)]
+    cards_table = [_timed(cards(table)) for _ in range(args.rounds)]
+
+    print(f"strings-render: {len(keys)} ключей, {args.rounds} раундов")
+    _print_row(
+        f"get_string x{repeat * len(keys)}: дерево", _median_ms(sweep_tree)
+    )
+    _print_row("то же: плоская таблица", _median_ms(sweep_table))
+    _print_speedup(sweep_tree, sweep_table)
+    _print_row(f"карточка x{repeat}: дерево", _median_ms(cards_tree))
+    _print_row("то же: плоская таблица", _median_ms(cards_table))
+    _print_speedup(cards_tree, cards_table)
+    return 0
+
+
+def cmd_menu_redraw(args: argparse.Namespace) -> int:
+    """Перерисовка меню: сборка строк каталогов vs кэш по языку."""
+    from core.backgrounds import _background_rows, load_backgrounds
+    from core.catalog_loader import get_catalog
+    from core.classes import _class_rows, load_classes
+    from core.equipment import _catalog_token_label, proficiency_token_label
+    from core.languages import _language_rows, load_languages
+    from core.localization import load_strings
+    from core.races import _race_rows, load_races
+
+    strings = load_strings("ru")
+    tokens = [*get_catalog("weapons"), *get_catalog("armor")]
+    repeat = 20
+
+    def rebuild() -> None:
+        for _ in range(repeat):
+            _race_rows("ru")
+            _class_rows("ru")
+            _background_rows("ru")
+            _language_rows("ru")
+            for token in tokens:
+                _catalog_token_label(token, "ru")
+
+    def cached() -> None:
+        for _ in range(repeat):
+            load_races("ru")
+            load_classes("ru")
+            load_backgrounds("ru")
+            load_languages("ru")
+            for token in tokens:
+                proficiency_token_label(token, strings, "ru")
+
+    cached()
+    before = [_timed(rebuild) for _ in range(args.rounds)]
+    after = [_timed(cached) for _ in range(args.rounds)]
+    print(f"menu-redraw: {repeat} перерисовок, {len(tokens)} токенов")
+    _print_row("сборка на каждый вызов", _median_ms(before))
+    _print_row("кэш по (версия, язык)", _median_ms(after))
+    _print_speedup(before, after)
+    return 0
+
+
+def _write_character_saves(directory: Path, count: int) -> None:
+    """Папка с count сохранениями (JSON как у save_character)."""
+    import json
+
+    from core.models import Character
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for idx in range(count):
+        char = Character(
+            name=f"Hero {idx}",
+            race="human",
+            class_id="fighter",
+            level=1 + idx % 20,
+            stats={"strength": 15, "dexterity": 14, "constitution": 13},
+            current_hp=12,
+            max_hp=12,
+            save_slug=f"hero_{idx}",
+            created_at=f"2026-01-01T00:00:{idx % 60:02d}+00:00",
+        )
+        (directory / f"hero_{idx}.json").write_text(
+            json.dumps({"schema_version": 1, **char.to_dict()}, indent=2),
+            encoding="utf-8",
+        )
+
+
+def cmd_saves_index(args: argparse.Namespace) -> int:
+    """Выбор slug и список сохранений: разбор всех JSON vs индекс."""
+    import core.character_storage as storage_mod
+
+    def parse_all_slugs() -> None:
+        # Прежний _existing_save_slugs: открыть каждый сейв
+        slugs = set()
+        for path in storage_mod._character_paths():
+            slugs.add(path.stem)
+            character = storage_mod._load_character_file(path)
+            if character is not None and character.save_slug:
+                slugs.add(character.save_slug)
+
+    for count in (200, 1000):
+        with tempfile.TemporaryDirectory() as tmp:
+            storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+            _write_character_saves(storage_mod.CHARACTERS_DIR, count)
+            build = _timed(storage_mod.refresh_character_index)
+            parsed = [_timed(parse_all_slugs) for _ in range(args.rounds)]
+            indexed = [
+                _timed(storage_mod._existing_save_slugs)
+                for _ in range(args.rounds)
+            ]
+            listing = [
+                _timed(storage_mod.list_character_summaries)
+                for _ in range(args.rounds)
+            ]
+            full = [
+                _timed(storage_mod.load_characters) for _ in range(args.rounds)
+            ]
+        print(f"saves-index: {count} сохранений, {args.rounds} раундов")
+        _print_row("сборка индекса с нуля", build * 1000)
+        _print_row("slug: разбор всех JSON", _median_ms(parsed))
+        _print_row("slug: индекс", _median_ms(indexed))
+        _print_speedup(parsed, indexed)
+        _print_row("список: load_characters", _median_ms(full))
+        _print_row("список: сводки индекса", _median_ms(listing))
+        _print_speedup(full, listing)
+    return 0
+
+
+def cmd_storage_backends(args: argparse.Namespace) -> int:
+    """JSON-файлы vs SQLite: перенос, сводки, полный список, сохранение."""
+    import core.character_storage as storage_mod
+    from core.character_sqlite import close_sqlite_stores
+
+    for count in (200, 1000):
+        with tempfile.TemporaryDirectory() as tmp:
+            storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+            storage_mod.CHARACTERS_DB = Path(tmp) / "characters.sqlite3"
+            _write_character_saves(storage_mod.CHARACTERS_DIR, count)
+            storage_mod.refresh_character_index()
+            copy = _timed(
+                partial(storage_mod.transfer_characters, "json", "sqlite")
+            )
+            rows: dict[str, dict[str, list[float]]] = {}
+            for backend in ("json", "sqlite"):
+                store = storage_mod.character_store(backend)
+                character = store.load("hero_0")
+                assert character is not None
+                rows[backend] = {
+                    "summaries": [
+                        _timed(store.summaries) for _ in range(args.rounds)
+                    ],
+                    "load_all": [
+                        _timed(store.load_all) for _ in range(args.rounds)
+                    ],
+                    "save": [
+                        _timed(partial(store.save, character))
+                        for _ in range(args.rounds)
+                    ],
+                }
+            close_sqlite_stores()
+        print(f"storage-backends: {count} персонажей, {args.rounds} раундов")
+        _print_row("перенос json → sqlite", copy * 1000)
+        for metric in ("summaries", "load_all", "save"):
+            json_times = rows["json"][metric]
+            sqlite_times = rows["sqlite"][metric]
+            _print_row(f"{metric}: json", _median_ms(json_times))
+            _print_row(f"{metric}: sqlite", _median_ms(sqlite_times))
+            _print_speedup(json_times, sqlite_times)
+    return 0
+
+
+def cmd_save_durability(args: argparse.Namespace) -> int:
+    """update_character x N: прямая запись, safe (fsync), fast (слияние)."""
+    import core.character_storage as storage_mod
+    from core.io import save_json
+
+    updates = 50
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+        _write_character_saves(storage_mod.CHARACTERS_DIR, 1)
+        hero = storage_mod.character_store().load("hero_0")
+        assert hero is not None
+        path = storage_mod._character_file_path("hero_0")
+
+        def direct() -> None:
+            # Прежняя запись: open("w") прямо в файл сейва
+            import json
+
+            for _ in range(updates):
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(hero.to_dict(), f, ensure_ascii=False, indent=2)
+
+        def atomic(durable: bool) -> None:
+            for _ in range(updates):
+                save_json(path, hero.to_dict(), durable=durable)
+
+        def mode(name: str) -> None:
+            storage_mod.set_durability_mode(
+                "fast" if name == "fast" else "safe"
+            )
+            for level in range(updates):
+                hero.level = 1 + level % 20
+                storage_mod.update_character(hero)
+            storage_mod.flush_character_writes()
+
+        rows = {
+            "open('w')": [_timed(direct) for _ in range(args.rounds)],
+            "tmp+rename": [
+                _timed(partial(atomic, False)) for _ in range(args.rounds)
+            ],
+            "tmp+fsync+rename": [
+                _timed(partial(atomic, True)) for _ in range(args.rounds)
+            ],
+            "update: safe": [
+                _timed(partial(mode, "safe")) for _ in range(args.rounds)
+            ],
+            "update: fast": [
+                _timed(partial(mode, "fast")) for _ in range(args.rounds)
+            ],
+        }
+        stats = storage_mod.character_write_stats()
+    print(f"save-durability: {updates} обновлений, {args.rounds} раундов")
+    for label, times in rows.items():
+        _print_row(label, _median_ms(times))
+    _print_speedup(rows["update: safe"], rows["update: fast"])
+    print(f"  записей: {stats.issued}, слито: {stats.coalesced}")
+    return 0
+
+
+def cmd_load_saves(args: argparse.Namespace) -> int:
+    """load_characters: последовательно vs пул потоков; первый из потока."""
+    import core.character_storage as storage_mod
+
+    def first_item() -> None:
+        # Поток без пула: первый персонаж сразу после первого файла
+        next(storage_mod.iter_characters(workers=1))
+
+    for count in args.saves:
+        # 100k сейвов: один раунд, иначе бенчмарк идёт минутами
+        rounds = max(1, min(args.rounds, 300_000 // count))
+        with tempfile.TemporaryDirectory() as tmp:
+            storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+            _write_character_saves(storage_mod.CHARACTERS_DIR, count)
+            storage_mod.refresh_character_index()
+            serial = [
+                _timed(partial(storage_mod.load_characters, 1))
+                for _ in range(rounds)
+            ]
+            pooled = [
+                _timed(partial(storage_mod.load_characters, args.workers))
+                for _ in range(rounds)
+            ]
+            first = [_timed(first_item) for _ in range(rounds)]
+        print(f"load-saves: {count} сохранений, {rounds} раундов")
+        _print_row("последовательно", _median_ms(serial))
+        _print_row(f"пул из {args.workers} потоков", _median_ms(pooled))
+        _print_speedup(serial, pooled)
+        _print_row("первый персонаж из потока", _median_ms(first))
+    return 0
+
+
+def cmd_characters_hub(args: argparse.Namespace) -> int:
+    """Экран «Персонажи»: все карточки vs одна страница сводок."""
+    import contextlib
+    import io
+
+    import core.character_storage as storage_mod
+    from core.localization import load_strings
+    from ui.menus._display import _print_character_page, _print_characters_list
+
+    strings = load_strings("ru")
+
+    def full_list() -> None:
+        # Прежний хаб: загрузить всех и вывести карточку каждого
+        characters = list(storage_mod.load_characters().characters)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _print_characters_list(strings, characters, "ru")
+
+    def one_page() -> None:
+        page = storage_mod.list_character_page(0, 10)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _print_character_page(
+                strings,
+                page.summaries,
+                "ru",
+                page=1,
+                pages=1,
+                total=page.total,
+            )
+
+    for count in (200, 1000):
+        with tempfile.TemporaryDirectory() as tmp:
+            storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+            _write_character_saves(storage_mod.CHARACTERS_DIR, count)
+            storage_mod.refresh_character_index()
+            full = [_timed(full_list) for _ in range(args.rounds)]
+            paged = [_timed(one_page) for _ in range(args.rounds)]
+            full_bytes = _peak_bytes(full_list)
+            paged_bytes = _peak_bytes(one_page)
+        print(f"characters-hub: {count} персонажей, {args.rounds} раундов")
+        _print_row("все карточки", _median_ms(full))
+        _print_row("страница из 10 сводок", _median_ms(paged))
+        _print_speedup(full, paged)
+        print(f"  пик памяти: {full_bytes} → {paged_bytes} байт")
+    return 0
+
+
+def cmd_save_journal(args: argparse.Namespace) -> int:
+    """update_character x N: полный JSON vs журнал полей."""
+    import core.character_storage as storage_mod
+    from core.character_journal import journal_path
+    from core.models import Character
+
+    updates = 40
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+        storage_mod.set_durability_mode("fast")
+        _write_character_saves(storage_mod.CHARACTERS_DIR, 200)
+        hero = storage_mod.character_store().load("hero_0")
+        assert hero is not None
+        path = storage_mod._character_file_path("hero_0")
+
+        def steps(write: Callable[[Character], None]) -> None:
+            for step in range(updates):
+                hero.experience += 50
+                hero.level = 1 + step // 10
+                write(hero)
+
+        full = [
+            _timed(partial(steps, storage_mod._save_character_file))
+            for _ in range(args.rounds)
+        ]
+        full_bytes = path.stat().st_size * updates
+        storage_mod._save_character_file(hero)
+        journaled = [
+            _timed(partial(steps, storage_mod._journal_character))
+            for _ in range(args.rounds)
+        ]
+        storage_mod.compact_character_journals()
+        steps(storage_mod._journal_character)
+        journal_bytes = journal_path(path).stat().st_size
+    print(f"save-journal: {updates} обновлений, {args.rounds} раундов")
+    _print_row("полный JSON (+индекс)", _median_ms(full))
+    _print_row("журнал полей", _median_ms(journaled))
+    _print_speedup(full, journaled)
+    print(f"  записано байт: {full_bytes} → {journal_bytes}")
+    return 0
+
+
+def _create_heroes(directory: str, count: int) -> list[str]:
+    """Процесс save-locks: count новых персонажей с одним именем."""
+    import core.character_storage as storage_mod
+
+    storage_mod.CHARACTERS_DIR = Path(directory)
+    storage_mod.set_durability_mode("fast")
+    return [
+        storage_mod.save_character(
+            name="Hero", race_id="human", class_id="fighter"
+        ).save_slug
+        or ""
+        for _ in range(count)
+    ]
+
+
+def cmd_save_locks(args: argparse.Namespace) -> int:
+    """Блокировки сейвов: цена в одном процессе и гонка нескольких."""
+    import multiprocessing
+    from contextlib import nullcontext
+
+    import core.character_storage as storage_mod
+
+    updates = 200
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+        storage_mod.set_durability_mode("fast")
+        _write_character_saves(storage_mod.CHARACTERS_DIR, 200)
+        hero = storage_mod.character_store().load("hero_0")
+        assert hero is not None
+
+        def steps() -> None:
+            for _ in range(updates):
+                hero.experience += 1
+                storage_mod.update_character(hero)
+                storage_mod.flush_character_writes()
+
+        locked = [_timed(steps) for _ in range(args.rounds)]
+        names = ("character_lock", "directory_lock")
+        real_locks = [getattr(storage_mod, name) for name in names]
+        for name in names:
+            setattr(storage_mod, name, lambda *_a: nullcontext())
+        unlocked = [_timed(steps) for _ in range(args.rounds)]
+        for name, lock in zip(names, real_locks, strict=True):
+            setattr(storage_mod, name, lock)
+
+        directory = str(Path(tmp) / "shared")
+        start = time.perf_counter()
+        with multiprocessing.get_context("spawn").Pool(args.processes) as pool:
+            batches = pool.starmap(
+                _create_heroes,
+                [(directory, args.saves)] * args.processes,
+            )
+        elapsed = time.perf_counter() - start
+    slugs = [slug for batch in batches for slug in batch]
+    print(f"save-locks: {updates} обновлений, {args.rounds} раундов")
+    _print_row("без блокировок", _median_ms(unlocked))
+    _print_row("flock персонажа + папки", _median_ms(locked))
+    print(
+        f"  {args.processes} процессов × {args.saves} новых «Hero»:"
+        f" {len(slugs)} сейвов за {elapsed:.2f} с,"
+        f" дублей slug: {len(slugs) - len(set(slugs))}"
+    )
+    return 0
+
+
+def cmd_save_layout(args: argparse.Namespace) -> int:
+    """Плоская папка vs шарды: листинг, индекс, чтение по slug, перенос."""
+    import core.character_storage as storage_mod
+
+    slugs = [f"hero_{idx}" for idx in range(0, args.saves, 97)]
+
+    def load_by_slug() -> None:
+        for slug in slugs:
+            storage_mod.character_store().load(slug)
+
+    rows: dict[str, list[list[float]]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+        _write_character_saves(storage_mod.CHARACTERS_DIR, args.saves)
+        storage_mod.refresh_character_index()
+        migrated: dict[str, float] = {}
+        for layout in ("flat", "sharded"):
+            if layout == "sharded":
+                start = time.perf_counter()
+                storage_mod.migrate_save_layout("sharded")
+                migrated[layout] = time.perf_counter() - start
+            rows[layout] = [
+                [
+                    _timed(storage_mod._character_paths)
+                    for _ in range(args.rounds)
+                ],
+                [
+                    _timed(storage_mod.refresh_character_index)
+                    for _ in range(args.rounds)
+                ],
+                [_timed(load_by_slug) for _ in range(args.rounds)],
+            ]
+    print(f"save-layout: {args.saves} сейвов, {args.rounds} раундов")
+    labels = ("листинг *.json", "refresh индекса", f"{len(slugs)} load(slug)")
+    for layout, samples in rows.items():
+        print(f"  {layout}")
+        for label, sample in zip(labels, samples, strict=True):
+            _print_row(f"  {label}", _median_ms(sample))
+    print(f"  перенос flat → sharded: {migrated['sharded']:.2f} с")
+    return 0
+
+
+def _disk_usage(directory: Path) -> tuple[int, int]:
+    """Занятые блоки ФС (байт) и число inode (файлы и папки)."""
+    used = inodes = 0
+    for root, dirs, files in os.walk(directory):
+        for name in [*dirs, *files]:
+            stat = os.lstat(os.path.join(root, name))
+            used += stat.st_blocks * 512
+            inodes += 1
+    return used, inodes
+
+
+def cmd_save_archive(args: argparse.Namespace) -> int:
+    """Холодный архив: место на диске, inode, чтение и возврат."""
+    import core.character_storage as storage_mod
+
+    slugs = [f"hero_{idx}" for idx in range(0, args.saves, 97)]
+
+    def load_by_slug() -> None:
+        for slug in slugs:
+            storage_mod.character_store().load(slug)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_mod.CHARACTERS_DIR = Path(tmp) / "characters"
+        _write_character_saves(storage_mod.CHARACTERS_DIR, args.saves)
+        storage_mod.refresh_character_index()
+        before = _disk_usage(storage_mod.CHARACTERS_DIR)
+        file_load = [_timed(load_by_slug) for _ in range(args.rounds)]
+        file_bulk = _timed(storage_mod.load_characters)
+        start = time.perf_counter()
+        archived = storage_mod.archive_cold_characters(0)
+        packed = time.perf_counter() - start
+        after = _disk_usage(storage_mod.CHARACTERS_DIR)
+        listing = [
+            _timed(storage_mod.list_character_summaries)
+            for _ in range(args.rounds)
+        ]
+        bulk = _timed(storage_mod.load_characters)
+        # Каждый load(slug) из архива возвращает персонажа в файл
+        rehydrate = _timed(load_by_slug)
+    print(f"save-archive: {args.saves} сейвов, {args.rounds} раундов")
+    for label, (used, inodes) in (("файлы", before), ("архив", after)):
+        print(f"  {label:<8}{used / 1024 / 1024:>9.2f} МиБ {inodes:>8} inode")
+    print(
+        f"  упаковка {archived} персонажей: {packed:.2f} с,"
+        f" место x{before[0] / max(after[0], 1):.1f},"
+        f" inode x{before[1] / max(after[1], 1):.0f}"
+    )
+    _print_row("список сводок из архива", _median_ms(listing))
+    _print_row("load_characters из файлов", file_bulk * 1000)
+    _print_row("load_characters из архива", bulk * 1000)
+    _print_row(f"{len(slugs)} load(slug) из файлов", _median_ms(file_load))
+    _print_row(f"{len(slugs)} load(slug) с возвратом", rehydrate * 1000)
+    return 0
+
+
+def cmd_progression_batch(args: argparse.Namespace) -> int:
+    """Опыт партии: apply_experience по одному vs award_experience."""
+    import core.character_storage as storage_mod
+    from core.catalog_loader import get_catalog
+    from core.character_sqlite import close_sqlite_stores
+    from core.models import Character
+    from core.progression import apply_experience
+    from core.progression_batch import award_experience
+
+    class_ids = sorted(get_catalog("classes"))
+    party = [
+        Character(
+            name=f"Hero {idx}",
+            race=("human", "dwarf", "elf")[idx % 3],
+            class_id=class_ids[idx % len(class_ids)],
+            stats={"constitution": 12 + idx % 6, "strength": 15},
+            current_hp=10,
+            max_hp=10,
+            save_slug=f"hero_{idx}",
+        )
+        for idx in range(args.characters)
+    ]
+    # Награды от «до 2 уровня» до «до 10 уровня»: есть прыжки и ASI
+    xp = (300, 2_700, 14_000, 64_000)
+    awards = [(char, xp[idx % len(xp)]) for idx, char in enumerate(party)]
+
+    def one_by_one() -> None:
+        for char, amount in awards:
+            apply_experience(char, amount)
+
+    def batched() -> None:
+        award_experience(awards, save=False)
+
+    before = [_timed(one_by_one) for _ in range(args.rounds)]
+    after = [_timed(batched) for _ in range(args.rounds)]
+    updated = award_experience(awards, save=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_mod.CHARACTERS_DB = Path(tmp) / "characters.sqlite3"
+        storage_mod.set_storage_backend("sqlite")
+        storage_mod.update_characters(party)
+
+        def save_one_by_one() -> None:
+            for char in updated:
+                storage_mod.update_character(char)
+
+        save_before = _timed(save_one_by_one)
+        save_after = _timed(partial(storage_mod.update_characters, updated))
+        storage_mod.set_storage_backend("json")
+        close_sqlite_stores()
+    print(f"progression-batch: {args.characters} персонажей, SQLite")
+    _print_row("apply_experience по одному", _median_ms(before))
+    _print_row("award_experience пачкой", _median_ms(after))
+    _print_speedup(before, after)
+    _print_row("update_character по одному", save_before * 1000)
+    _print_row("update_characters пачкой", save_after * 1000)
+    _print_speedup([save_before], [save_after])
+    return 0
+
+
+def cmd_hp_tables(args: argparse.Namespace) -> int:
+    """Максимум HP: сумма по уровням vs таблица за O(1)."""
+    from core.classes import get_class_hit_dice
+    from core.dice import ability_modifier
+    from core.levels import MAX_CHARACTER_LEVEL
+    from core.progression import (
+        extra_hp_bonus_sources,
+        hp_gain_for_level,
+        max_hp_for_level,
+    )
+
+    stats = {"constitution": 14}
+    feat_ids = ["tough"]
+    levels = [1 + idx % MAX_CHARACTER_LEVEL for idx in range(args.calls)]
+
+    def per_level_sum() -> None:
+        # Прежний подсчёт: источники бонуса и цикл по уровням на вызов
+        for level in levels:
+            con_mod = ability_modifier(stats["constitution"])
+            bonus = sum(
+                source.amount
+                for source in extra_hp_bonus_sources(
+                    "dwarf", "hill_dwarf", feat_ids
+                )
+            )
+            hit_dice = get_class_hit_dice("fighter")
+            sum(
+                hp_gain_for_level(lvl, hit_dice, con_mod, "normal", bonus)
+                for lvl in range(1, level + 1)
+            )
+
+    def table_lookup() -> None:
+        for level in levels:
+            max_hp_for_level(
+                "fighter",
+                stats,
+                level,
+                "normal",
+                "dwarf",
+                "hill_dwarf",
+                feat_ids,
+            )
+
+    before = [_timed(per_level_sum) for _ in range(args.rounds)]
+    after = [_timed(table_lookup) for _ in range(args.rounds)]
+    print(f"hp-tables: {args.calls} вызовов max_hp_for_level, уровни 1–20")
+    _print_row("сумма по уровням", _median_ms(before))
+    _print_row("таблица HP", _median_ms(after))
+    _print_speedup(before, after)
+    return 0
+
+
+def cmd_dice_throughput(args: argparse.Namespace) -> int:
+    """Броски в секунду: randint по кости vs план выражения кубиков."""
+    from core.dice import roll
+    from core.dice_expr import compile_dice, roll_dice, roll_many
+
+    cases = (("2d6+3", 2, 6, 3), ("8d6 fire", 8, 6, 0))
+    print(f"dice-throughput: {args.rolls} бросков на выражение")
+    for expression, count, sides, modifier in cases:
+        compile_dice(expression)
+
+        def per_die(
+            count: int = count, sides: int = sides, modifier: int = modifier
+        ) -> None:
+            for _ in range(args.rolls):
+                roll(count, sides, modifier)
+
+        def planned(expression: str = expression) -> None:
+            for _ in range(args.rolls):
+                roll_dice(expression)
+
+        def series(expression: str = expression) -> None:
+            roll_many(expression, args.rolls)
+
+        before = [_timed(per_die) for _ in range(args.rounds)]
+        after = [_timed(planned) for _ in range(args.rounds)]
+        batch = [_timed(series) for _ in range(args.rounds)]
+        print(f"  {expression}")
+        _print_row("roll() — randint на кость", _median_ms(before))
+        _print_row("roll_dice — план из кэша", _median_ms(after))
+        _print_row("roll_many — кости на серию", _median_ms(batch))
+        _print_speedup(before, batch)
+    keep = [_timed(partial(roll_many, "4d6kh3", args.rolls))]
+    adv = [_timed(partial(roll_many, "1d20+5 adv", args.rolls))]
+    _print_row("roll_many 4d6kh3", _median_ms(keep))
+    _print_row("roll_many 1d20+5 adv", _median_ms(adv))
+    return 0
+
+
+def cmd_dice_distribution(args: argparse.Namespace) -> int:
+    """Шансы выражения: выборка roll_many vs точное распределение."""
+    from core import dice_distribution as dist_mod
+    from core.dice_expr import roll_many
+
+    expressions = ("4d6kh3", "1d20+5 adv", "8d6 fire", "2d6r2+3")
+    print(f"dice-distribution: выборка {args.samples} бросков vs точно")
+    for expression in expressions:
+
+        def sampled(expression: str = expression) -> tuple[float, int]:
+            totals = sorted(roll_many(expression, args.samples))
+            return sum(totals) / len(totals), totals[len(totals) // 2]
+
+        def exact(expression: str = expression) -> tuple[float, int]:
+            dist_mod.dice_distribution.cache_clear()
+            dist_mod._dice_sum.cache_clear()
+            dist_mod._kept_sum.cache_clear()
+            dist_mod._die.cache_clear()
+            dist = dist_mod.dice_distribution(expression)
+            return float(dist.mean), dist.percentile(0.5)
+
+        before = [_timed(sampled) for _ in range(args.rounds)]
+        after = [_timed(exact) for _ in range(args.rounds)]
+        cached = _timed(partial(dist_mod.dice_distribution, expression))
+        print(f"  {expression}")
+        _print_row("выборка: среднее и медиана", _median_ms(before))
+        _print_row("точно, холодный кэш", _median_ms(after))
+        _print_row("точно, из кэша", cached * 1000)
+        _print_speedup(before, after)
+    return 0
+
+
+def cmd_stat_simulation(args: argparse.Namespace) -> int:
+    """Статистика генерации: цикл Python по наборам vs пачечный симулятор."""
+    from collections import Counter
+
+    from core.dice import ability_modifier, roll_ability_score
+    from core.stat_simulator import (
+        numpy_available,
+        race_variants,
+        simulate_stats,
+    )
+    from core.stats import generate_stats_random
+
+    variants = race_variants()
+
+    def loop() -> Counter[int]:
+        # Прежний способ: бросок, бонусы и модификаторы на каждый набор
+        totals: Counter[int] = Counter()
+        for race_id, subrace_id in variants:
+            for _ in range(args.loop_samples):
+                values = [roll_ability_score() for _ in range(6)]
+                stats = generate_stats_random(values, race_id, subrace_id)
+                totals[sum(stats.values())] += 1
+                totals.update(map(ability_modifier, stats.values()))
+        return totals
+
+    before = _timed(loop) / (args.loop_samples * len(variants))
+    single = _timed(
+        partial(simulate_stats, args.samples, variants[:1], seed=1)
+    )
+    started = time.perf_counter()
+    results = simulate_stats(
+        args.samples, variants, seed=1, processes=args.processes
+    )
+    after = (time.perf_counter() - started) / (args.samples * len(variants))
+    single /= args.samples
+    backend = "numpy" if numpy_available() else "python"
+    print(
+        f"stat-simulation: {len(variants)} рас, backend {backend},"
+        f" {args.processes} процесс(ов)"
+    )
+    for label, seconds in (
+        ("цикл Python, набор×раса", before),
+        ("simulate_stats, одна раса", single),
+        ("simulate_stats, набор×раса", after),
+    ):
+        print(f"  {label:<28} {seconds * 1e6:9.3f} мкс")
+    print(
+        f"  ускорение: x{before / single:.0f} на расу,"
+        f" x{before / after:.0f} на все расы"
+    )
+    for result in results:
+        con = result.modifiers["constitution"]
+        strong = sum(count for mod, count in con.items() if mod >= 2)
+        print(
+            f"  {result.race_id}/{result.subrace_id or '-'}:"
+            f" сумма {result.mean_total:.1f},"
+            f" медиана {result.total_percentile(0.5)},"
+            f" CON ≥ +2 {100 * strong / result.samples:.1f}%"
+        )
+    return 0
+
+
+def cmd_character_memory(args: argparse.Namespace) -> int:
+    """Байт на персонажа: Character vs CompactCharacter (tracemalloc)."""
+    import json
+
+    from core.models import Character, CompactCharacter, SharedIds
+
+    languages = (["common"], ["common", "elvish"], ["common", "dwarvish"])
+    skills = (["athletics", "perception"], ["arcana", "history"])
+    payloads = [
+        json.dumps(
+            Character(
+                name=f"Hero {idx}",
+                race=("human", "elf", "dwarf")[idx % 3],
+                class_id=("fighter", "wizard")[idx % 2],
+                level=1 + idx % 20,
+                stats={"strength": 15, "dexterity": 14, "constitution": 13},
+                current_hp=12,
+                max_hp=12,
+                languages=languages[idx % 3],
+                skills=skills[idx % 2],
+                weapon_proficiencies=["simple", "martial"],
+                armor_proficiencies=["light", "medium", "heavy", "shields"],
+                save_slug=f"hero_{idx}",
+                created_at="2026-01-01T00:00:00+00:00",
+            ).to_dict()
+        )
+        for idx in range(len(languages) * len(skills) * 20)
+    ]
+
+    def build_full() -> list[object]:
+        # Каждая запись — свой json.loads, как при чтении сейвов
+        return [
+            Character.from_dict(json.loads(payloads[idx % len(payloads)]))
+            for idx in range(args.characters)
+        ]
+
+    def build_compact() -> list[object]:
+        # Общие кортежи id — в пределах пачки, как в compact_characters
+        shared: SharedIds = {}
+        return [
+            CompactCharacter.from_dict(
+                json.loads(payloads[idx % len(payloads)]), shared
+            )
+            for idx in range(args.characters)
+        ]
+
+    full = _retained_bytes(build_full)
+    compact = _retained_bytes(build_compact)
+    print(f"character-memory: {args.characters} персонажей")
+    print(f"  Character                {full / args.characters:9.0f} байт")
+    print(f"  CompactCharacter         {compact / args.characters:9.0f} байт")
+    print(f"  экономия: x{full / compact:.1f}")
+    return 0
+
+
+def cmd_character_serializers(args: argparse.Namespace) -> int:
+    """Персонажей в секунду: сгенерированный codec vs приведение типов."""
+    import json
+    from dataclasses import replace
+    from typing import Any
+
+    from core.models import Character
+
+    character = Character(
+        name="Hero",
+        race="elf",
+        class_id="wizard",
+        level=3,
+        stats={"intelligence": 16, "dexterity": 14, "constitution": 13},
+        current_hp=18,
+        max_hp=18,
+        subrace="high_elf",
+        languages=["common", "elvish"],
+        skills=["arcana", "history", "perception"],
+        weapon_proficiencies=["dagger", "quarterstaff"],
+        feat_ids=["magic_initiate"],
+        asi_choices={"4": "intelligence"},
+        save_slug="hero",
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+    payloads = [
+        json.loads(json.dumps(character.to_dict()))
+        for _ in range(args.characters)
+    ]
+
+    def each(func: Callable[[], object]) -> None:
+        for _ in range(args.characters):
+            func()
+
+    def parse_all(parse: Callable[[dict[str, Any]], Character]) -> None:
+        for data in payloads:
+            parse(data)
+
+    def run(func: Callable[[], object]) -> list[float]:
+        # Результаты не копятся: сборщик мусора не искажает сравнение
+        return [_timed(func) for _ in range(7)]
+
+    def rate(samples: list[float]) -> float:
+        count: int = args.characters
+        return count / statistics.median(samples)
+
+    coerced = run(partial(parse_all, Character.coerce_dict))
+    fast = run(partial(parse_all, Character.from_dict))
+    dumped = run(partial(each, character.to_dict))
+    leveled = run(partial(each, lambda: replace(character, level=4).to_dict()))
+    print(f"character-serializers: {args.characters} персонажей")
+    print(f"  from_dict (приведение)   {rate(coerced):12.0f} перс./с")
+    print(f"  from_dict (строгий путь) {rate(fast):12.0f} перс./с")
+    _print_speedup(coerced, fast)
+    print(f"  to_dict                  {rate(dumped):12.0f} перс./с")
+    print(f"  replace + to_dict        {rate(leveled):12.0f} перс./с")
+    return 0
+
+
+def cmd_creation_pipeline(args: argparse.Namespace) -> int:
+    """Headless-создание по всем раса × подраса × класс × подкласс."""
+    from core.catalog_loader import get_catalog
+    from core.character_builder import resolve_creation_grants
+    from core.classes import (
+        character_has_spellcasting,
+        get_class_hit_dice,
+        get_subclass_choice_level,
+    )
+    from core.feat_apply import resolve_feat_ability_bonuses
+    from core.feats import apply_feats_to_stats
+    from core.progression import max_hp_for_level
+    from core.races import get_race_bonuses
+    from core.stats import apply_racial_bonuses_to_stats
+
+    base = {
+        "strength": 15,
+        "dexterity": 14,
+        "constitution": 13,
+        "intelligence": 12,
+        "wisdom": 10,
+        "charisma": 8,
+    }
+    feat_ids = ["tough", "resilient", "alert"]
+    choices = {"resilient": {"ability": "constitution"}}
+    combos: list[tuple[str, str | None, str, str | None]] = []
+    for race_id, race in get_catalog("races").items():
+        subraces = list(race.get("subraces") or {}) or [None]
+        for class_id, cls in get_catalog("classes").items():
+            subclasses = [s["id"] for s in cls.get("subclasses") or []]
+            for subrace_id in subraces:
+                for subclass_id in subclasses or [None]:
+                    combos.append((race_id, subrace_id, class_id, subclass_id))
+
+    def pipeline() -> None:
+        for race_id, subrace_id, class_id, subclass_id in combos:
+            stats = apply_racial_bonuses_to_stats(base, race_id, subrace_id)
+            stats = apply_feats_to_stats(stats, feat_ids, choices)
+            get_subclass_choice_level(class_id)
+            character_has_spellcasting(class_id, subclass_id, 3)
+            resolve_creation_grants(
+                race_id,
+                subrace_id,
+                class_id,
+                "acolyte",
+                subclass_id,
+                3,
+                feat_ids=feat_ids,
+                feat_choices=choices,
+            )
+            max_hp_for_level(
+                class_id, stats, 5, "normal", race_id, subrace_id, feat_ids
+            )
+
+    def hot_lookups() -> None:
+        for race_id, subrace_id, class_id, _subclass_id in combos:
+            get_race_bonuses(race_id, subrace_id)
+            get_class_hit_dice(class_id)
+            get_subclass_choice_level(class_id)
+            resolve_feat_ability_bonuses("resilient", choices["resilient"])
+
+    pipeline()
+    samples = [_timed(pipeline) for _ in range(args.rounds)]
+    lookups = [_timed(hot_lookups) for _ in range(args.rounds)]
+    print(
+        f"creation-pipeline: {len(combos)} комбинаций, {args.rounds} раундов"
+    )
+    _print_row("весь проход", _median_ms(samples))
+    per_character_us = _median_ms(samples) * 1000 / len(combos)
+    print(f"  {'на персонажа':<28} {per_character_us:9.1f} мкс")
+    _print_row("раса/класс/черта: бонусы, HD", _median_ms(lookups))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="число повторов (медиана)",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser(
+        "catalog-snapshot", help="холодный vs тёплый старт каталогов"
+    ).set_defaults(func=cmd_catalog_snapshot)
+    sub.add_parser(
+        "catalog-views", help="копии записей каталога vs read-only виды"
+    ).set_defaults(func=cmd_catalog_views)
+    sub.add_parser(
+        "catalog-warmup", help="первое обращение без и после прогрева"
+    ).set_defaults(func=cmd_catalog_warmup)
+    sub.add_parser(
+        "strings-render", help="get_string и карточка персонажа"
+    ).set_defaults(func=cmd_strings_render)
+    sub.add_parser(
+        "menu-redraw", help="списки рас/классов/языков и подписи владений"
+    ).set_defaults(func=cmd_menu_redraw)
+    sub.add_parser(
+        "saves-index", help="выбор slug и список сохранений через индекс"
+    ).set_defaults(func=cmd_saves_index)
+    sub.add_parser(
+        "storage-backends", help="JSON-файлы vs SQLite для персонажей"
+    ).set_defaults(func=cmd_storage_backends)
+    sub.add_parser(
+        "save-durability", help="атомарная запись, fsync и слияние записей"
+    ).set_defaults(func=cmd_save_durability)
+    load_saves = sub.add_parser(
+        "load-saves", help="параллельная и потоковая загрузка сохранений"
+    )
+    load_saves.add_argument(
+        "--saves",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="размеры папки сохранений",
+    )
+    load_saves.add_argument(
+        "--workers", type=int, default=4, help="потоков разбора"
+    )
+    load_saves.set_defaults(func=cmd_load_saves)
+    sub.add_parser(
+        "characters-hub", help="хаб персонажей: карточки vs страница"
+    ).set_defaults(func=cmd_characters_hub)
+    sub.add_parser(
+        "save-journal", help="журнал полей vs перезапись JSON персонажа"
+    ).set_defaults(func=cmd_save_journal)
+    locks = sub.add_parser(
+        "save-locks", help="flock сейвов: накладные расходы и гонка процессов"
+    )
+    locks.add_argument("--processes", type=int, default=4)
+    locks.add_argument("--saves", type=int, default=50, help="на процесс")
+    locks.set_defaults(func=cmd_save_locks)
+    layout = sub.add_parser(
+        "save-layout", help="плоская папка сейвов vs шарды, перенос"
+    )
+    layout.add_argument(
+        "--saves", type=int, default=20_000, help="число сейвов"
+    )
+    layout.set_defaults(func=cmd_save_layout)
+    archive = sub.add_parser(
+        "save-archive", help="холодный архив: место, inode, возврат"
+    )
+    archive.add_argument(
+        "--saves", type=int, default=20_000, help="число сейвов"
+    )
+    archive.set_defaults(func=cmd_save_archive)
+    batch = sub.add_parser(
+        "progression-batch", help="опыт партии: по одному vs пачкой"
+    )
+    batch.add_argument(
+        "--characters", type=int, default=2_000, help="число персонажей"
+    )
+    batch.set_defaults(func=cmd_progression_batch)
+    hp = sub.add_parser(
+        "hp-tables", help="максимум HP: сумма по уровням vs таблица"
+    )
+    hp.add_argument("--calls", type=int, default=50_000, help="число вызовов")
+    hp.set_defaults(func=cmd_hp_tables)
+    dice = sub.add_parser(
+        "dice-throughput", help="броски: randint по кости vs план"
+    )
+    dice.add_argument(
+        "--rolls", type=int, default=100_000, help="бросков на выражение"
+    )
+    dice.set_defaults(func=cmd_dice_throughput)
+    odds = sub.add_parser(
+        "dice-distribution", help="шансы кубиков: выборка vs точно"
+    )
+    odds.add_argument(
+        "--samples", type=int, default=100_000, help="бросков в выборке"
+    )
+    odds.set_defaults(func=cmd_dice_distribution)
+    sim = sub.add_parser(
+        "stat-simulation", help="генерация характеристик: цикл vs пачки"
+    )
+    sim.add_argument(
+        "--samples", type=int, default=1_000_000, help="наборов в симуляции"
+    )
+    sim.add_argument(
+        "--loop-samples", type=int, default=5_000, help="наборов в цикле"
+    )
+    sim.add_argument("--processes", type=int, default=1)
+    sim.set_defaults(func=cmd_stat_simulation)
+    memory = sub.add_parser(
+        "character-memory", help="байт на персонажа: обычный vs компактный"
+    )
+    memory.add_argument(
+        "--characters", type=int, default=100_000, help="число персонажей"
+    )
+    memory.set_defaults(func=cmd_character_memory)
+    serializers = sub.add_parser(
+        "character-serializers",
+        help="to_dict / from_dict: строгий путь vs приведение",
+    )
+    serializers.add_argument(
+        "--characters", type=int, default=20_000, help="число персонажей"
+    )
+    serializers.set_defaults(func=cmd_character_serializers)
+    sub.add_parser(
+        "creation-pipeline", help="headless-создание по всем комбинациям"
+    ).set_defaults(func=cmd_creation_pipeline)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
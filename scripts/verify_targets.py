@@ -33,7 +33,11 @@ CORE_MODULE_TESTS: dict[str, list[str]] = {
     "core/feat_requirements.py": ["tests/test_feats.py"],
     "core/feat_apply.py": ["tests/test_feats.py"],
     "core/feats_loader.py": ["tests/test_feats.py"],
+    "core/character_index.py": ["tests/test_character.py"],
+    "core/character_journal.py": ["tests/test_character.py"],
+    "core/character_sqlite.py": ["tests/test_character.py"],
     "core/character_storage.py": ["tests/test_character.py"],
+    "core/character_store.py": ["tests/test_character.py"],
     "core/scenario_actions.py": [
         "tests/test_models.py",
         "tests/test_class_features.py",
@@ -46,17 +50,35 @@ CORE_MODULE_TESTS: dict[str, list[str]] = {
     ],
     "core/levels.py": ["tests/test_progression.py"],
     "core/hp_bonuses.py": ["tests/test_progression.py"],
+    "core/hp_tables.py": ["tests/test_progression.py"],
+    "core/progression_batch.py": [
+        "tests/test_progression.py",
+        "tests/test_character.py",
+    ],
     "core/dice.py": ["tests/test_stats.py"],
+    "core/dice_expr.py": ["tests/test_stats.py"],
+    "core/dice_distribution.py": ["tests/test_stats.py"],
+    "core/stat_simulator.py": ["tests/test_stats.py"],
     "core/constants.py": ["tests/test_stats.py"],
     "core/difficulty.py": ["tests/test_stats.py"],
     "core/races.py": ["tests/test_grants.py"],
     "core/adventure.py": ["tests/test_models.py"],
     "core/backgrounds.py": ["tests/test_models.py"],
     "core/mod_loader.py": ["tests/test_catalog_loader.py"],
+    "core/catalog_snapshot.py": ["tests/test_catalog_loader.py"],
+    "core/catalog_registry.py": ["tests/test_catalog_loader.py"],
+    "core/catalog_models.py": ["tests/test_grants.py"],
+    "core/catalog_warmup.py": ["tests/test_catalog_loader.py"],
+    "core/catalog_watcher.py": ["tests/test_catalog_loader.py"],
     "core/skills.py": ["tests/test_proficiencies.py"],
     "core/proficiency_collect.py": ["tests/test_proficiencies.py"],
     "core/proficiency_checks.py": ["tests/test_proficiencies.py"],
     "core/settings.py": ["tests/test_menus_main.py"],
+    "core/write_coalescer.py": ["tests/test_character.py"],
+    "core/model_codec.py": ["tests/test_models.py"],
+    "core/save_locks.py": ["tests/test_character.py"],
+    "core/save_layout.py": ["tests/test_character.py"],
+    "core/save_archive.py": ["tests/test_character.py"],
 }
 
 DATA_PATH_TESTS = [
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import shutil
+import tempfile
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
@@ -9,6 +11,24 @@ from typing import Any
 import pytest
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Снапшоты каталогов — во временной папке, не в .cache/ репозитория.
+
+    Каталоги читаются уже при импорте тестовых модулей, поэтому путь
+    подменяется до сбора тестов, а не фикстурой.
+    """
+    import core.catalog_snapshot as snapshot_mod
+
+    snapshot_mod.SNAPSHOT_DIR = Path(tempfile.mkdtemp(prefix="dnd_mud_"))
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Удалить временную папку снапшотов."""
+    import core.catalog_snapshot as snapshot_mod
+
+    shutil.rmtree(snapshot_mod.SNAPSHOT_DIR, ignore_errors=True)
+
+
 @pytest.fixture
 def catalog_caches_cleared() -> Generator[None, None, None]:
     """Сбросить кэши каталогов до и после теста."""
@@ -36,13 +56,23 @@ def en_strings() -> dict[str, Any]:
 
 
 @pytest.fixture
-def characters_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Временная директория сохранений персонажей."""
+def characters_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Path, None, None]:
+    """Временная директория сохранений персонажей (и база SQLite)."""
     import core.character_storage as storage_mod
+    from core.character_sqlite import close_sqlite_stores
 
     path = tmp_path / "characters"
     monkeypatch.setattr(storage_mod, "CHARACTERS_DIR", path)
-    return path
+    monkeypatch.setattr(
+        storage_mod, "CHARACTERS_DB", tmp_path / "characters.sqlite3"
+    )
+    monkeypatch.setattr(storage_mod, "_storage_backend", "json")
+    monkeypatch.setattr(storage_mod, "_durability_mode", "safe")
+    yield path
+    storage_mod._WRITES.discard()
+    close_sqlite_stores()
 
 
 @pytest.fixture
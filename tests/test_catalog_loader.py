@@ -5,9 +5,11 @@ from pathlib import Path
 import pytest
 
 from core.catalog_loader import (
+    catalog_source_files,
     clear_all_catalog_caches,
     clear_catalog_cache,
     load_catalog,
+    rebuild_catalog_snapshots,
 )
 from core.io import CatalogLoadError
 from core.races import RACES_FILE
@@ -36,6 +38,19 @@ def test_load_catalog_raises_on_corrupt_yaml(tmp_path: Path) -> None:
         load_catalog(path, "races")
 
 
+def test_load_catalog_logs_undeclared_file(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Необъявленный файл объявляется автоматически — с записью в лог."""
+    path = tmp_path / "extra.yaml"
+    path.write_text("extra:\n  one: {}\n", encoding="utf-8")
+    assert "one" in load_catalog(path, "extra")
+    assert "не объявлен" in caplog.text
+    caplog.clear()
+    load_catalog(RACES_FILE, "races")
+    assert not caplog.text
+
+
 def test_dragonborn_mod_overlay(tmp_path, monkeypatch):
     """Включённый mod добавляет расу dragonborn."""
     import json
@@ -77,3 +92,151 @@ def test_corrupt_mod_manifest_skips_overlay(
 
     races = load_merged_catalog("database/races/races.yaml", "races")
     assert "human" in races
+
+
+def test_catalog_snapshot_reused_until_source_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Снапшот подменяет PyYAML, пока содержимое YAML не изменилось."""
+    from core.mod_loader import load_merged_yaml
+
+    path = tmp_path / "races.yaml"
+    path.write_text("races:\n  human: {}\n", encoding="utf-8")
+    assert "human" in load_merged_yaml(path)["races"]
+
+    with monkeypatch.context() as mp:
+        mp.setattr("core.mod_loader.load_yaml", pytest.fail)
+        assert "human" in load_merged_yaml(path)["races"]
+
+    path.write_text("races:\n  elf: {}\n", encoding="utf-8")
+    assert list(load_merged_yaml(path)["races"]) == ["elf"]
+    assert rebuild_catalog_snapshots() == len(catalog_source_files())
+
+
+def test_mod_index_rebuilt_only_when_manifest_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Индекс модов строится один раз и сбрасывается при правке manifest."""
+    import json
+
+    from core.mod_loader import clear_mod_loader_cache, get_mod_index
+
+    mod_dir = tmp_path / "mods" / "pack"
+    mod_dir.mkdir(parents=True)
+    (mod_dir / "overlay.yaml").write_text("races: {}\n", encoding="utf-8")
+    manifest = mod_dir / "manifest.yaml"
+    manifest.write_text(
+        "overlays:\n"
+        "  - target: ./database/races/races.yaml\n"
+        "    path: overlay.yaml\n",
+        encoding="utf-8",
+    )
+    state_path = tmp_path / "mods_state.json"
+    state_path.write_text(json.dumps({"enabled": ["pack"]}), encoding="utf-8")
+    monkeypatch.setattr("core.mod_loader.MODS_DIR", tmp_path / "mods")
+    monkeypatch.setattr("core.mod_loader.MODS_STATE_FILE", state_path)
+    clear_mod_loader_cache()
+
+    index = get_mod_index()
+    assert get_mod_index() is index
+    assert index.overlays_for(RACES_FILE) == (mod_dir / "overlay.yaml",)
+
+    manifest.write_text("overlays: []\n", encoding="utf-8")
+    assert get_mod_index().overlays_for(RACES_FILE) == ()
+
+
+def test_catalog_watcher_invalidates_only_changed_catalog(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Правка одного YAML сбрасывает только его каталог."""
+    from core.catalog_watcher import CatalogWatcher
+
+    races = tmp_path / "races.yaml"
+    classes = tmp_path / "classes.yaml"
+    races.write_text("races:\n  human: {}\n", encoding="utf-8")
+    classes.write_text("classes:\n  fighter: {}\n", encoding="utf-8")
+    monkeypatch.setattr("core.catalog_watcher.WATCH_DIRS", (tmp_path,))
+    monkeypatch.setattr("core.catalog_watcher.DATABASE_DIR", tmp_path)
+    cached_classes = load_catalog(classes, "classes")
+    load_catalog(races, "races")
+    watcher = CatalogWatcher()
+    assert not watcher.poll()
+
+    races.write_text("races:\n  human: {}\n  elf: {}\n", encoding="utf-8")
+    changes = watcher.poll()
+    assert changes.invalidated == {f"{races.as_posix()}:races"}
+    assert "elf" in load_catalog(races, "races")
+    assert load_catalog(classes, "classes") is cached_classes
+
+
+def test_catalog_registry_keeps_catalogs_resident_and_counts_hits() -> None:
+    """Объявленный каталог не вытесняется; сброс по имени — точечный."""
+    from core.catalog_loader import (
+        catalog_stats,
+        get_catalog,
+        invalidate_catalog,
+    )
+
+    names = [
+        "abilities",
+        "skills",
+        "backgrounds",
+        "classes",
+        "constants",
+        "weapons",
+        "armor",
+        "tools",
+        "equipment",
+        "feats",
+        "languages",
+        "races",
+    ]
+    loaded = {name: get_catalog(name) for name in names}
+    assert all(get_catalog(name) is loaded[name] for name in names)
+    assert load_catalog(RACES_FILE, "races") is loaded["races"]
+
+    loads_before = catalog_stats()["races"].loads
+    assert invalidate_catalog("races") == {"races"}
+    # Черты скомпилированы по id характеристик — сбрасываются вместе
+    assert invalidate_catalog("abilities") == {"abilities", "feats"}
+    assert get_catalog("feats") is not loaded["feats"]
+    assert get_catalog("races") is not loaded["races"]
+    assert get_catalog("classes") is loaded["classes"]
+    stats = catalog_stats()
+    assert stats["races"].loads == loads_before + 1
+    assert stats["classes"].hits >= 1
+    assert stats["races"].entries == len(loaded["races"])
+    assert stats["races"].source_bytes > 0
+
+
+def test_catalog_warmup_first_access_waits_instead_of_parsing_twice(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Обращение во время прогрева ждёт идущую загрузку."""
+    import threading
+
+    from core.catalog_loader import catalog_stats, get_catalog
+    from core.catalog_warmup import start_catalog_warmup
+    from core.mod_loader import load_merged_catalog
+
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def slow_load(path_str: str, catalog_key: str) -> dict[str, object]:
+        calls.append(catalog_key)
+        started.set()
+        release.wait(5)
+        return load_merged_catalog(path_str, catalog_key)
+
+    monkeypatch.setattr("core.catalog_registry.load_merged_catalog", slow_load)
+    waits_before = catalog_stats()["races"].waits
+    warmup = start_catalog_warmup(("races",))
+    assert started.wait(5)
+    threading.Timer(0.05, release.set).start()
+
+    races = get_catalog("races")
+    assert warmup.wait(5)
+    assert calls == ["races"]
+    assert "human" in races
+    assert catalog_stats()["races"].waits == waits_before + 1
@@ -1,7 +1,12 @@
 """Тесты персонажей: бонусы, генерация stats, save/load."""
 
 import json
+import os
+import sys
+from collections.abc import Generator
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -126,6 +131,7 @@ def test_starting_max_hp_and_hardcore(
         stats=stats,
     )
     assert hard.max_hp == 7
+    assert hard.hp_rolls == [5]
 
 
 def test_hardcore_l1_hp_floor_on_create(
@@ -168,3 +174,567 @@ def test_load_characters_skips_invalid_saves(characters_dir: Path) -> None:
     result = load_characters()
     assert result.characters == ()
     assert result.corrupt_save_warnings == ("bad",)
+
+
+def test_character_index_tracks_saves_and_heals_external_edits(
+    characters_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Индекс обновляется при записи/удалении и чинится по mtime."""
+    import core.character_storage as storage_mod
+    from core.character_index import read_index
+
+    character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    mage = character_mod.save_character(
+        name="Mage", race_id="elf", class_id="wizard"
+    )
+    assert set(read_index(characters_dir)) == {"hero", "mage"}
+
+    def no_parse(path: Path) -> None:
+        raise AssertionError(f"открыт {path}")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(storage_mod, "_try_load_character_file", no_parse)
+        third = character_mod.save_character(
+            name="Hero", race_id="human", class_id="fighter"
+        )
+        summaries = character_mod.list_character_summaries()
+    assert third.save_slug == "hero_2"
+    assert [s.save_slug for s in summaries] == ["hero", "mage", "hero_2"]
+
+    mage.level = 5
+    storage_mod._character_file_path("mage").write_text(
+        json.dumps(mage.to_dict()), encoding="utf-8"
+    )
+    (characters_dir / "bad.json").write_text("{", encoding="utf-8")
+    levels = {
+        s.save_slug: s.level for s in storage_mod.list_character_summaries()
+    }
+    assert levels["mage"] == 5
+    assert read_index(characters_dir)["bad"].corrupt
+
+    assert character_mod.delete_character("hero") is True
+    assert "hero" not in read_index(characters_dir)
+    assert load_characters().corrupt_save_warnings == ("bad",)
+
+
+def test_index_repair_yields_to_concurrent_index_write(
+    characters_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Сверка не затирает индекс, записанный во время разбора."""
+    import core.character_storage as storage_mod
+    from core.character_index import read_index, write_index
+
+    character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    (characters_dir / "bad.json").write_text("{", encoding="utf-8")
+    summary_for_file = storage_mod._summary_for_file
+    concurrent = read_index(characters_dir)
+    concurrent["hero"] = replace(concurrent["hero"], level=7)
+
+    def racing(path: Path, stat: os.stat_result) -> Any:
+        # Другой процесс переписал индекс, пока этот разбирал файл
+        write_index(characters_dir, concurrent)
+        return summary_for_file(path, stat)
+
+    monkeypatch.setattr(storage_mod, "_summary_for_file", racing)
+    storage_mod.refresh_character_index()
+    assert read_index(characters_dir) == concurrent
+
+    # Следующая сверка дочинивает индекс
+    monkeypatch.setattr(storage_mod, "_summary_for_file", summary_for_file)
+    entries = storage_mod.refresh_character_index()
+    assert entries["bad"].corrupt
+    assert read_index(characters_dir) == entries
+
+
+def test_sqlite_store_round_trip_and_transfer(characters_dir: Path) -> None:
+    """SQLite: сохранение, сводки, битый payload, перенос из JSON."""
+    import core.character_storage as storage_mod
+    from core.character_sqlite import open_sqlite_store
+
+    hero = character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    assert character_mod.transfer_characters("json", "sqlite") == 1
+
+    character_mod.set_storage_backend("sqlite")
+    store = storage_mod.character_store()
+    assert store.load("hero") == hero
+    mage = character_mod.save_character(
+        name="Hero", race_id="elf", class_id="wizard"
+    )
+    assert mage.save_slug == "hero_2"
+    mage.level = 3
+    character_mod.update_character(mage)
+    summaries = character_mod.list_character_summaries()
+    assert [(s.save_slug, s.level) for s in summaries] == [
+        ("hero", 1),
+        ("hero_2", 3),
+    ]
+
+    db = open_sqlite_store(storage_mod.CHARACTERS_DB)
+    with db._conn:
+        db._conn.execute(
+            "UPDATE characters SET payload = '{' WHERE save_slug = 'hero'"
+        )
+    result = load_characters()
+    assert [c.save_slug for c in result.characters] == ["hero_2"]
+    assert result.corrupt_save_warnings == ("hero",)
+    # Список и страница пропускают битую строку, как JSON-хранилище
+    assert [s.save_slug for s in character_mod.list_character_summaries()] == [
+        "hero_2"
+    ]
+    page = storage_mod.list_character_page(0, 10)
+    assert [s.save_slug for s in page.summaries] == ["hero_2"]
+    assert (page.total, page.corrupt_save_warnings) == (1, ("hero",))
+    assert character_mod.delete_character("hero") is True
+    # JSON-хранилище не затронуто
+    assert storage_mod.character_store("json").slugs() == {"hero"}
+
+
+def test_fast_durability_coalesces_updates(characters_dir: Path) -> None:
+    """fast: повторные update_character одного slug — одна запись."""
+    import core.character_storage as storage_mod
+
+    hero = character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    before = storage_mod.character_write_stats()
+    character_mod.set_durability_mode("fast")
+    try:
+        for level in (2, 3, 4):
+            hero.level = level
+            character_mod.update_character(hero)
+        on_disk = json.loads(
+            storage_mod._character_file_path("hero").read_text("utf-8")
+        )
+        assert on_disk["level"] == 1
+        # Чтение сначала сбрасывает очередь
+        assert load_characters().characters[0].level == 4
+    finally:
+        character_mod.set_durability_mode("safe")
+    after = storage_mod.character_write_stats()
+    assert after.issued - before.issued == 1
+    assert after.coalesced - before.coalesced == 2
+
+
+def test_coalescer_timer_keeps_entry_after_write_error(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Ошибка записи в таймере логируется, ключ остаётся в очереди."""
+    from core.write_coalescer import WriteCoalescer
+
+    written: list[str] = []
+
+    def write(value: str) -> None:
+        if value == "bad":
+            raise ValueError("не сериализуется")
+        written.append(value)
+
+    queue: WriteCoalescer[str, str] = WriteCoalescer(write, delay=60)
+    queue.submit("hero", "bad")
+    queue._flush_quietly()
+    assert queue.pending() == 1
+    assert "не сериализуется" in caplog.text
+    queue.submit("hero", "good")
+    assert queue.flush() == 1
+    assert written == ["good"]
+
+
+def test_parallel_and_streaming_load_match_serial(
+    characters_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Пул потоков и поток дают тех же персонажей и те же битые сейвы."""
+    import core.character_store as store_mod
+
+    monkeypatch.setattr(store_mod, "LOAD_BATCH_SIZE", 2)
+    for idx in range(7):
+        character_mod.save_character(
+            name=f"Hero{idx}", race_id="human", class_id="fighter"
+        )
+    (characters_dir / "bad.json").write_text("{", encoding="utf-8")
+
+    serial = load_characters(workers=1)
+    assert load_characters(workers=3) == serial
+    assert serial.corrupt_save_warnings == ("bad",)
+
+    streamed = list(character_mod.iter_characters(workers=3))
+    assert {c.save_slug for c, _ in streamed if c} == {
+        c.save_slug for c in serial.characters
+    }
+    assert [label for c, label in streamed if c is None] == ["bad"]
+    stream = character_mod.iter_characters(workers=3)
+    character, label = next(stream)
+    assert (character is None) != (label is None)
+    # Брошенный поток отменяет оставшиеся пачки пула
+    assert isinstance(stream, Generator)
+    stream.close()
+
+
+def test_journal_appends_deltas_replays_and_compacts(
+    characters_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Обновления — строки журнала; загрузка накладывает; сворачивание."""
+    import core.character_storage as storage_mod
+    from core.character_journal import journal_path, read_journal
+
+    monkeypatch.setattr(storage_mod, "JOURNAL_COMPACT_AFTER", 4)
+    hero = character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    path = storage_mod._character_file_path("hero")
+    base = path.read_text(encoding="utf-8")
+    hero.experience = 50
+    character_mod.update_character(hero)
+    hero.level, hero.max_hp = 2, 20
+    character_mod.update_character(hero)
+
+    assert path.read_text(encoding="utf-8") == base
+    entries, torn = read_journal(journal_path(path))
+    assert [entry.values for entry in entries] == [
+        {"experience": 50},
+        {"level": 2, "max_hp": 20},
+    ]
+    assert not any(entry.removed for entry in entries)
+    assert not torn
+    assert storage_mod.list_character_summaries()[0].level == 2
+
+    # Сбой посреди записи: оборванная строка отбрасывается
+    with journal_path(path).open("a", encoding="utf-8") as f:
+        f.write('{"ts": "x", "set": {"level": 9')
+    loaded = load_characters().characters[0]
+    assert (loaded.level, loaded.experience) == (2, 50)
+
+    assert storage_mod.compact_character_journals() == 1
+    assert not journal_path(path).exists()
+    assert json.loads(path.read_text(encoding="utf-8"))["level"] == 2
+
+    for level in (3, 4, 5, 6):
+        hero.level = level
+        character_mod.update_character(hero)
+    # Четвёртая запись свернула журнал в базу
+    assert not journal_path(path).exists()
+    assert json.loads(path.read_text(encoding="utf-8"))["level"] == 6
+
+
+def test_journal_keeps_cleared_fields_cleared(characters_dir: Path) -> None:
+    """Очищенное поле не возвращается из базы ни до, ни после свёртки."""
+    import core.character_storage as storage_mod
+    from core.character_journal import journal_path, read_journal
+
+    bob = character_mod.save_character(
+        name="Bob", race_id="human", class_id="fighter"
+    )
+    bob.subclass_id = "champion"
+    bob.feat_ids = ["alert"]
+    storage_mod._save_character_file(bob)
+    bob.subclass_id = None
+    bob.feat_ids = []
+    bob.experience = 5
+    character_mod.update_character(bob)
+
+    path = storage_mod._character_file_path("bob")
+    entries, _torn = read_journal(journal_path(path))
+    assert entries[-1].removed == ("feat_ids", "subclass_id")
+    loaded = character_mod.load_character("bob")
+    assert loaded is not None
+    assert (loaded.feat_ids, loaded.subclass_id) == ([], None)
+    assert loaded.experience == 5
+
+    assert storage_mod.compact_character_journals() == 1
+    compacted = character_mod.load_character("bob")
+    assert compacted is not None
+    assert (compacted.feat_ids, compacted.subclass_id) == ([], None)
+    assert compacted.experience == 5
+
+
+def test_index_hits_journaled_saves_without_reparsing(
+    characters_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Неизменные база и журнал — попадание в индекс, без разбора."""
+    import core.character_storage as storage_mod
+    from core.character_journal import journal_path
+
+    heroes = [
+        character_mod.save_character(
+            name=f"Hero {n}", race_id="human", class_id="fighter"
+        )
+        for n in range(5)
+    ]
+    for hero in heroes:
+        hero.experience = 50
+        character_mod.update_character(hero)
+
+    parsed: list[Path] = []
+    summary_for_file = storage_mod._summary_for_file
+
+    def counting(path: Path, stat: os.stat_result) -> Any:
+        parsed.append(path)
+        return summary_for_file(path, stat)
+
+    monkeypatch.setattr(storage_mod, "_summary_for_file", counting)
+    for _ in range(5):
+        page = storage_mod.list_character_page(0, 3)
+        assert page.total == 5
+        storage_mod.list_character_summaries()
+    assert parsed == []
+
+    # Запись журнала сама обновляет индекс
+    heroes[0].level = 2
+    character_mod.update_character(heroes[0])
+    assert {s.level for s in storage_mod.list_character_summaries()} == {
+        1,
+        2,
+    }
+    assert parsed == []
+
+    # Журнал изменён снаружи — перечитывается только этот персонаж
+    assert heroes[0].save_slug is not None
+    path = storage_mod._character_file_path(heroes[0].save_slug)
+    os.utime(journal_path(path), ns=(1, 1))
+    storage_mod.list_character_summaries()
+    assert parsed == [path]
+
+
+def test_sharded_layout_reads_both_and_migrates_online(
+    characters_dir: Path,
+) -> None:
+    """Шарды: прозрачное чтение обеих раскладок, перенос с журналом."""
+    import core.character_storage as storage_mod
+    from core.character_journal import journal_path
+    from core.save_layout import LAYOUT_FILE_NAME, shard_name
+
+    hero = character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    character_mod.save_character(name="Mage", race_id="elf", class_id="wizard")
+    hero.experience = 75
+    character_mod.update_character(hero)
+    index_before = storage_mod.refresh_character_index()
+
+    assert character_mod.migrate_save_layout("sharded") == 2
+    sharded = characters_dir / shard_name("hero") / "hero.json"
+    assert sharded.exists() and not (characters_dir / "hero.json").exists()
+    assert journal_path(sharded).exists()
+    assert storage_mod._character_file_path("hero") == sharded
+    # rename сохраняет stat: индекс не перечитывает сейвы
+    assert storage_mod.refresh_character_index() == index_before
+    loaded = character_mod.load_character("hero")
+    assert loaded is not None and loaded.experience == 75
+
+    # Новый персонаж — сразу в шард; старый плоский файл всё ещё читается
+    rogue = character_mod.save_character(
+        name="Rogue", race_id="human", class_id="rogue"
+    )
+    assert (characters_dir / shard_name("rogue") / "rogue.json").exists()
+    (characters_dir / "old.json").write_text(
+        json.dumps({**rogue.to_dict(), "name": "Old", "save_slug": "old"}),
+        encoding="utf-8",
+    )
+    names = {c.name for c in load_characters().characters}
+    assert names == {"Hero", "Mage", "Rogue", "Old"}
+    assert character_mod.load_character("old") is not None
+
+    assert character_mod.migrate_save_layout("flat") == 3
+    assert not (characters_dir / LAYOUT_FILE_NAME).exists()
+    assert not [p for p in characters_dir.iterdir() if len(p.name) == 2]
+    assert len(load_characters().characters) == 4
+
+
+def test_layout_marker_is_read_once_per_change(
+    characters_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Неизменный .layout не перечитывается: путь сейва — по кэшу."""
+    from core.save_layout import (
+        character_path,
+        read_layout,
+        shard_name,
+        write_layout,
+    )
+
+    write_layout(characters_dir, "sharded")
+    assert read_layout(characters_dir) == "sharded"
+
+    def no_read(path: Path, *args: object, **kwargs: object) -> str:
+        raise AssertionError(f"прочитан {path}")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(Path, "read_text", no_read)
+        assert read_layout(characters_dir) == "sharded"
+        assert character_path(characters_dir, "hero").parent.name == (
+            shard_name("hero")
+        )
+
+    write_layout(characters_dir, "flat")
+    assert read_layout(characters_dir) == "flat"
+    assert character_path(characters_dir, "hero") == (
+        characters_dir / "hero.json"
+    )
+
+
+def test_award_experience_saves_batch_over_pending_writes(
+    characters_dir: Path,
+) -> None:
+    """Пакет опыта пишется одной пачкой и не затирается очередью fast."""
+    import core.character_storage as storage_mod
+    from core.progression_batch import award_experience
+
+    hero = character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    mage = character_mod.save_character(
+        name="Mage", race_id="elf", class_id="wizard"
+    )
+    storage_mod.set_durability_mode("fast")
+    hero.current_hp = 1
+    character_mod.update_character(hero)
+
+    updated = award_experience([(hero, 900), (mage, 300)])
+    assert [c.level for c in updated] == [3, 2]
+    storage_mod.set_durability_mode("safe")
+    for character in updated:
+        assert character_mod.load_character(character.save_slug or "") == (
+            character
+        )
+
+
+def test_cold_characters_archived_and_rehydrated(
+    characters_dir: Path,
+) -> None:
+    """Архив: старые персонажи в бандле, прозрачное чтение и возврат."""
+    import os
+    import time
+
+    from core.save_archive import archive_dir, read_archive
+
+    for name in ("Hero", "Mage", "Fresh"):
+        character_mod.save_character(
+            name=name, race_id="human", class_id="wizard"
+        )
+    old = time.time() - 90 * 86_400
+    for slug in ("hero", "mage"):
+        os.utime(characters_dir / f"{slug}.json", (old, old))
+    summaries_before = {
+        s.save_slug for s in character_mod.list_character_summaries()
+    }
+
+    assert character_mod.archive_cold_characters(30) == 2
+    assert not (characters_dir / "hero.json").exists()
+    assert set(read_archive(characters_dir)) == {"hero", "mage"}
+    assert {
+        s.save_slug for s in character_mod.list_character_summaries()
+    } == summaries_before
+    names = {c.name for c in load_characters().characters}
+    assert names == {"Hero", "Mage", "Fresh"}
+    # Архивный slug занят: новый «Hero» получает другой
+    twin = character_mod.save_character(
+        name="Hero", race_id="human", class_id="fighter"
+    )
+    assert twin.save_slug != "hero"
+
+    # Загрузка возвращает персонажа в файл; файл важнее архива
+    hero = character_mod.load_character("hero")
+    assert hero is not None and hero.name == "Hero"
+    assert (characters_dir / "hero.json").exists()
+    hero.experience = 50
+    character_mod.update_character(hero)
+    reloaded = character_mod.load_character("hero")
+    assert reloaded is not None and reloaded.experience == 50
+    assert len(load_characters().characters) == 4
+
+    assert character_mod.delete_character("mage") is True
+    assert character_mod.delete_character("mage") is False
+    # Упаковка снимает запись вернувшегося персонажа и пустой бандл
+    assert character_mod.archive_cold_characters(30) == 0
+    assert read_archive(characters_dir) == {}
+    assert not list(archive_dir(characters_dir).glob("*.zbundle"))
+    assert character_mod.load_character("hero") == reloaded
+
+
+def _stress_worker(directory: str, worker: int, rounds: int) -> list[str]:
+    """Процесс стресс-теста: новые «Hero» и обновления общего персонажа."""
+    import core.catalog_snapshot as snapshot_mod
+    import core.character_storage as storage_mod
+
+    snapshot_mod.SNAPSHOT_DIR = Path(directory).parent / "snapshots"
+    storage_mod.CHARACTERS_DIR = Path(directory)
+    shared = storage_mod.load_character("shared")
+    assert shared is not None
+    slugs: list[str] = []
+    for step in range(rounds):
+        created = storage_mod.save_character(
+            name="Hero", race_id="human", class_id="fighter"
+        )
+        slugs.append(created.save_slug or "")
+        shared.experience = worker * 1000 + step
+        shared.level = 1 + step % 5
+        storage_mod.update_character(shared)
+    return slugs
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl только на POSIX")
+def test_concurrent_processes_get_unique_slugs_and_whole_saves(
+    characters_dir: Path,
+) -> None:
+    """Несколько процессов на одной папке: без дублей slug и битых сейвов."""
+    import multiprocessing
+
+    from core.character_journal import journal_path, read_journal
+    from core.save_locks import RESERVATION_SUFFIX, locks_dir
+
+    character_mod.save_character(
+        name="Shared", race_id="human", class_id="fighter"
+    )
+    workers, rounds = 4, 8
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        results = pool.starmap(
+            _stress_worker,
+            [
+                (str(characters_dir), worker, rounds)
+                for worker in range(workers)
+            ],
+        )
+
+    slugs = [slug for batch in results for slug in batch]
+    assert len(set(slugs)) == workers * rounds
+    assert not list(locks_dir(characters_dir).glob(f"*{RESERVATION_SUFFIX}"))
+    loaded = load_characters()
+    assert loaded.corrupt_save_warnings == ()
+    assert len(loaded.characters) == workers * rounds + 1
+    shared_path = characters_dir / "shared.json"
+    _entries, torn = read_journal(journal_path(shared_path))
+    assert not torn
+    shared = next(c for c in loaded.characters if c.save_slug == "shared")
+    assert shared.experience % 1000 == rounds - 1
+    assert shared.level == 1 + (rounds - 1) % 5
+
+
+def test_stale_slug_reservation_is_reclaimed(characters_dir: Path) -> None:
+    """Бронь умершего процесса снимается; живая — занимает slug."""
+    from core.save_locks import (
+        RESERVATION_SUFFIX,
+        locks_dir,
+        reserve_save_slug,
+    )
+
+    reserve_save_slug(characters_dir, "hero")
+    assert (
+        character_mod.save_character(
+            name="Hero", race_id="human", class_id="fighter"
+        ).save_slug
+        == "hero_2"
+    )
+
+    stale = locks_dir(characters_dir) / f"hero{RESERVATION_SUFFIX}"
+    record = json.loads(stale.read_text(encoding="utf-8"))
+    stale.write_text(json.dumps({**record, "pid": 2**22 + 1}), "utf-8")
+    assert (
+        character_mod.save_character(
+            name="Hero", race_id="human", class_id="fighter"
+        ).save_slug
+        == "hero"
+    )
+    assert not stale.exists()
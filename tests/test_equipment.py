@@ -32,6 +32,24 @@ def test_weapon_and_tool_catalog() -> None:
     assert "land_vehicles" in resolve_tool_pool("land_vehicles")
 
 
+def test_catalog_lookups_return_shared_read_only_views() -> None:
+    """load_weapon/load_feat не копируют; мутация — только через копию."""
+    from core.catalog_loader import copy_catalog_entry
+    from core.feats_loader import load_feat
+
+    weapon = load_weapon("longsword")
+    assert load_weapon("longsword") is weapon
+    assert load_feat("alert") is load_feat("alert")
+    assert load_feat("alert")["id"] == "alert"
+    with pytest.raises(TypeError):
+        weapon["category"] = "simple_melee"  # type: ignore[index]
+
+    editable = copy_catalog_entry("weapons", "longsword")
+    editable["category"] = "simple_melee"
+    assert load_weapon("longsword")["category"] == "martial_melee"
+    assert load_weapon("no_such_weapon") == {}
+
+
 def test_proficiency_token_label() -> None:
     ru = load_strings("ru")
     assert proficiency_token_label("longbow", ru, "ru") == "длинные луки"
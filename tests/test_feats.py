@@ -217,3 +217,23 @@ def test_feat_full_description_lines(
     text = "\n".join(lines)
     for substring in expected_substrings:
         assert substring in text
+
+
+def test_compile_feats_skips_malformed_ability_bonus(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Нечисловой бонус черты пропускается, каталог компилируется."""
+    from core.catalog_models import compile_feats
+
+    compiled = compile_feats(
+        {
+            "broken": {
+                "name": "Broken",
+                "ability_bonuses": {"strength": "two", "dexterity": 1},
+            },
+            "sturdy": {"name": "Sturdy", "ability_bonuses": {"wisdom": "1"}},
+        }
+    )
+    assert dict(compiled["broken"].ability_bonuses) == {"dexterity": 1}
+    assert dict(compiled["sturdy"].ability_bonuses) == {"wisdom": 1}
+    assert "broken" in caplog.text and "strength" in caplog.text
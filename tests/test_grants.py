@@ -27,6 +27,24 @@ def test_load_races_catalog() -> None:
     assert names["elf"] == "Elf"
 
 
+def test_menu_rows_cached_per_language_until_catalog_invalidated() -> None:
+    """Повторная отрисовка меню не пересобирает строки каталога."""
+    from core.catalog_loader import invalidate_catalog
+    from core.classes import load_classes
+    from core.equipment import proficiency_token_label
+
+    ru = load_races("ru")
+    assert load_races("ru") == ru
+    assert all(a is b for a, b in zip(load_races("ru"), ru, strict=True))
+    assert load_races("en")[0] is not ru[0]
+    classes = load_classes("ru")
+
+    invalidate_catalog("races")
+    assert load_races("ru")[0] is not ru[0]
+    assert load_classes("ru")[0] is classes[0]
+    assert proficiency_token_label("longsword", {}) == "Длинный меч"
+
+
 def test_grants_from_entity() -> None:
     raw = {"type": "ability_increase", "count": 2, "amount": 1, "choice": True}
     grants = grants_from_entity({"grants": [raw]})
@@ -55,6 +73,36 @@ def test_variant_human_grants_no_inherit() -> None:
     assert types.count("language") == 1
 
 
+def test_compiled_catalog_models_are_frozen_and_normalized() -> None:
+    """Подраса скомпилирована с наследованием; модели frozen и slotted."""
+    from dataclasses import FrozenInstanceError
+
+    from core.catalog_loader import invalidate_catalog
+    from core.classes import get_class_def
+    from core.feats_loader import get_feat_def
+    from core.races import get_race_def
+
+    human = get_race_def("human")
+    assert human is not None
+    variant = human.variant("variant_human")
+    assert variant is human.subraces["variant_human"]
+    assert dict(variant.ability_bonuses) == get_race_bonuses(
+        "human", "variant_human"
+    )
+    assert human.variant(None) is human.subraces["standard"]
+    fighter = get_class_def("fighter")
+    assert fighter is not None and fighter.hit_dice == 10
+    assert "champion" in fighter.subclasses
+    tough = get_feat_def("tough")
+    assert tough is not None and tough.hp_bonus_sources
+    assert not hasattr(human, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        human.id = "elf"  # type: ignore[misc]
+
+    invalidate_catalog("races")
+    assert get_race_def("human") is not human
+
+
 def test_inherit_flags_from_inherit_block() -> None:
     assert inherit_flags(
         {"inherit": {"ability_bonuses": False, "grants": False}}
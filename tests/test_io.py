@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from core.io import CatalogLoadError, load_json, load_yaml
+from core.io import CatalogLoadError, load_json, load_yaml, save_json
 
 
 def test_load_yaml_and_json_happy_path(tmp_path: Path) -> None:
@@ -30,3 +30,23 @@ def test_load_yaml_strict_raises_on_corrupt_file(tmp_path: Path) -> None:
     path.write_text(":\n  bad: [unclosed", encoding="utf-8")
     with pytest.raises(CatalogLoadError):
         load_yaml(path, strict=True)
+
+
+def test_save_json_is_atomic(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Сбой посреди записи оставляет прежний файл целым."""
+    import json
+
+    path = tmp_path / "hero.json"
+    save_json(path, {"name": "Hero"}, durable=True)
+
+    def broken_dump(data: object, f: object, **kwargs: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", broken_dump)
+    with pytest.raises(OSError):
+        save_json(path, {"name": "Other"})
+    monkeypatch.undo()
+    assert load_json(path) == {"name": "Hero"}
+    assert [p.name for p in tmp_path.iterdir()] == ["hero.json"]
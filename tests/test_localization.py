@@ -1,8 +1,17 @@
 """Тесты загрузки и получения строк локализации."""
 
+from pathlib import Path
 from typing import Any
 
-from core.localization import get_string, load_strings, resolve_localized_text
+import pytest
+
+from core.io import load_yaml
+from core.localization import (
+    STRINGS_DIR,
+    get_string,
+    load_strings,
+    resolve_localized_text,
+)
 
 
 def _flatten_keys(data: dict[str, Any], prefix: str = "") -> set[str]:
@@ -17,8 +26,9 @@ def _flatten_keys(data: dict[str, Any], prefix: str = "") -> set[str]:
 
 
 def test_en_ru_yaml_keys_match() -> None:
-    assert _flatten_keys(load_strings("ru")) == _flatten_keys(
-        load_strings("en")
+    # Сырые файлы: load_strings дополняет ru недостающими ключами en
+    assert _flatten_keys(load_yaml(STRINGS_DIR / "ru.yaml")) == _flatten_keys(
+        load_yaml(STRINGS_DIR / "en.yaml")
     )
 
 
@@ -39,3 +49,36 @@ def test_get_string_and_resolve_localized_text() -> None:
     )
     value = {"ru": "Человек", "en": "Human"}
     assert resolve_localized_text(value, "en") == "Human"
+
+
+@pytest.mark.usefixtures("catalog_caches_cleared")
+def test_load_strings_merges_en_fallback_at_every_depth(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Недостающий вложенный ключ ru не отбрасывает поддерево en."""
+    (tmp_path / "en.yaml").write_text(
+        "menu:\n  title: Menu\n  sub:\n    a: A\n    b: B {n}\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "ru.yaml").write_text(
+        "menu:\n  sub:\n    a: А\n", encoding="utf-8"
+    )
+    monkeypatch.setattr("core.localization.STRINGS_DIR", tmp_path)
+
+    strings = load_strings("ru")
+    assert get_string(strings, "menu.title") == "Menu"
+    assert get_string(strings, "menu.sub.a") == "А"
+    assert get_string(strings, "menu.sub.b", n=2) == "B 2"
+    assert get_string(strings, "menu.sub.b", x=1) == "B {n}"
+    assert strings["menu"]["sub"] == {"a": "А", "b": "B {n}"}
+
+
+def test_string_table_lookup_matches_nested_walk() -> None:
+    """Плоская таблица отдаёт то же, что спуск по обычному словарю."""
+    strings = load_strings("ru")
+    tree = dict(strings)
+    for key in _flatten_keys(tree):
+        assert get_string(strings, key) == get_string(tree, key)
+        assert get_string(strings, key, value=1, name="x") == get_string(
+            tree, key, value=1, name="x"
+        )
@@ -2,19 +2,44 @@
 
 import pytest
 
-from core.character_storage import LoadCharactersResult
+from core.character_index import CharacterSummary
+from core.character_store import CharacterPage
 from core.models import Character
 from ui.menus import _deps, characters_menu
 
 
-def _patch_load_characters(
-    monkeypatch: pytest.MonkeyPatch, characters: list[Character]
+def _patch_characters(
+    monkeypatch: pytest.MonkeyPatch,
+    characters: list[Character],
+    loaded: list[str] | None = None,
 ) -> None:
-    monkeypatch.setattr(
-        _deps,
-        "load_characters",
-        lambda: LoadCharactersResult(characters=tuple(characters)),
-    )
+    summaries = [
+        CharacterSummary(
+            save_slug=character.save_slug or "",
+            name=character.name,
+            class_id=character.class_id,
+            level=character.level,
+            created_at="",
+            mtime_ns=0,
+            size=0,
+        )
+        for character in characters
+    ]
+
+    def fake_page(offset: int, limit: int) -> CharacterPage:
+        return CharacterPage(
+            summaries=tuple(summaries[offset : offset + limit]),
+            total=len(summaries),
+            offset=offset,
+        )
+
+    def fake_load(slug: str) -> Character | None:
+        if loaded is not None:
+            loaded.append(slug)
+        return next((c for c in characters if c.save_slug == slug), None)
+
+    monkeypatch.setattr(_deps, "list_character_page", fake_page)
+    monkeypatch.setattr(_deps, "load_character", fake_load)
 
 
 def test_characters_menu_shows_hub_options(
@@ -26,7 +51,7 @@ def test_characters_menu_shows_hub_options(
         class_id="fighter",
         save_slug="hero",
     )
-    _patch_load_characters(monkeypatch, [character])
+    _patch_characters(monkeypatch, [character])
     patch_int_input(monkeypatch, [0])
     characters_menu.show_characters_menu(ru_strings)
     output = capsys.readouterr().out
@@ -50,7 +75,7 @@ def test_characters_menu_delete_one_confirmed(
         deleted.append(slug)
         return True
 
-    _patch_load_characters(monkeypatch, [character])
+    _patch_characters(monkeypatch, [character])
     monkeypatch.setattr(_deps, "delete_character", fake_delete)
     from ui.menus import _common
 
@@ -58,3 +83,28 @@ def test_characters_menu_delete_one_confirmed(
     patch_int_input(monkeypatch, [2, 1, 1, 0])
     characters_menu.show_characters_menu(ru_strings)
     assert deleted == ["hero"]
+
+
+def test_characters_menu_pages_and_loads_only_selected(
+    monkeypatch, capsys, ru_strings, patch_int_input
+):
+    characters = [
+        Character(
+            name=f"Hero{idx}",
+            race="human",
+            class_id="fighter",
+            save_slug=f"hero_{idx}",
+        )
+        for idx in range(25)
+    ]
+    loaded: list[str] = []
+    _patch_characters(monkeypatch, characters, loaded)
+    monkeypatch.setattr(characters_menu, "_press_enter", lambda strings: None)
+    # Следующая → переход на 3-ю → открыть 2-го на странице → назад
+    patch_int_input(monkeypatch, [5, 7, 3, 4, 2, 0])
+    characters_menu.show_characters_menu(ru_strings)
+    output = capsys.readouterr().out
+    assert "Страница 2 из 3" in output
+    assert "Страница 3 из 3 · персонажей: 25" in output
+    assert "Hero9" in output and "Hero24" in output
+    assert loaded == ["hero_21"]
@@ -70,3 +70,25 @@ def test_input_handler_validation(
     assert (
         get_str_input("name: ", min_length=2, only_letters=True) == "Aragorn"
     )
+
+
+def test_settings_storage_toggle_transfers_characters(
+    monkeypatch: pytest.MonkeyPatch,
+    settings_file: Any,
+    characters_dir: Any,
+    ru_strings: dict[str, Any],
+    patch_int_input: Any,
+) -> None:
+    import core.character_storage as storage_mod
+
+    storage_mod.save_character(name="Hero", race_id="human", class_id="bard")
+    monkeypatch.setattr(settings_menu, "_press_enter", lambda strings: None)
+    patch_int_input(monkeypatch, [1, 2, 0])
+    settings = settings_menu.show_settings(ru_strings, {"language": "ru"})
+    assert settings["storage"] == "sqlite"
+    assert settings["durability"] == "fast"
+    assert storage_mod.character_store().slugs() == {"hero"}
+    settings_mod.save_settings(
+        settings["language"], settings["storage"], settings["durability"]
+    )
+    assert settings_mod.load_settings()["durability"] == "fast"
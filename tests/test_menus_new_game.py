@@ -1,6 +1,6 @@
 """Тесты UI меню — новая игра."""
 
-from core.character_storage import LoadCharactersResult
+from core.character_store import LoadCharactersResult
 from core.models import Adventure, Character
 from ui.menus import _creation_steps, _deps, new_game
 
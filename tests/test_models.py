@@ -6,7 +6,7 @@ import pytest
 
 import core.adventure as adventure_mod
 from core.backgrounds import get_background_skills, load_backgrounds
-from core.models import Adventure, Character
+from core.models import Adventure, Character, CompactCharacter, SharedIds
 from core.scenario_actions import apply_scenario_action, load_scenario
 from core.skills import PHB_SKILL_IDS
 
@@ -29,6 +29,99 @@ def test_character_round_trip_with_subrace() -> None:
     assert restored.save_slug == "test"
 
 
+def test_generated_serializers_match_coercion_path() -> None:
+    """Строгий путь: то же, что приведение; грязные данные — fallback."""
+    import json
+
+    from core.models import _CHARACTER_CODEC
+
+    full = Character(
+        name="Test",
+        race="elf",
+        class_id="wizard",
+        level=4,
+        stats={"intelligence": 16},
+        current_hp=20,
+        max_hp=22,
+        difficulty="hardcore",
+        subrace="high_elf",
+        languages=["common", "elvish"],
+        skills=["arcana"],
+        feat_ids=["magic_initiate"],
+        feat_choices={"magic_initiate": {"spells": ["light"]}},
+        asi_choices={"4": "intelligence"},
+        class_features_applied=True,
+        save_slug="test",
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+    minimal = Character(name="Min", race="human", class_id="fighter")
+    for original in (full, minimal):
+        data = json.loads(json.dumps(original.to_dict()))
+        fast = _CHARACTER_CODEC.from_clean_dict(data)
+        assert fast == original == Character.coerce_dict(data)
+        assert fast is not None and fast.languages is not data.get("languages")
+        assert Character.from_dict(data).to_dict() == data
+    assert "subrace" not in minimal.to_dict()
+    assert minimal.to_dict()["stats"] == {}
+
+    # Старые и ручные сейвы: строгий путь отказывается, приведение чинит
+    for dirty, expected in (
+        ({"level": "3"}, 3),
+        ({"level": 99}, 10),
+        ({"level": 2.0}, 2),
+        ({"level": True}, 1),
+    ):
+        data = {**minimal.to_dict(), **dirty}
+        assert _CHARACTER_CODEC.from_clean_dict(data) is None
+        assert Character.from_dict(data).level == expected
+    legacy = {"name": "Old", "race": "human", "current_hp": 9}
+    assert _CHARACTER_CODEC.from_clean_dict(legacy) is None
+    assert Character.from_dict(legacy).max_hp == 9
+    assert Character.from_dict(
+        {**minimal.to_dict(), "skills": ["a", 1]}
+    ).skills == ["a", "1"]
+
+
+def test_compact_character_round_trip_and_shared_ids() -> None:
+    """Компактный персонаж: тот же to_dict, общие кортежи id, frozen."""
+    import json
+    from dataclasses import FrozenInstanceError
+
+    data = Character(
+        name="Test",
+        race="elf",
+        class_id="wizard",
+        stats={"intelligence": 15},
+        languages=["common", "elvish"],
+        skills=["arcana"],
+        feat_ids=["magic_initiate"],
+        feat_choices={"magic_initiate": {"spells": ["light"]}},
+        asi_choices={"4": "intelligence"},
+        save_slug="test",
+    ).to_dict()
+    # Два разбора JSON — разные объекты строк, как при загрузке сейвов
+    shared: SharedIds = {}
+    first = CompactCharacter.from_dict(json.loads(json.dumps(data)), shared)
+    second = CompactCharacter.from_dict(json.loads(json.dumps(data)), shared)
+    assert first.to_dict() == data
+    assert first.languages is second.languages
+    assert first.stats == second.stats
+    # Общих кортежей нет вне пачки: таблица не глобальная
+    alone = CompactCharacter.from_dict(json.loads(json.dumps(data)))
+    assert alone.languages == first.languages
+    assert alone.languages is not first.languages
+    assert set(shared) == {
+        ("common", "elvish"),
+        ("arcana",),
+        ("magic_initiate",),
+        (),
+    }
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        first.level = 2  # type: ignore[misc]
+    assert first.to_character() == Character.from_dict(data)
+
+
 def test_character_and_adventure_from_dict() -> None:
     character = Character.from_dict(
         {"name": "X", "race": "human", "class_id": "wizard"}
@@ -9,7 +9,10 @@ import pytest
 from core.levels import MAX_CHARACTER_LEVEL, clamp_level
 from core.models import Adventure, Character
 from core.progression import (
+    HpGainBreakdown,
     apply_experience,
+    extra_hp_bonus_sources,
+    extra_hp_per_level,
     grant_experience,
     hp_gain_breakdown_for_level_up,
     hp_gain_for_level,
@@ -17,6 +20,7 @@ from core.progression import (
     max_hp_for_level,
     resolve_pending_level_ups,
 )
+from core.types import GameDifficulty
 from ui.menus import level_up as level_up_menu
 from ui.menus.scenario_flow import run_scenario
 
@@ -52,6 +56,113 @@ def test_max_hp_for_level_with_bonuses() -> None:
     assert tough_hp == 34
 
 
+@pytest.mark.parametrize("difficulty", ["easy", "normal"])
+def test_hp_table_matches_per_level_sum(difficulty: GameDifficulty) -> None:
+    """Свойство: таблица = сумма hp_gain_for_level на всей сетке ключей."""
+    from core.hp_tables import fixed_max_hp, hp_table
+
+    for hit_dice in (6, 8, 10, 12):
+        for con_mod in range(-5, 11):
+            for bonus in range(4):
+                total = 0
+                for level in range(1, MAX_CHARACTER_LEVEL + 1):
+                    total += hp_gain_for_level(
+                        level, hit_dice, con_mod, difficulty, bonus
+                    )
+                    assert (
+                        fixed_max_hp(
+                            level, hit_dice, con_mod, difficulty, bonus
+                        )
+                        == total
+                    )
+    with pytest.raises(ValueError):
+        hp_table(8, 0, "hardcore", 0)
+
+
+def test_hardcore_hp_from_roll_history_matches_rerolls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Свойство: HP по истории бросков = прежний подсчёт с теми же бросками."""
+    import random
+
+    from core.hp_tables import rolled_max_hp
+
+    def uncached_bonus(
+        race: str, subrace: str | None, feat_ids: list[str]
+    ) -> int:
+        sources = extra_hp_bonus_sources(race, subrace, feat_ids)
+        return sum(source.amount for source in sources)
+
+    rng = random.Random(2026)
+    for _ in range(300):
+        class_id = rng.choice(["wizard", "rogue", "fighter", "barbarian"])
+        con = rng.randint(3, 20)
+        level = rng.randint(1, MAX_CHARACTER_LEVEL)
+        feat_ids = rng.choice([[], ["tough"]])
+        race, subrace = rng.choice([("human", None), ("dwarf", "hill_dwarf")])
+        hit_dice = {"wizard": 6, "rogue": 8, "fighter": 10, "barbarian": 12}
+        rolls = [rng.randint(1, hit_dice[class_id]) for _ in range(level)]
+        replay = iter(rolls)
+
+        def replay_roll(
+            count: int, sides: int, modifier: int = 0, *, dice: Any = replay
+        ) -> int:
+            value: int = next(dice) + modifier
+            return value
+
+        monkeypatch.setattr("core.progression.roll", replay_roll)
+        con_mod = (con - 10) // 2
+        bonus = uncached_bonus(race, subrace, feat_ids)
+        expected = sum(
+            hp_gain_for_level(
+                lvl, hit_dice[class_id], con_mod, "hardcore", bonus
+            )
+            for lvl in range(1, level + 1)
+        )
+        assert (
+            max_hp_for_level(
+                class_id,
+                {"constitution": con},
+                level,
+                "hardcore",
+                race,
+                subrace,
+                feat_ids,
+                hp_rolls=rolls,
+            )
+            == expected
+        )
+        assert extra_hp_per_level(race, subrace, feat_ids) == bonus
+        assert rolled_max_hp(rolls, con_mod, bonus) == expected
+
+
+def test_level_ups_extend_complete_roll_history(
+    monkeypatch: pytest.MonkeyPatch, fighter_l1_hardcore: Character
+) -> None:
+    """Повышения HardCore дописывают броски; неполная история не растёт."""
+    from itertools import count
+
+    from core.hp_tables import rolled_max_hp
+    from core.progression_batch import award_experience
+
+    def patch_rolls() -> None:
+        rolls = count(3)
+        monkeypatch.setattr(
+            "core.progression.roll",
+            lambda n, sides, modifier=0: next(rolls) % sides + 1 + modifier,
+        )
+
+    tracked = replace(fighter_l1_hardcore, hp_rolls=[5])
+    patch_rolls()
+    stepped = apply_experience(tracked, 6_500)
+    patch_rolls()
+    (batched,) = award_experience([(tracked, 6_500)], save=False)
+    assert stepped == batched
+    assert stepped.hp_rolls == [5, 4, 5, 6, 7]
+    assert stepped.max_hp == rolled_max_hp(stepped.hp_rolls, 2, 0)
+    assert apply_experience(fighter_l1_hardcore, 6_500).hp_rolls == []
+
+
 def test_hp_gain_hardcore_floors_class_part_to_one(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -114,6 +225,50 @@ def test_resolve_pending_level_ups_records_asi_and_feat(
     assert updated.feat_ids == ["tough"]
 
 
+def test_award_experience_matches_apply_experience(
+    monkeypatch: pytest.MonkeyPatch,
+    fighter_l3: Character,
+    fighter_l1_hardcore: Character,
+) -> None:
+    """Пакет: тот же результат, что apply_experience по одному."""
+    from itertools import count
+
+    from core.progression_batch import award_experience
+
+    def patch_rolls() -> None:
+        rolls = count()
+        monkeypatch.setattr(
+            "core.progression.roll",
+            lambda n, sides, modifier=0: 1 + next(rolls) % sides + modifier,
+        )
+
+    dwarf = Character(
+        name="Dwarf",
+        race="dwarf",
+        subrace="hill_dwarf",
+        class_id="cleric",
+        stats={"constitution": 17, "wisdom": 15},
+        current_hp=11,
+        max_hp=11,
+        asi_choices={"8": "feat:tough"},
+    )
+    awards = [
+        (fighter_l3, 70_000),
+        (fighter_l1_hardcore, 20_000),
+        (dwarf, 50_000),
+        (fighter_l3, 0),
+        (dwarf, 250),
+        (dwarf, 0),
+    ]
+    patch_rolls()
+    expected = [apply_experience(char, xp) for char, xp in awards]
+    patch_rolls()
+    batched = award_experience(awards, save=False)
+    assert batched == expected
+    assert [c.level for c in batched] == [10, 6, 9, 4, 1, 1]
+    assert batched[5] is dwarf
+
+
 def test_run_pending_level_ups_preview_matches_applied_hp(
     monkeypatch: pytest.MonkeyPatch,
     patch_level_up_ui: None,
@@ -140,6 +295,17 @@ def test_run_pending_level_ups_preview_matches_applied_hp(
     assert preview_gain == [result.max_hp - char.max_hp]
 
 
+def test_hardcore_level_up_shows_hit_die_odds(
+    ru_strings: dict[str, Any],
+) -> None:
+    """HardCore: под броском — среднее кости и шанс выбросить не меньше."""
+    breakdown = HpGainBreakdown(
+        die_part=7, con_mod=1, dice_roll=7, hit_dice=10
+    )
+    lines = level_up_menu._format_hp_gain_lines(ru_strings, breakdown)
+    assert "d10" in lines[1] and "5.5" in lines[1] and "40%" in lines[1]
+
+
 def test_run_scenario_grant_xp_levels_character(
     monkeypatch: pytest.MonkeyPatch,
     ru_strings: dict[str, Any],
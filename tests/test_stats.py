@@ -1,11 +1,22 @@
 """Тесты кубиков, констант PHB, point-buy и сложности приключений."""
 
 import random
+from collections import Counter
+from fractions import Fraction
+from itertools import product
 
 import pytest
 
 from core import dice
 from core.constants import difficulty_class, proficiency_bonus
+from core.dice_distribution import dice_distribution
+from core.dice_expr import (
+    DiceExpressionError,
+    DiceGroup,
+    compile_dice,
+    roll_dice,
+    roll_many,
+)
 from core.difficulty import (
     adventure_allows_difficulty,
     adventure_requires_hardcore,
@@ -35,6 +46,256 @@ def test_difficulty_class_and_dice(monkeypatch: pytest.MonkeyPatch) -> None:
     assert dice.roll(count=2, sides=6, modifier=2) == 10
 
 
+def test_roll_ability_score_seeded_sequence_is_stable() -> None:
+    """4d6 drop lowest — четыре randint: при seed значения прежние."""
+    random.seed(2024)
+    assert [dice.roll_ability_score() for _ in range(6)] == [
+        15,
+        13,
+        14,
+        16,
+        16,
+        14,
+    ]
+
+
+@pytest.mark.parametrize(
+    "expression,groups,modifier,damage_type",
+    [
+        ("2d6+3", [DiceGroup(2, 6)], 3, None),
+        ("1d20 adv", [DiceGroup(2, 20, keep=1)], 0, None),
+        (
+            "1d20+5 dis",
+            [DiceGroup(2, 20, keep=1, keep_highest=False)],
+            5,
+            None,
+        ),
+        ("4d6kh3", [DiceGroup(4, 6, keep=3)], 0, None),
+        ("4d6dl1", [DiceGroup(4, 6, keep=3)], 0, None),
+        ("8d6 fire", [DiceGroup(8, 6)], 0, "fire"),
+        ("2d6r2 Slashing", [DiceGroup(2, 6, reroll_at_most=2)], 0, "slashing"),
+        ("3d8 - 1d4 + 2", [DiceGroup(3, 8), DiceGroup(1, 4, -1)], 2, None),
+        ("d%!", [DiceGroup(1, 100, explode=True)], 0, None),
+    ],
+)
+def test_compile_dice_expressions(
+    expression: str,
+    groups: list[DiceGroup],
+    modifier: int,
+    damage_type: str | None,
+) -> None:
+    plan = compile_dice(expression)
+    assert list(plan.groups) == groups
+    assert plan.modifier == modifier
+    assert plan.damage_type == damage_type
+    assert compile_dice(expression) is plan
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["", "2d6+", "0d6", "4d6kh5", "4d6dl4", "1d1!", "1d6r6", "2d20 adv"],
+)
+def test_compile_dice_rejects_bad_expressions(expression: str) -> None:
+    with pytest.raises(DiceExpressionError):
+        compile_dice(expression)
+
+
+def test_roll_dice_bounds_and_keep_semantics() -> None:
+    """Свойство: границы сумм и keep по тем же граням, что и choices."""
+    rng = random.Random(5)
+    for _ in range(500):
+        assert 5 <= roll_dice("2d6+3", rng) <= 15
+        assert 3 <= roll_dice("4d6kh3", rng) <= 18
+        assert 2 <= roll_dice("2d6r2", rng) <= 12
+        assert roll_dice("1d4!", rng) % 4 != 0
+    for seed in range(200):
+        faces = random.Random(seed).choices(range(1, 21), k=2)
+        assert roll_dice("1d20 adv", random.Random(seed)) == max(faces)
+        assert roll_dice("1d20 dis", random.Random(seed)) == min(faces)
+    totals = roll_many("3d6+1", 2000, random.Random(9))
+    assert min(totals) >= 4 and max(totals) <= 19
+    assert 10.5 < sum(totals) / len(totals) < 11.5
+    # Серия тянет те же грани, что и броски по одному
+    single = random.Random(1)
+    expected = [roll_dice("4d6kh3", single) for _ in range(3)]
+    assert roll_many("4d6dl1", 3, random.Random(1)) == expected
+
+
+def test_roll_dice_without_rng_uses_random_module(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Без rng — функции модуля random: seed и подмена действуют."""
+    random.seed(3)
+    first = roll_many("4d6kh3", 5)
+    random.seed(3)
+    assert roll_many("4d6kh3", 5) == first
+    monkeypatch.setattr(random, "choices", lambda faces, k: [faces[-1]] * k)
+    monkeypatch.setattr(random, "randrange", lambda stop: 0)
+    assert roll_dice("2d6+1") == 13
+    # Максимум d4 взрывается: доп. кость randrange(4) + 1 = 1
+    assert roll_dice("1d4!") == 5
+
+
+def _enumerated(
+    sides: int, count: int, keep: int, highest: bool
+) -> Counter[int]:
+    """Полный перебор keep лучших/худших из count костей."""
+    outcomes: Counter[int] = Counter()
+    for faces in product(range(1, sides + 1), repeat=count):
+        kept = sorted(faces, reverse=highest)[:keep]
+        outcomes[sum(kept)] += 1
+    return outcomes
+
+
+@pytest.mark.parametrize(
+    "expression,sides,count,keep,highest",
+    [
+        ("4d6kh3", 6, 4, 3, True),
+        ("4d6dl1", 6, 4, 3, True),
+        ("1d20 adv", 20, 2, 1, True),
+        ("1d20 dis", 20, 2, 1, False),
+        ("5d4kl2", 4, 5, 2, False),
+        ("3d8", 8, 3, 3, True),
+    ],
+)
+def test_dice_distribution_matches_enumeration(
+    expression: str, sides: int, count: int, keep: int, highest: bool
+) -> None:
+    dist = dice_distribution(expression)
+    outcomes = _enumerated(sides, count, keep, highest)
+    total = sides**count
+    assert dist.table() == [
+        (value, Fraction(weight, total))
+        for value, weight in sorted(outcomes.items())
+    ]
+    assert dice_distribution(expression) is dist
+
+
+def test_dice_distribution_statistics() -> None:
+    two_d6 = dice_distribution("2d6")
+    assert two_d6.mean == 7
+    assert two_d6.variance == Fraction(35, 6)
+    assert two_d6.percentile(0.5) == 7
+    assert two_d6.percentile(0) == 2 and two_d6.percentile(1) == 12
+    assert two_d6.at_least(12) == Fraction(1, 36)
+    assert dice_distribution("4d6kh3").mean == Fraction(15869, 1296)
+    # Переброс 1–2 один раз: P(1) = (2/6)·(1/6)
+    gwf = dice_distribution("1d6r2")
+    assert gwf.probability(1) == Fraction(1, 18)
+    assert gwf.probability(6) == Fraction(1, 6) + Fraction(1, 18)
+    # Взрыв d4: 4 не выпадает, 5 = 4 + 1
+    boom = dice_distribution("1d4!+1d4-1d4")
+    assert sum(probability for _, probability in boom.table()) == 1
+    assert dice_distribution("1d4!").probability(4) == 0
+    assert dice_distribution("1d4!").probability(5) == Fraction(1, 16)
+    assert dice_distribution("3d8-1d4+2").minimum == 1
+    with pytest.raises(ValueError):
+        two_d6.percentile(1.5)
+
+
+def test_exploding_distributions_are_fast_or_rejected() -> None:
+    """Взрыв с keep считается за доли секунды; неподъёмное — ошибка."""
+    import time
+
+    start = time.perf_counter()
+    kept = dice_distribution("4d6!kh3")
+    boom = dice_distribution("8d6!")
+    assert time.perf_counter() - start < 2
+    assert sum(probability for _, probability in kept.table()) == 1
+    # Взрыв без обрыва: E[d6!] = 3.5 · 6/5
+    assert abs(float(boom.mean) - 8 * 4.2) < 1e-9
+    assert kept.probability(7) > 0 and kept.at_least(19) > 0
+    for expression in ("20d20!kh10", "1000d20"):
+        with pytest.raises(DiceExpressionError):
+            dice_distribution(expression)
+
+
+def test_weapon_damage_dice_compile() -> None:
+    from core.equipment import all_weapon_ids, get_weapon_def
+
+    for weapon_id in all_weapon_ids():
+        weapon = get_weapon_def(weapon_id)
+        assert weapon is not None
+        if weapon.damage_dice:
+            plan = compile_dice(f"{weapon.damage_dice} {weapon.damage_type}")
+            assert plan.damage_type == weapon.damage_type
+
+
+def test_stat_simulation_matches_exact_distribution() -> None:
+    """Выборка сходится к точному 4d6dl1; бонусы расы — сдвиг гистограмм."""
+    from core.stat_simulator import simulate_stats
+
+    races = [("human", "variant_human"), ("dwarf", "hill_dwarf")]
+    plain, dwarf = simulate_stats(60_000, races, seed=3, backend="python")
+    score = dice_distribution("4d6dl1")
+    assert sum(plain.totals.values()) == plain.samples == 60_000
+    assert abs(plain.mean_total - 6 * float(score.mean)) < 0.1
+    for modifier in range(-3, 5):
+        exact = sum(
+            probability
+            for value, probability in score.table()
+            if dice.ability_modifier(value) == modifier
+        )
+        assert abs(plain.modifier_share("strength", modifier) - exact) < 0.01
+    # Холмовой дварф: +2 CON, +1 WIS — те же броски, сдвинутые на 3
+    assert dwarf.totals == {
+        total + 3: count for total, count in plain.totals.items()
+    }
+    assert dwarf.modifier_share("constitution", 5) > 0
+    assert plain.modifier_share("constitution", 5) == 0
+    again = simulate_stats(60_000, races[:1], seed=3, backend="python")
+    assert again[0] == plain
+    with pytest.raises(ValueError):
+        simulate_stats(0, races)
+
+
+def test_stat_simulation_numpy_matches_exact_distribution() -> None:
+    """Путь NumPy: значения и модификаторы сходятся к точному 4d6dl1."""
+    pytest.importorskip("numpy")
+    from core.stat_simulator import _counts_numpy, simulate_stats
+
+    samples = 60_000
+    totals, per_stat = _counts_numpy(samples, seed=3)
+    score = dice_distribution("4d6dl1")
+    assert sum(totals.values()) == samples
+    for counts in per_stat:
+        assert sum(counts.values()) == samples
+        for value, probability in score.table():
+            assert abs(counts[value] / samples - probability) < 0.01
+    mean_total = sum(total * n for total, n in totals.items()) / samples
+    assert abs(mean_total - 6 * float(score.mean)) < 0.1
+
+    races = [("human", "variant_human"), ("dwarf", "hill_dwarf")]
+    plain, dwarf = simulate_stats(samples, races, seed=3, backend="numpy")
+    for modifier in range(-3, 5):
+        exact = sum(
+            probability
+            for value, probability in score.table()
+            if dice.ability_modifier(value) == modifier
+        )
+        assert abs(plain.modifier_share("strength", modifier) - exact) < 0.01
+    assert dwarf.totals == {
+        total + 3: count for total, count in plain.totals.items()
+    }
+    again = simulate_stats(samples, races[:1], seed=3, backend="numpy")
+    assert again[0] == plain
+
+
+def test_stat_simulation_across_processes() -> None:
+    from core.stat_simulator import numpy_available, simulate_stats
+
+    (result,) = simulate_stats(
+        20_001, [("elf", "high_elf")], seed=1, processes=2, backend="python"
+    )
+    assert sum(result.totals.values()) == 20_001
+    assert all(
+        sum(counts.values()) == 20_001 for counts in result.modifiers.values()
+    )
+    if not numpy_available():
+        with pytest.raises(ModuleNotFoundError):
+            simulate_stats(10, [("elf", None)], backend="numpy")
+
+
 def test_point_buy_validation() -> None:
     full = [15, 14, 13, 12, 10, 8]
     assert validate_point_buy_finish(full) is None
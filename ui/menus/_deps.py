@@ -28,9 +28,11 @@ from core.character import (
     get_language_name,
     get_race_bonuses,
     has_choice_ability_bonuses,
+    list_character_page,
     load_adventures,
     load_background_full,
     load_backgrounds,
+    load_character,
     load_characters,
     load_class_full,
     load_classes,
@@ -42,6 +44,9 @@ from core.character import (
     point_buy_points_remaining,
     roll_ability_score,
     save_character,
+    set_durability_mode,
+    set_storage_backend,
+    transfer_characters,
     update_character,
     validate_final_stats,
     validate_point_buy_finish,
@@ -76,6 +81,8 @@ __all__ = [
     "load_adventures",
     "load_background_full",
     "load_backgrounds",
+    "list_character_page",
+    "load_character",
     "load_characters",
     "LoadCharactersResult",
     "load_class_full",
@@ -88,6 +95,9 @@ __all__ = [
     "point_buy_points_remaining",
     "roll_ability_score",
     "save_character",
+    "set_durability_mode",
+    "set_storage_backend",
+    "transfer_characters",
     "update_character",
     "validate_final_stats",
     "validate_point_buy_finish",
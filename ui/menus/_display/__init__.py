@@ -6,7 +6,9 @@ from ui.menus._display._character import (
     _empty_field_value,
     _format_proficiency_token_list,
     _print_character_card,
+    _print_character_page,
     _print_character_proficiencies,
+    _print_character_summary_row,
     _print_characters_list,
     _print_labeled_field,
 )
@@ -55,7 +57,9 @@ __all__ = [
     "_grant_description",
     "_grant_display_name",
     "_print_character_card",
+    "_print_character_page",
     "_print_character_proficiencies",
+    "_print_character_summary_row",
     "_print_characters_list",
     "_print_class_description",
     "_print_class_features",
@@ -2,6 +2,7 @@
 
 from colorama import Fore, Style
 
+from core.character_index import CharacterSummary
 from core.classes import get_subclass_choice_level
 from core.equipment import proficiency_token_label
 from core.localization import get_string
@@ -15,6 +16,7 @@ from ui.menus._display._class import (
     _character_subclass_label,
 )
 from ui.menus._display._difficulty import _difficulty_color, _difficulty_label
+from ui.menus._display._labels import _label_from_catalog
 from ui.menus._display._stats import _format_character_stats_compact
 from ui.menus.expertise import format_expertise_display
 
@@ -302,3 +304,54 @@ def _print_characters_list(
     print()
     for idx, char in enumerate(characters, 1):
         _print_character_card(idx, char, strings, language)
+
+
+def _print_character_summary_row(
+    idx: int,
+    summary: CharacterSummary,
+    strings: StringsDict,
+    language: str = "ru",
+) -> None:
+    """Строка списка по сводке: имя, класс, уровень (без загрузки)."""
+    class_label = _label_from_catalog(
+        _deps.load_classes(language),
+        summary.class_id,
+        default=summary.class_id,
+    )
+    level = get_string(
+        strings, "characters_menu.row_level", level=summary.level
+    )
+    print(
+        f"  {Fore.YELLOW}{idx}{Style.RESET_ALL}."
+        f" {Fore.CYAN}{Style.BRIGHT}{summary.name}{Style.RESET_ALL}"
+        f" — {class_label}, {level}"
+    )
+
+
+def _print_character_page(
+    strings: StringsDict,
+    summaries: tuple[CharacterSummary, ...],
+    language: str,
+    *,
+    page: int,
+    pages: int,
+    total: int,
+) -> None:
+    """Вывести страницу списка персонажей и её номер."""
+    print(
+        f"  {Fore.YELLOW}{Style.BRIGHT}"
+        f"{get_string(strings, 'choose_character.list_header')}"
+        f"{Style.RESET_ALL}"
+    )
+    print()
+    for idx, summary in enumerate(summaries, 1):
+        _print_character_summary_row(idx, summary, strings, language)
+    print()
+    status = get_string(
+        strings,
+        "characters_menu.page_status",
+        page=page,
+        pages=pages,
+        total=total,
+    )
+    print(f"  {Fore.LIGHTBLACK_EX}{status}{Style.RESET_ALL}")
@@ -1,5 +1,6 @@
 """Общие хелперы подписей из каталогов."""
 
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from core.localization import get_string
@@ -57,7 +58,7 @@ def _grant_pool_label(
 
 
 def _label_from_catalog(
-    catalog: list[dict[str, Any]],
+    catalog: Iterable[Mapping[str, Any]],
     entity_id: str,
     *,
     default: str | None = None,
@@ -1,30 +1,50 @@
-"""Меню «Персонажи»: список, создание и удаление."""
+"""Меню «Персонажи»: постраничный список, просмотр, создание и удаление.
+
+Список строится по сводкам одной страницы (``list_character_page``):
+имя, класс, уровень. Полный ``Character`` загружается только для
+открытого персонажа.
+"""
 
 from colorama import Fore, Style
 
+from core.character_index import CharacterSummary
+from core.character_store import CharacterPage
 from core.localization import get_string
-from core.models import Character
 from core.types import LanguageCode, StringsDict
 from ui.menus import _creation_steps, _deps
 from ui.menus._common import (
     _confirm_yes_no,
+    _press_enter,
     _print_cancelled,
     _print_screen_header,
     _print_success_and_wait,
     _run_numbered_menu,
 )
 from ui.menus._corrupt_saves import show_corrupt_save_warnings_if_any
-from ui.menus._display import _print_characters_list
+from ui.menus._display import (
+    _print_character_card,
+    _print_character_page,
+    _print_character_summary_row,
+)
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 50
+
+
+def _page_count(total: int, page_size: int) -> int:
+    """Число страниц списка (пустой список — одна страница)."""
+    return max(1, -(-total // page_size))
 
 
-def _select_character_to_delete(
+def _select_summary(
     strings: StringsDict,
-    characters: list[Character],
+    page: CharacterPage,
     language: LanguageCode,
-) -> Character | None:
-    """Выбор персонажа для удаления."""
+) -> CharacterSummary | None:
+    """Выбор персонажа на текущей странице."""
     _print_screen_header(get_string(strings, "characters_menu.caption"))
-    _print_characters_list(strings, characters, language)
+    for idx, summary in enumerate(page.summaries, 1):
+        _print_character_summary_row(idx, summary, strings, language)
     print()
     print(
         f"  {Fore.YELLOW}0{Style.RESET_ALL}."
@@ -35,42 +55,65 @@ def _select_character_to_delete(
         get_string(
             strings,
             "characters_menu.select_prompt",
-            count=len(characters),
+            count=len(page.summaries),
         ),
         0,
-        len(characters),
+        len(page.summaries),
         strings,
     )
     if choice == 0:
         return None
-    return characters[choice - 1]
+    return page.summaries[choice - 1]
+
+
+def _view_character(
+    strings: StringsDict,
+    page: CharacterPage,
+    language: LanguageCode,
+) -> None:
+    """Карточка выбранного персонажа: загружается только он."""
+    summary = _select_summary(strings, page, language)
+    if summary is None:
+        return
+
+    character = _deps.load_character(summary.save_slug)
+    if character is None:
+        show_corrupt_save_warnings_if_any(
+            strings, corrupt_labels=(summary.name,), already_shown=False
+        )
+        _press_enter(strings)
+        return
+
+    _print_screen_header(get_string(strings, "characters_menu.caption"))
+    _print_character_card(1, character, strings, language)
+    print()
+    _press_enter(strings)
 
 
 def _delete_one_character(
     strings: StringsDict,
-    characters: list[Character],
+    page: CharacterPage,
     language: LanguageCode,
 ) -> None:
     """Удалить одного персонажа с подтверждением."""
-    character = _select_character_to_delete(strings, characters, language)
-    if character is None:
+    summary = _select_summary(strings, page, language)
+    if summary is None:
         return
 
     if not _confirm_yes_no(
         strings,
         "characters_menu.confirm_delete_one",
-        name=character.name,
+        name=summary.name,
     ):
         _print_cancelled(strings)
         return
 
-    if character.save_slug:
-        _deps.delete_character(character.save_slug)
+    _deps.delete_character(summary.save_slug)
 
     msg = get_string(
         strings,
         "characters_menu.delete_success",
-        name=character.name,
+        name=summary.name,
     )
     _print_success_and_wait(strings, msg)
 
@@ -94,27 +137,56 @@ def _delete_all_characters(strings: StringsDict, count: int) -> None:
     _print_success_and_wait(strings, msg)
 
 
+def _hub_actions(
+    page_index: int, pages: int, has_characters: bool
+) -> list[str]:
+    """Пункты меню хаба; ключ пункта — ключ строки characters_menu.*."""
+    actions = ["create"]
+    if not has_characters:
+        return actions
+    actions += ["delete_one", "delete_all", "view"]
+    if page_index + 1 < pages:
+        actions.append("next_page")
+    if page_index > 0:
+        actions.append("prev_page")
+    if pages > 1:
+        actions.append("jump_page")
+    actions.append("page_size")
+    return actions
+
+
 def show_characters_menu(
     strings: StringsDict, language: LanguageCode = "ru"
 ) -> None:
-    """Меню управления персонажами: список, создание, удаление."""
-    load_result = None
+    """Меню управления персонажами: страницы списка, просмотр, удаление."""
+    page_index = 0
+    page_size = DEFAULT_PAGE_SIZE
     corrupt_warning_shown = False
     while True:
-        if load_result is None:
-            load_result = _deps.load_characters()
-            corrupt_warning_shown = show_corrupt_save_warnings_if_any(
-                strings,
-                corrupt_labels=load_result.corrupt_save_warnings,
-                already_shown=corrupt_warning_shown,
-            )
-        characters = list(load_result.characters)
-        has_characters = bool(characters)
+        page = _deps.list_character_page(page_index * page_size, page_size)
+        pages = _page_count(page.total, page_size)
+        if page_index >= pages:
+            # Последнюю страницу опустошило удаление
+            page_index = pages - 1
+            continue
+        corrupt_warning_shown = show_corrupt_save_warnings_if_any(
+            strings,
+            corrupt_labels=page.corrupt_save_warnings,
+            already_shown=corrupt_warning_shown,
+        )
+        has_characters = bool(page.summaries)
 
         _print_screen_header(get_string(strings, "characters_menu.caption"))
 
         if has_characters:
-            _print_characters_list(strings, characters, language)
+            _print_character_page(
+                strings,
+                page.summaries,
+                language,
+                page=page_index + 1,
+                pages=pages,
+                total=page.total,
+            )
         else:
             print(
                 f"  {Fore.LIGHTBLACK_EX}"
@@ -123,34 +195,57 @@ def show_characters_menu(
             )
 
         print()
-        options = [get_string(strings, "characters_menu.create")]
-        if has_characters:
-            options.append(get_string(strings, "characters_menu.delete_one"))
-            options.append(get_string(strings, "characters_menu.delete_all"))
-
+        actions = _hub_actions(page_index, pages, has_characters)
         choice = _run_numbered_menu(
             strings,
-            options,
+            [
+                get_string(
+                    strings, f"characters_menu.{action}", size=page_size
+                )
+                for action in actions
+            ],
             prompt_key="characters_menu.prompt",
             back_label_key="characters_menu.back",
         )
         if choice is None:
             return
 
-        option_create = 1
-        option_delete_one = 2 if has_characters else None
-        option_delete_all = 3 if has_characters else None
-
-        if choice == option_create:
-            _creation_steps.show_create_character_flow(strings, language)
-            load_result = None
-            continue
-
-        if has_characters and choice == option_delete_one:
-            _delete_one_character(strings, characters, language)
-            load_result = None
-            continue
-
-        if has_characters and choice == option_delete_all:
-            _delete_all_characters(strings, len(characters))
-            load_result = None
+        match actions[choice - 1]:
+            case "create":
+                _creation_steps.show_create_character_flow(strings, language)
+            case "delete_one":
+                _delete_one_character(strings, page, language)
+            case "delete_all":
+                _delete_all_characters(strings, page.total)
+            case "view":
+                _view_character(strings, page, language)
+            case "next_page":
+                page_index += 1
+            case "prev_page":
+                page_index -= 1
+            case "jump_page":
+                page_index = (
+                    _deps.get_int_input(
+                        get_string(
+                            strings, "characters_menu.page_prompt", count=pages
+                        ),
+                        1,
+                        pages,
+                        strings,
+                    )
+                    - 1
+                )
+            case "page_size":
+                first = page_index * page_size
+                page_size = _deps.get_int_input(
+                    get_string(
+                        strings,
+                        "characters_menu.page_size_prompt",
+                        count=MAX_PAGE_SIZE,
+                    ),
+                    1,
+                    MAX_PAGE_SIZE,
+                    strings,
+                )
+                # Первый персонаж страницы остаётся на экране
+                page_index = first // page_size
@@ -1,5 +1,6 @@
 """Форматирование и отображение требований черт."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from colorama import Fore, Style
@@ -21,7 +22,7 @@ from ui.menus._common import (
 
 
 def _split_feat_requirements(
-    feat: dict[str, Any],
+    feat: Mapping[str, Any],
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     """AND- и OR-группы требований из записи черты."""
     raw_reqs = feat.get("requirements", [])
@@ -109,7 +110,7 @@ def _requirement_line_color(met: bool, *, muted: bool) -> str:
 
 def _print_feat_requirements(
     strings: StringsDict,
-    feat: dict[str, Any],
+    feat: Mapping[str, Any],
     ctx: FeatRequirementContext,
     language: str,
     *,
@@ -157,7 +158,7 @@ def _print_feat_requirements(
 
 def _print_feat_details(
     strings: StringsDict,
-    feat: dict[str, Any],
+    feat: Mapping[str, Any],
     ctx: FeatRequirementContext,
     language: str,
     *,
@@ -176,7 +177,7 @@ def _print_feat_details(
 
 def _print_feat_full_description(
     strings: StringsDict,
-    feat: dict[str, Any],
+    feat: Mapping[str, Any],
     ctx: FeatRequirementContext,
     language: str,
 ) -> None:
@@ -207,7 +208,7 @@ def _print_feat_full_description(
 
 def _confirm_feat_selection(
     strings: StringsDict,
-    feat: dict[str, Any],
+    feat: Mapping[str, Any],
     ctx: FeatRequirementContext,
     language: str,
 ) -> bool:
@@ -1,5 +1,6 @@
 """Меню выбора черты из списков eligible/blocked/hidden."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from colorama import Fore, Style
@@ -17,9 +18,9 @@ from ui.menus.feats._requirements import (
 
 def _print_feat_selection_menu(
     strings: StringsDict,
-    eligible: list[dict[str, Any]],
-    blocked: list[dict[str, Any]],
-    hidden: list[dict[str, Any]],
+    eligible: list[Mapping[str, Any]],
+    blocked: list[Mapping[str, Any]],
+    hidden: list[Mapping[str, Any]],
     ctx: FeatRequirementContext,
     language: str,
 ) -> None:
@@ -75,12 +76,12 @@ def _print_feat_selection_menu(
 
 def _pick_feat_from_lists(
     strings: StringsDict,
-    eligible: list[dict[str, Any]],
-    blocked: list[dict[str, Any]],
-    hidden: list[dict[str, Any]],
+    eligible: list[Mapping[str, Any]],
+    blocked: list[Mapping[str, Any]],
+    hidden: list[Mapping[str, Any]],
     ctx: FeatRequirementContext,
     language: str,
-) -> dict[str, Any] | None:
+) -> Mapping[str, Any] | None:
     """Выбор черты из списков; None — назад или нет доступных."""
     if not eligible:
         return None
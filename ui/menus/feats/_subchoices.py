@@ -1,5 +1,6 @@
 """Подвыборы внутри черты при создании и левелапе."""
 
+from collections.abc import Mapping
 from typing import Any
 
 from core.equipment import (
@@ -26,7 +27,7 @@ from ui.menus.feats._constants import (
 
 def _pick_ability_for_feat(
     strings: StringsDict,
-    feat: dict[str, Any],
+    feat: Mapping[str, Any],
     stats: StatMap,
 ) -> str | None:
     """Выбор характеристики для черты с ability_bonuses_choice."""
@@ -9,6 +9,7 @@ from core.asi import (
     feat_id_from_asi_choice,
     pending_asi_at_level,
 )
+from core.dice_distribution import dice_distribution
 from core.feats import (
     apply_feat_grants_to_character,
     load_feat,
@@ -71,6 +72,18 @@ def _format_hp_gain_lines(
                 class_part=breakdown.class_part,
             )
         )
+        if breakdown.hit_dice:
+            odds = dice_distribution(f"1d{breakdown.hit_dice}")
+            lines.append(
+                get_string(
+                    strings,
+                    "level_up.hp_gain_roll_odds",
+                    sides=breakdown.hit_dice,
+                    mean=f"{float(odds.mean):g}",
+                    roll=breakdown.dice_roll,
+                    chance=round(100 * odds.at_least(breakdown.dice_roll)),
+                )
+            )
     elif breakdown.is_first_level:
         lines.append(
             get_string(
@@ -7,6 +7,7 @@ from core.types import (
     GameDifficulty,
     LanguageCode,
     RuntimeSettings,
+    StorageBackend,
     StringsDict,
 )
 from ui.menus import _deps
@@ -88,7 +89,8 @@ def show_languages_menu(
             break
 
         new_lang = lang_codes[choice - 1]
-        settings = {"language": new_lang}
+        settings = settings.copy()
+        settings["language"] = new_lang
         strings = _deps.load_strings(new_lang)
         msg = get_string(
             strings,
@@ -105,23 +107,58 @@ def show_languages_menu(
 def show_settings(
     strings: StringsDict, settings: RuntimeSettings
 ) -> RuntimeSettings:
-    """Экран настроек."""
+    """Экран настроек: хранилище персонажей и режим сохранения."""
     while True:
         _print_screen_header(get_string(strings, "settings.caption"))
-        print(
-            f"  {Fore.YELLOW}0{Style.RESET_ALL}."
-            f" {get_string(strings, 'settings.back')}"
-        )
-        print()
-
-        choice = _deps.get_int_input(
-            get_string(strings, "settings.prompt", count=0),
-            0,
-            0,
+        current = settings.get("storage", "json")
+        durability = settings.get("durability", "safe")
+        choice = _run_numbered_menu(
             strings,
+            [
+                get_string(
+                    strings,
+                    "settings.storage",
+                    name=get_string(strings, f"settings.storage_{current}"),
+                ),
+                get_string(
+                    strings,
+                    "settings.durability",
+                    name=get_string(
+                        strings, f"settings.durability_{durability}"
+                    ),
+                ),
+            ],
+            prompt_key="settings.prompt",
+            back_label_key="settings.back",
         )
-
-        if choice == 0:
+        if choice is None:
             break
+        if choice == 1:
+            settings = _switch_storage(strings, settings, current)
+        else:
+            settings = settings.copy()
+            settings["durability"] = "fast" if durability == "safe" else "safe"
+            _deps.set_durability_mode(settings["durability"])
 
     return settings
+
+
+def _switch_storage(
+    strings: StringsDict, settings: RuntimeSettings, current: StorageBackend
+) -> RuntimeSettings:
+    """Сменить хранилище и перенести в него персонажей из прежнего."""
+    target: StorageBackend = "sqlite" if current == "json" else "json"
+    count = _deps.transfer_characters(current, target)
+    _deps.set_storage_backend(target)
+    settings = settings.copy()
+    settings["storage"] = target
+    msg = get_string(
+        strings,
+        "settings.storage_changed",
+        name=get_string(strings, f"settings.storage_{target}"),
+        count=count,
+    )
+    print(f"{Fore.GREEN}{msg}{Style.RESET_ALL}")
+    print()
+    _press_enter(strings)
+    return settings